@@ -1,8 +1,24 @@
 """
 This module defines the BrowseTheWeb ability, which allows actors to interact with web pages using Playwright.
 """
+from dataclasses import dataclass
+from functools import reduce
+from typing import Optional, Sequence
+
 from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 
+
+@dataclass(frozen=True)
+class VisibleCandidate:
+    """
+    The candidate selector that `first_visible` picked, and its element.
+    """
+    # Position of the winning selector in the candidates list.
+    index: int
+    selector: str
+    locator: Locator
+
+
 class BrowseTheWeb:
     """
     An ability that allows an Actor to browse the web using a Playwright Page instance.
@@ -11,6 +27,14 @@ class BrowseTheWeb:
     def __init__(self, page: Page):
         # Keep the Playwright Page instance to drive UI interactions.
         self.page = page
+        # Email of the account whose cached session this page started with, if any.
+        self.signed_in_as = None
+        # URL the cached session landed on after its original login.
+        self.landing_url = None
+        # Called when the server rejects the cached session (see `conftest.py`); None without one.
+        self.on_cached_session_expired = None
+        # Watches for the app dropping the session (see `support/session_guard.py`); None when off.
+        self.session_guard = None
 
     @staticmethod
     def with_browser_page(page: Page) -> "BrowseTheWeb":
@@ -21,6 +45,46 @@ class BrowseTheWeb:
         # Factory to keep call sites clean in fixtures and tests.
         return BrowseTheWeb(page)
 
+    def remember_sign_in(self, email: str, landing_url: str) -> "BrowseTheWeb":
+        """
+        Records that the page's context already carries a signed-in session for `email`.
+        The Login task uses this to skip the login form (see `support/auth_state.py`).
+        """
+        self.signed_in_as = email
+        self.landing_url = landing_url
+        if self.session_guard is not None:
+            self.session_guard.arm(email, landing_url)
+        return self
+
+    def guard_session(self, guard) -> "BrowseTheWeb":
+        """
+        Attaches a SessionGuard; it is armed whenever a sign-in is remembered.
+        """
+        self.session_guard = guard
+        if self.signed_in_as is not None:
+            guard.arm(self.signed_in_as, self.landing_url)
+        return self
+
+    def forget_sign_in(self) -> None:
+        """
+        Records that the session is about to end on purpose (logout), so the redirect to the
+        login form that follows is expected.
+        """
+        self.signed_in_as = None
+        self.landing_url = None
+        if self.session_guard is not None:
+            self.session_guard.disarm()
+
+    def expire_cached_session(self) -> None:
+        """
+        Records that the server no longer accepts the cached session this page started with,
+        so neither this page nor later tests try to resume it.
+        """
+        if self.on_cached_session_expired is not None:
+            self.on_cached_session_expired()
+            self.on_cached_session_expired = None
+        self.forget_sign_in()
+
     def go_to(self, url: str) -> None:
         """
         Navigates the browser to the specified URL.
@@ -44,6 +108,8 @@ class BrowseTheWeb:
         """
         # Clear cookies at the browser context level.
         self.page.context.clear_cookies()
+        # Any cached session is gone along with the cookies.
+        self.forget_sign_in()
         # Clear local/session storage for the current origin if possible.
         try:
             self.page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
@@ -66,6 +132,40 @@ class BrowseTheWeb:
         # Locate the element and click it.
         self.page.locator(locator).click()
 
+    def first_visible(self, candidates: Sequence[str], timeout_ms: float = 0) -> Optional[VisibleCandidate]:
+        """
+        Finds the first candidate selector, in list order, that has a visible element, or None
+        when none has. With `timeout_ms`, waits that long for any of them to appear.
+        Costs one call (a wait, or count() over all candidates) plus one count() per candidate
+        checked: a match at the k-th candidate costs 1 + k calls, no match costs one.
+        Example: `browser.first_visible([DashboardPageUI.ACCOUNT_MENU_BUTTON, "button:has-text('Account')"])`.
+        """
+        visible = [self.page.locator(selector).filter(visible=True) for selector in candidates]
+        # One query (or one wait) over all candidates answers the common "nothing there" case.
+        any_visible = reduce(Locator.or_, visible).first
+        if timeout_ms > 0:
+            try:
+                any_visible.wait_for(state="visible", timeout=timeout_ms)
+            except PlaywrightTimeoutError:
+                return None
+        elif any_visible.count() == 0:
+            return None
+        # Earlier candidates win, whatever their position on the page.
+        for index, locator in enumerate(visible):
+            if locator.count() > 0:
+                return VisibleCandidate(index, candidates[index], locator.first)
+        # The element went away between the two queries.
+        return None
+
+    def click_first_visible(self, candidates: Sequence[str], timeout_ms: float = 0) -> Optional[VisibleCandidate]:
+        """
+        Clicks the element `first_visible` finds and returns it, or returns None without clicking.
+        """
+        candidate = self.first_visible(candidates, timeout_ms)
+        if candidate is not None:
+            candidate.locator.click()
+        return candidate
+
     def find_element(self, locator: str) -> Locator:
         """
         Finds an element by locator and returns its Locator object.
@@ -99,8 +199,9 @@ class BrowseTheWeb:
         return self.page.url
 
 # --- How to add a new Ability ---
-# 1. Create a new file in this directory (e.g., `call_an_api.py`).
+# 1. Create a new file in this directory (e.g., `call_an_api.py`, which defines `CallAnAPI`).
 # 2. Define a class (e.g., `CallAnAPI`) that encapsulates interactions with an API client.
-# 3. Add a `@staticmethod` factory method (e.g., `CallAnAPI.using_client(api_client)`).
-# 4. Actors can then use `.who_can(CallAnAPI.using_client(some_client))`.
-# 5. Tasks and Questions can access this ability via `actor.uses_ability(CallAnAPI)`.
+# 3. Add a `@staticmethod` factory method (e.g., `CallAnAPI.with_browser_page(page)`).
+# 4. Actors can then use `.who_can(CallAnAPI.with_browser_page(page))`.
+# 5. Tasks and Questions can access this ability via `actor.uses_ability(CallAnAPI)`
+#    (or check `actor.has_ability(CallAnAPI)` first when the ability is optional).
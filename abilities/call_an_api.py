@@ -0,0 +1,111 @@
+"""
+This module defines the CallAnAPI ability, which lets actors talk HTTP to MCDynect without rendering pages.
+It is built on Playwright's APIRequestContext, so cookies it receives can be shared with a browser context.
+"""
+import re
+from typing import Optional
+from urllib.parse import unquote
+
+from playwright.sync_api import APIRequestContext, APIResponse, BrowserContext, Page
+
+from config.credentials import BASE_URL
+from config.settings import API_LOGIN_PATH
+
+# Laravel exposes the CSRF token in a meta tag and/or the hidden `_token` form field.
+_META_CSRF = re.compile(r'<meta[^>]+name=["\']csrf-token["\'][^>]+content=["\']([^"\']+)["\']', re.I)
+_INPUT_CSRF = re.compile(r'<input[^>]+name=["\']_token["\'][^>]+value=["\']([^"\']+)["\']', re.I)
+
+
+class CallAnAPI:
+    """
+    An ability that allows an Actor to send HTTP requests to the application.
+    When created from a page, it shares that page's cookie jar: signing in here signs the page in too.
+    """
+
+    def __init__(self, request: APIRequestContext, context: Optional[BrowserContext] = None):
+        # Playwright HTTP client used for every call.
+        self.request = request
+        # Browser context that must end up with the session cookies (None for API-only actors).
+        self.context = context
+
+    @staticmethod
+    def with_browser_page(page: Page) -> "CallAnAPI":
+        """
+        Instantiates CallAnAPI on the page's own `context.request`.
+        This is typically used in Pytest fixtures next to `BrowseTheWeb.with_browser_page(page)`.
+        """
+        return CallAnAPI(page.context.request, page.context)
+
+    @staticmethod
+    def using_request_context(
+        request: APIRequestContext, context: Optional[BrowserContext] = None
+    ) -> "CallAnAPI":
+        """
+        Instantiates CallAnAPI on a standalone APIRequestContext (e.g. `playwright.request.new_context()`).
+        Pass `context` to copy session cookies into that browser context after `sign_in`.
+        """
+        return CallAnAPI(request, context)
+
+    def get(self, path: str, **kwargs) -> APIResponse:
+        """
+        Sends a GET request to a path relative to BASE_URL.
+        """
+        return self.request.get(self.url_for(path), **kwargs)
+
+    def post(self, path: str, **kwargs) -> APIResponse:
+        """
+        Sends a POST request to a path relative to BASE_URL.
+        """
+        return self.request.post(self.url_for(path), **kwargs)
+
+    def sign_in(self, email: str, password: str) -> Optional[str]:
+        """
+        Signs in over HTTP: fetch the CSRF token, POST the credentials, keep the session cookies.
+        Returns the URL the server redirected to (the role dashboard), or None if the login was rejected.
+        """
+        login_page = self.get("/login")
+        token = self._csrf_token(login_page.text())
+        headers = {"Accept": "text/html", "Referer": self.url_for("/login")}
+        xsrf_cookie = self._cookie("XSRF-TOKEN")
+        if xsrf_cookie:
+            headers["X-XSRF-TOKEN"] = unquote(xsrf_cookie)
+        form = {"email": email, "password": password}
+        if token:
+            form["_token"] = token
+
+        # Do not follow the redirect: the Location header alone tells success from failure.
+        response = self.post(API_LOGIN_PATH, form=form, headers=headers, max_redirects=0)
+        location = response.headers.get("location", "")
+        if response.status not in (301, 302, 303) or not location or "/login" in location:
+            return None
+        self._share_cookies_with_browser()
+        return self.url_for(location)
+
+    def url_for(self, path: str) -> str:
+        """
+        Resolves a path (or absolute URL) against BASE_URL.
+        """
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{BASE_URL.rstrip('/')}/{path.lstrip('/')}"
+
+    @staticmethod
+    def _csrf_token(html: str) -> Optional[str]:
+        for pattern in (_META_CSRF, _INPUT_CSRF):
+            match = pattern.search(html)
+            if match:
+                return match.group(1)
+        return None
+
+    def _cookie(self, name: str) -> Optional[str]:
+        for cookie in self.request.storage_state()["cookies"]:
+            if cookie["name"] == name:
+                return cookie["value"]
+        return None
+
+    def _share_cookies_with_browser(self) -> None:
+        # `page.context.request` already writes into the browser's cookie jar; a standalone
+        # request context does not, so copy its cookies over explicitly.
+        if self.context is None or self.request is self.context.request:
+            return
+        self.context.add_cookies(self.request.storage_state()["cookies"])
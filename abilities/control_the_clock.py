@@ -0,0 +1,80 @@
+"""
+This module defines the ControlTheClock ability, which lets actors control time inside the browser.
+It is built on Playwright's `page.clock`: once installed, `Date`, timers and `performance.now` follow
+a clock the test can fast-forward, so polling, debounce and toast timers take milliseconds instead of seconds.
+"""
+from datetime import date, datetime
+from typing import Optional, Union
+
+from playwright.sync_api import Page
+
+# A point in time as `page.clock` accepts it: datetime, epoch milliseconds or an ISO string.
+TimeValue = Union[datetime, float, str]
+# A duration as `page.clock` accepts it: milliseconds or "mm:ss" / "hh:mm:ss".
+Ticks = Union[int, str]
+
+
+class ControlTheClock:
+    """
+    An ability that controls the browser clock of the Actor's page (shared by its whole context).
+    The clock is installed on first use, or up front by the actor fixtures for tests marked
+    `@pytest.mark.clock(...)`. Install it before the page loads for its timers to be controlled.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.installed = False
+
+    @staticmethod
+    def with_browser_page(page: Page) -> "ControlTheClock":
+        """
+        Instantiates ControlTheClock on a Playwright Page (see `conftest.py`).
+        """
+        return ControlTheClock(page)
+
+    def install(self, start: Optional[TimeValue] = None) -> "ControlTheClock":
+        """
+        Installs the controllable clock. Time keeps flowing from `start` (default: now) until paused.
+        """
+        if not self.installed:
+            self.page.clock.install(time=start)
+            self.installed = True
+        return self
+
+    def fast_forward(self, ticks: Ticks) -> None:
+        """
+        Jumps ahead, firing each due timer once (like a laptop waking from sleep).
+        """
+        self.install()
+        self.page.clock.fast_forward(ticks)
+
+    def run_for(self, ticks: Ticks) -> None:
+        """
+        Advances time, firing every timer in between (intervals repeatedly): e.g. a 20 s polling loop
+        runs all its polls at once.
+        """
+        self.install()
+        self.page.clock.run_for(ticks)
+
+    def pause_at(self, when: TimeValue) -> None:
+        """
+        Jumps to `when` and stops time there; timers only fire on `run_for`/`fast_forward`.
+        """
+        self.install()
+        self.page.clock.pause_at(when)
+
+    def resume(self) -> None:
+        self.page.clock.resume()
+
+    def now(self) -> datetime:
+        """
+        The page's current time, which is the real time unless the clock was moved.
+        """
+        return datetime.fromtimestamp(self.page.evaluate("Date.now()") / 1000)
+
+    def today(self) -> date:
+        """
+        The page's current date. Derive test dates from this rather than `date.today()`,
+        so they follow a clock pinned with `@pytest.mark.clock(...)`.
+        """
+        return self.now().date()
@@ -0,0 +1,235 @@
+"""
+This module defines the WaitFor toolkit: event-driven waits that replace fixed `wait_for_timeout` sleeps.
+Every wait returns as soon as its condition holds and shares one timeout policy (MCDYNECT_WAIT_TIMEOUT_MS).
+On a page watched by a SessionGuard, a wait also stops as soon as the app drops the session
+(see `support/session_guard.py`) instead of running into its timeout.
+"""
+import re
+import time
+from typing import Any, Callable, Optional, Pattern, Tuple, Type, Union
+
+from playwright.sync_api import Locator, Page, Response, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from config.settings import WAIT_TIMEOUT_MS
+from support.session_guard import SessionGuard
+
+UrlMatcher = Union[str, Pattern[str], Callable[[str], bool]]
+Target = Union[str, Locator]
+
+# While the session is guarded, waits run in slices this long, so a dropped session is handled within one slice.
+GUARD_SLICE_MS = 500
+
+
+class WaitFor:
+    """
+    Waits on a Playwright Page for URLs, responses, DOM conditions and elements.
+    Each method raises Playwright's TimeoutError (or AssertionError for `text`) when the
+    condition does not hold in time, or returns False instead when called with `required=False`.
+    A dropped session raises SessionDropped either way, unless the guard signs back in.
+    """
+
+    def __init__(self, page: Page, timeout_ms: Optional[float] = None):
+        self.page = page
+        self.timeout_ms = WAIT_TIMEOUT_MS if timeout_ms is None else timeout_ms
+
+    @staticmethod
+    def on(page: Page, timeout_ms: Optional[float] = None) -> "WaitFor":
+        """
+        Creates the toolkit for a page. Example: `WaitFor.on(page).url("**/licensee/**")`.
+        """
+        return WaitFor(page, timeout_ms)
+
+    def url(self, matcher: UrlMatcher, timeout_ms: Optional[float] = None, required: bool = True) -> bool:
+        """
+        Waits until the page URL matches a glob, regex or predicate (client-side route changes included).
+        """
+        return self._attempt(
+            lambda timeout: self.page.wait_for_url(matcher, timeout=timeout, wait_until="domcontentloaded"),
+            timeout_ms,
+            required,
+            f"URL {_describe(matcher)}",
+        )
+
+    def response(
+        self,
+        url_matcher: Union[str, Pattern[str], Callable[[Response], bool]],
+        trigger: Callable[[], Any],
+        timeout_ms: Optional[float] = None,
+        required: bool = True,
+    ) -> Optional[Response]:
+        """
+        Runs `trigger` (e.g. a click) and waits for the network response it causes.
+        Returns the Response, or None when `required=False` and nothing matched in time.
+        If the session drops instead and the guard signs back in, `trigger` runs once more.
+        """
+        guard = self._guard()
+        matcher = url_matcher
+        if guard is not None:
+            # Any response after the redirect to the login form ends the wait early.
+            matcher = lambda response: guard.dropped is not None or _response_matches(url_matcher, response)
+        for _ in range(2):
+            try:
+                with self.page.expect_response(matcher, timeout=self._timeout(timeout_ms)) as info:
+                    trigger()
+                response = info.value
+            except PlaywrightTimeoutError:
+                if guard is not None and guard.dropped is not None:
+                    guard.recover(f"response {_describe(url_matcher)}")
+                    continue
+                if required:
+                    raise
+                return None
+            if guard is None or guard.dropped is None:
+                return response
+            guard.recover(f"response {_describe(url_matcher)}")
+        if required:
+            raise PlaywrightTimeoutError(f"No response {_describe(url_matcher)} after signing back in.")
+        return None
+
+    def condition(
+        self, expression: str, arg: Any = None, timeout_ms: Optional[float] = None, required: bool = True
+    ) -> bool:
+        """
+        Waits until a JavaScript expression/function evaluates truthy in the page (checked every frame).
+        """
+        return self._attempt(
+            lambda timeout: self.page.wait_for_function(expression, arg=arg, polling="raf", timeout=timeout),
+            timeout_ms,
+            required,
+            f"condition {expression!r}",
+        )
+
+    def element(
+        self, target: Target, state: str = "visible", timeout_ms: Optional[float] = None, required: bool = True
+    ) -> bool:
+        """
+        Waits until the first element matching a selector or Locator reaches `state`.
+        """
+        locator = self._locator(target).first
+        return self._attempt(
+            lambda timeout: locator.wait_for(state=state, timeout=timeout),
+            timeout_ms,
+            required,
+            f"{_describe(target)} to be {state}",
+        )
+
+    def element_to_disappear(
+        self, target: Target, timeout_ms: Optional[float] = None, required: bool = True
+    ) -> bool:
+        """
+        Waits until the element is hidden or detached (modal closed, spinner gone, toast dismissed).
+        """
+        return self.element(target, state="hidden", timeout_ms=timeout_ms, required=required)
+
+    def text(
+        self, target: Target, expected: Union[str, Pattern[str]], timeout_ms: Optional[float] = None,
+        required: bool = True,
+    ) -> bool:
+        """
+        Waits until the element's visible text equals `expected` (re-resolved if the element re-renders).
+        """
+        locator = self._locator(target).first
+        return self._attempt(
+            lambda timeout: expect(locator).to_have_text(expected, use_inner_text=True, timeout=timeout),
+            timeout_ms,
+            required,
+            f"{_describe(target)} to read {_describe(expected)}",
+            errors=(AssertionError,),
+        )
+
+    def _locator(self, target: Target) -> Locator:
+        return self.page.locator(target) if isinstance(target, str) else target
+
+    def _timeout(self, timeout_ms: Optional[float]) -> float:
+        return self.timeout_ms if timeout_ms is None else timeout_ms
+
+    def _guard(self) -> Optional[SessionGuard]:
+        guard = SessionGuard.for_page(self.page)
+        return guard if guard is not None and guard.armed else None
+
+    def _attempt(
+        self,
+        wait: Callable[[float], Any],
+        timeout_ms: Optional[float],
+        required: bool,
+        waiting_for: str,
+        errors: Tuple[Type[Exception], ...] = (PlaywrightTimeoutError,),
+    ) -> bool:
+        timeout = self._timeout(timeout_ms)
+        guard = self._guard()
+        if guard is None:
+            try:
+                wait(timeout)
+                return True
+            except errors:
+                if required:
+                    raise
+                return False
+
+        # Guarded: wait in slices and look at the guard in between (and after a success, which a
+        # redirect to the login form can fake, e.g. for an element that should disappear).
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            if guard.dropped is not None:
+                started = time.monotonic()
+                guard.recover(waiting_for)
+                # Time spent signing back in does not count against the wait.
+                deadline += time.monotonic() - started
+            remaining_ms = 1000 * (deadline - time.monotonic())
+            try:
+                wait(max(1.0, min(GUARD_SLICE_MS, remaining_ms)))
+            except errors as error:
+                if guard.dropped is not None or remaining_ms > GUARD_SLICE_MS:
+                    continue
+                if required:
+                    raise type(error)(f"Timed out after {timeout:.0f}ms waiting for {waiting_for}.\n{error}") from None
+                return False
+            if guard.dropped is None:
+                return True
+
+
+def _describe(matcher: Any) -> str:
+    if isinstance(matcher, str):
+        return repr(matcher)
+    if isinstance(matcher, re.Pattern):
+        return f"/{matcher.pattern}/"
+    if isinstance(matcher, Locator):
+        return str(matcher)
+    return "matching a predicate"
+
+
+def _response_matches(url_matcher: Union[str, Pattern[str], Callable[[Response], bool]], response: Response) -> bool:
+    if callable(url_matcher):
+        return bool(url_matcher(response))
+    if isinstance(url_matcher, str):
+        url_matcher = _glob_to_regex(url_matcher)
+    return bool(url_matcher.search(response.url))
+
+
+def _glob_to_regex(glob: str) -> Pattern[str]:
+    # Playwright's URL globs: "**" matches anything, "*" anything but "/", "{a,b}" either
+    # alternative; the whole URL must match. Everything else, "?" included, is literal.
+    parts = ["^"]
+    in_group = False
+    i = 0
+    while i < len(glob):
+        char = glob[i]
+        if glob.startswith("**", i):
+            parts.append(".*")
+            i += 1
+        elif char == "*":
+            parts.append("[^/]*")
+        elif char == "{" and not in_group:
+            parts.append("(?:")
+            in_group = True
+        elif char == "}" and in_group:
+            parts.append(")")
+            in_group = False
+        elif char == "," and in_group:
+            parts.append("|")
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    parts.append("$")
+    return re.compile("".join(parts))
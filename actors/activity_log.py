@@ -0,0 +1,128 @@
+"""
+This module times every Task and Question an Actor runs (`attempts_to` / `asks_for`).
+It keeps raw samples per class and summarises them as count, total, p50, p95 and max,
+for both wall time and the time spent waiting on the browser.
+"""
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+# A clock returning cumulative seconds spent waiting (e.g. in Playwright calls), or None if unknown.
+WaitClock = Callable[[], Optional[float]]
+
+# (wall seconds, wait seconds or None) for one run of a Task or Question.
+Sample = Tuple[float, Optional[float]]
+
+
+def activity_name(activity) -> str:
+    # Questions with static `answered_by` may be passed as classes rather than instances.
+    return activity.__name__ if isinstance(activity, type) else type(activity).__name__
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    rank = max(math.ceil(fraction * len(values)), 1)
+    return values[rank - 1]
+
+
+def describe(values: List[float]) -> dict:
+    ordered = sorted(values)
+    return {
+        "total": round(sum(ordered), 3),
+        "p50": round(percentile(ordered, 0.50), 3),
+        "p95": round(percentile(ordered, 0.95), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class ActivityLog:
+    """
+    Collects timing samples keyed by ("task" | "question", class name).
+    Nested activities are timed inclusively: `LoginAs` includes the `Login` it runs.
+    """
+
+    def __init__(self, wait_clock: Optional[WaitClock] = None, enabled: bool = True):
+        self.enabled = enabled
+        self._wait_clock = wait_clock
+        self._samples: Dict[Tuple[str, str], List[Sample]] = {}
+        self._lock = threading.Lock()
+
+    def set_wait_clock(self, wait_clock: Optional[WaitClock]) -> None:
+        """
+        Plugs in the source of wait time (see `support/page_timing.py`); None records wall time only.
+        """
+        self._wait_clock = wait_clock
+
+    @contextmanager
+    def measure(self, kind: str, activity):
+        """
+        Times the body of the `with` block as one run of `activity`, even when it raises.
+        """
+        if not self.enabled:
+            yield
+            return
+        wait_clock = self._wait_clock
+        wait_before = wait_clock() if wait_clock else None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - started
+            wait_after = wait_clock() if wait_clock else None
+            wait = None if wait_before is None or wait_after is None else wait_after - wait_before
+            self.record(kind, activity_name(activity), wall, wait)
+
+    def record(self, kind: str, name: str, wall: float, wait: Optional[float] = None) -> None:
+        with self._lock:
+            self._samples.setdefault((kind, name), []).append((wall, wait))
+
+    def samples(self) -> List[list]:
+        """
+        Raw samples as JSON-friendly rows `[kind, name, [[wall, wait], ...]]`, e.g. to ship from an xdist worker.
+        """
+        with self._lock:
+            return [
+                [kind, name, [list(sample) for sample in samples]]
+                for (kind, name), samples in self._samples.items()
+            ]
+
+    def merge(self, rows: List[list]) -> None:
+        """
+        Adds samples produced by `samples()` in another process.
+        """
+        with self._lock:
+            for kind, name, samples in rows:
+                self._samples.setdefault((kind, name), []).extend(tuple(sample) for sample in samples)
+
+    def summary(self) -> Dict[str, Dict[str, dict]]:
+        """
+        {"tasks": {name: stats}, "questions": {name: stats}}, each sorted by total wall time.
+        """
+        with self._lock:
+            items = list(self._samples.items())
+        summary: Dict[str, Dict[str, dict]] = {}
+        for (kind, name), samples in sorted(items, key=lambda item: -sum(wall for wall, _ in item[1])):
+            waits = [wait for _, wait in samples if wait is not None]
+            stats = {"count": len(samples), "wall": describe([wall for wall, _ in samples])}
+            stats["wait"] = describe(waits) if waits else None
+            summary.setdefault(f"{kind}s", {})[name] = stats
+        return summary
+
+    def write(self, path: str, **extra) -> None:
+        payload = dict(extra)
+        payload.update(self.summary())
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+# Shared by every Actor in the process; conftest plugs in the wait clock and writes the summary.
+ACTIVITY_LOG = ActivityLog()
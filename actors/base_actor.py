@@ -6,6 +6,8 @@ All specific actors (e.g., Licensee, AreaManager) will inherit from this base.
 """
 from typing import List, TypeVar, Type, Dict, Any
 
+from actors.activity_log import ACTIVITY_LOG
+
 T = TypeVar("T")
 
 class Actor:
@@ -30,6 +32,13 @@ class Actor:
         self._abilities[type(ability)] = ability
         return self
 
+    def has_ability(self, ability_type: Type) -> bool:
+        """
+        Returns True when the actor was granted `ability_type`.
+        Lets tasks take an optional fast path (e.g. CallAnAPI) and fall back otherwise.
+        """
+        return ability_type in self._abilities
+
     def uses_ability(self, ability_type: Type[T]) -> T:
         """
         Retrieves a specific ability for the actor to use.
@@ -45,9 +54,10 @@ class Actor:
         Instructs the actor to perform one or more tasks.
         Example: `the_licensee.attempts_to(Login.with_credentials("email", "password"))`
         """
-        # Run tasks in sequence to model a user workflow.
+        # Run tasks in sequence to model a user workflow, timing each one.
         for task in tasks:
-            task.perform_as(self)
+            with ACTIVITY_LOG.measure("task", task):
+                task.perform_as(self)
 
     def asks_for(self, question: Any) -> Any:
         """
@@ -55,4 +65,5 @@ class Actor:
         Example: profile = the_licensee.asks_for(GetProfileInfo())
         """
         # Delegate the query to the Question object.
-        return question.answered_by(self)
+        with ACTIVITY_LOG.measure("question", question):
+            return question.answered_by(self)
@@ -87,6 +87,51 @@ LOGIN_CREDENTIALS = {
     },
 }
 
+
+
+def _numbered_accounts(prefix: str) -> list:
+    """
+    Reads `<prefix>_EMAIL_1`, `<prefix>_PASSWORD_1`, `<prefix>_EMAIL_2`, ... until a gap.
+    """
+    accounts = []
+    index = 1
+    while os.getenv(f"{prefix}_EMAIL_{index}"):
+        accounts.append(
+            {
+                "email": _env(f"{prefix}_EMAIL_{index}"),
+                "password": _env(f"{prefix}_PASSWORD_{index}"),
+            }
+        )
+        index += 1
+    return accounts
+
+
+def _default_licensee_pool() -> list:
+    # Without a numbered pool, mutating tests share the dedicated switch-outlet account
+    # (or the main licensee) one at a time.
+    switch_email = os.getenv("MCDYNECT_SWITCH_OUTLET_EMAIL", "").strip()
+    switch_password = os.getenv("MCDYNECT_SWITCH_OUTLET_PASSWORD", "").strip()
+    if switch_email and switch_password:
+        return [{"email": switch_email, "password": switch_password}]
+    licensee = LOGIN_CREDENTIALS["licensee"]
+    return [{"email": licensee["email"], "password": licensee["password"]}]
+
+
+def _default_switch_outlet_pool() -> list:
+    # The dedicated multi-outlet account, when configured.
+    switch_email = os.getenv("MCDYNECT_SWITCH_OUTLET_EMAIL", "").strip()
+    switch_password = os.getenv("MCDYNECT_SWITCH_OUTLET_PASSWORD", "").strip()
+    if switch_email and switch_password:
+        return [{"email": switch_email, "password": switch_password}]
+    return []
+
+
+# Licensee accounts that tests mutating server state lease exclusively (see `support/account_pool.py`).
+LICENSEE_ACCOUNT_POOL = _numbered_accounts("MCDYNECT_LICENSEE") or _default_licensee_pool()
+
+# Multi-outlet licensee accounts, leased by the outlet switching test (UC06).
+SWITCH_OUTLET_ACCOUNT_POOL = _numbered_accounts("MCDYNECT_SWITCH_OUTLET") or _default_switch_outlet_pool()
+
 # --- How to extend configuration ---
 # - Add new dictionaries for different environments (e.g., `DEV_CREDENTIALS`, `PROD_CREDENTIALS`).
 # - Introduce new variables for other application-wide settings (e.g., API_ENDPOINTS, TIMEOUTS).
@@ -0,0 +1,90 @@
+"""
+This module stores runtime toggles for the test framework itself.
+Unlike `config/credentials.py`, every value here is optional and has a safe default.
+"""
+import os
+
+# Load `.env` the same way credentials do so toggles can live next to them.
+from config import credentials  # noqa: F401
+
+
+def env_flag(key: str, default: bool) -> bool:
+    # Central helper to read boolean toggles such as `MCDYNECT_HEADLESS`.
+    value = os.getenv(key)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "y"}
+
+
+# Run browsers without a window; shared by the test session and the browser daemon.
+HEADLESS = env_flag("MCDYNECT_HEADLESS", False)
+
+# Reuse one signed-in storage_state per role instead of logging in for every test.
+AUTH_CACHE_ENABLED = env_flag("MCDYNECT_AUTH_CACHE", True)
+
+# Seconds a test waits for a free account from the licensee pool before failing.
+ACCOUNT_LEASE_TIMEOUT = float(os.getenv("MCDYNECT_ACCOUNT_LEASE_TIMEOUT", "300"))
+
+# When to take the post-test screenshot: "off", "on-failure" or "always".
+SCREENSHOT_POLICY = os.getenv("MCDYNECT_SCREENSHOTS", "on-failure").strip().lower()
+# The page counts as settled after this many ms without DOM mutations...
+SCREENSHOT_QUIET_MS = int(os.getenv("MCDYNECT_SCREENSHOT_QUIET_MS", "250"))
+# ...or after this hard cap, whichever comes first.
+SCREENSHOT_MAX_WAIT_MS = int(os.getenv("MCDYNECT_SCREENSHOT_MAX_WAIT_MS", "2000"))
+
+# Screenshot encoding on the background writer: "png" (as captured), "webp" or "jpeg" (needs Pillow).
+SCREENSHOT_FORMAT = os.getenv("MCDYNECT_SCREENSHOT_FORMAT", "png").strip().lower()
+SCREENSHOT_QUALITY = int(os.getenv("MCDYNECT_SCREENSHOT_QUALITY", "80"))
+# Background artifact writer threads, and how many artifacts may wait before the test thread blocks.
+ARTIFACT_WORKERS = int(os.getenv("MCDYNECT_ARTIFACT_WORKERS", "2"))
+ARTIFACT_QUEUE_SIZE = int(os.getenv("MCDYNECT_ARTIFACT_QUEUE", "16"))
+
+# Default timeout for every WaitFor wait (see `abilities/wait_for.py`).
+WAIT_TIMEOUT_MS = float(os.getenv("MCDYNECT_WAIT_TIMEOUT_MS", "15000"))
+
+# Sign in over HTTP (CallAnAPI) instead of rendering the login form, unless a test asks for the form.
+API_LOGIN_ENABLED = env_flag("MCDYNECT_API_LOGIN", True)
+# Path the login form posts to.
+API_LOGIN_PATH = os.getenv("MCDYNECT_API_LOGIN_PATH", "/login").strip()
+
+# Network HAR mode: "off", "record" (one HAR per test) or "replay" (serve tests from their HARs).
+HAR_MODE = os.getenv("MCDYNECT_HAR", "off").strip().lower()
+# HAR folder to replay; empty means the newest `test_runs/<timestamp>/har`.
+HAR_DIR = os.getenv("MCDYNECT_HAR_DIR", "").strip()
+
+# Time every Task/Question (wall time and Playwright wait time) into `activity.json`.
+ACTIVITY_TIMING_ENABLED = env_flag("MCDYNECT_ACTIVITY_TIMING", True)
+# Split each test's wall time (sleep / navigation / locator / screenshot / ...) into `timing.json`.
+TIMING_REPORT_ENABLED = env_flag("MCDYNECT_TIMING_REPORT", True)
+
+# SQLite file every run is appended to (see `support/run_history.py`); "off" disables it.
+RUN_HISTORY_PATH = os.getenv("MCDYNECT_RUN_HISTORY", "").strip()
+
+# Default for `--shard i/N`: run only shard i of N, balanced by run-history durations.
+SHARD = os.getenv("MCDYNECT_SHARD", "").strip()
+
+# Connect to the Chromium kept warm by `python -m support.browser_daemon start` when it is running.
+BROWSER_DAEMON_ENABLED = env_flag("MCDYNECT_BROWSER_DAEMON", True)
+
+# Serve static assets (JS/CSS/fonts/images) from a cache shared across tests and runs (off in HAR runs).
+ASSET_CACHE_ENABLED = env_flag("MCDYNECT_ASSET_CACHE", True)
+# Cache folder; empty means `.pw_home/asset_cache`.
+ASSET_CACHE_DIR = os.getenv("MCDYNECT_ASSET_CACHE_DIR", "").strip()
+
+# Requests to block before they leave the browser: "off", "safe" (analytics only) or "lean" (+ fonts/media/images).
+NETWORK_POLICY = os.getenv("MCDYNECT_NETWORK_POLICY", "safe").strip().lower()
+# Extra URL regexes to abort, comma-separated (applied unless the policy is "off").
+BLOCK_URLS = [pattern.strip() for pattern in os.getenv("MCDYNECT_BLOCK_URLS", "").split(",") if pattern.strip()]
+
+# "reduced": skip CSS transitions/animations and prefer reduced motion; "full": the app's own animations.
+MOTION_MODE = os.getenv("MCDYNECT_MOTION", "reduced").strip().lower()
+# In "reduced" mode, toasts are hidden after this many ms (0 keeps the app's timing).
+TOAST_MS = int(os.getenv("MCDYNECT_TOAST_MS", "1500"))
+
+# When the app bounces a signed-in page to /login: "reauth" (sign back in and resume), "fail" (stop the wait) or "off".
+SESSION_DROP_POLICY = os.getenv("MCDYNECT_SESSION_DROP", "reauth").strip().lower()
+
+# Crawl each account's sales listings once and hand tests existing records (off in HAR runs).
+SALES_CATALOG_ENABLED = env_flag("MCDYNECT_SALES_CATALOG", True)
+# Seconds a saved catalog is reused by other workers and runs; 0 keeps it in memory for one session.
+SALES_CATALOG_TTL = float(os.getenv("MCDYNECT_SALES_CATALOG_TTL", "600"))
@@ -16,6 +16,9 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from abilities.browse_the_web import BrowseTheWeb
+from abilities.call_an_api import CallAnAPI
+from abilities.control_the_clock import ControlTheClock
+from actors.activity_log import ACTIVITY_LOG
 from actors.base_actor import Actor
 from actors.licensee import Licensee
 from actors.area_manager import AreaManager
@@ -25,21 +28,160 @@ from actors.production import Production
 from actors.licensing import Licensing
 from actors.compliance import Compliance
 from actors.finance import Finance
+from config.credentials import BASE_URL, LICENSEE_ACCOUNT_POOL, SWITCH_OUTLET_ACCOUNT_POOL
+from config.settings import (
+    ACCOUNT_LEASE_TIMEOUT,
+    ACTIVITY_TIMING_ENABLED,
+    ARTIFACT_QUEUE_SIZE,
+    ASSET_CACHE_DIR,
+    ASSET_CACHE_ENABLED,
+    ARTIFACT_WORKERS,
+    AUTH_CACHE_ENABLED,
+    BLOCK_URLS,
+    BROWSER_DAEMON_ENABLED,
+    HAR_DIR,
+    HAR_MODE,
+    HEADLESS,
+    MOTION_MODE,
+    NETWORK_POLICY,
+    RUN_HISTORY_PATH,
+    SALES_CATALOG_ENABLED,
+    SALES_CATALOG_TTL,
+    SCREENSHOT_FORMAT,
+    SCREENSHOT_QUALITY,
+    SCREENSHOT_MAX_WAIT_MS,
+    SCREENSHOT_POLICY,
+    SCREENSHOT_QUIET_MS,
+    SESSION_DROP_POLICY,
+    SHARD,
+    TIMING_REPORT_ENABLED,
+    TOAST_MS,
+)
+from support.account_pool import AccountPool
+from support.artifacts import ArtifactWriter, safe_test_name
+from support.asset_cache import AssetCache
+from support.auth_state import AuthStateCache
+from support.browser_daemon import connect as connect_to_daemon
+from support.har import HAR_MODES, HarSession, har_dir_for_run, latest_recording
+from support.motion import MOTION_MODES, MOTION_PROPERTY, MotionControl
+from support.network_policy import NETWORK_POLICIES, NetworkPolicy, rules_for
+from support.overlays import OverlayDismisser
+from support.page_timing import PLAYWRIGHT_CLOCK, TestTiming
+from support.parallel import (
+    ACTIVITY_OUTPUT_KEY,
+    ASSET_CACHE_OUTPUT_KEY,
+    RUN_DIR_KEY,
+    is_worker,
+    shared_run_dir,
+    worker_subdir,
+)
+from support.run_history import DEFAULT_HISTORY_PATH, RunHistory
+from support.run_results import RunResults
+from support.sales_catalog import SalesCatalog
+from support.sharding import DurationEstimate, ShardTest, parse_shard, plan_shards
+from support.screenshots import SCREENSHOT_POLICIES, should_capture, wait_for_dom_stable
+from support.session_guard import SESSION_DROP_POLICIES, SESSION_DROP_PROPERTY, SessionGuard
+from support.timing_report import TIMING_PROPERTY, TimingReport
+
+
+def pytest_addoption(parser):
+    """
+    Registers command-line options for the framework (each defaults to its env var).
+    """
+    group = parser.getgroup("mcdynect")
+    group.addoption(
+        "--mcd-screenshots",
+        choices=SCREENSHOT_POLICIES,
+        default=SCREENSHOT_POLICY if SCREENSHOT_POLICY in SCREENSHOT_POLICIES else "on-failure",
+        help="When to screenshot after a test: off, on-failure (default) or always. "
+        "Env: MCDYNECT_SCREENSHOTS.",
+    )
+    group.addoption(
+        "--mcd-har",
+        choices=HAR_MODES,
+        default=HAR_MODE if HAR_MODE in HAR_MODES else "off",
+        help="record: save each test's traffic to test_runs/<timestamp>/har/<test>.har; "
+        "replay: serve it back with route_from_har. Env: MCDYNECT_HAR.",
+    )
+    group.addoption(
+        "--mcd-har-dir",
+        default=HAR_DIR,
+        help="HAR folder to replay (default: the newest test_runs/*/har). Env: MCDYNECT_HAR_DIR.",
+    )
+    group.addoption(
+        "--mcd-motion",
+        choices=MOTION_MODES,
+        default=MOTION_MODE if MOTION_MODE in MOTION_MODES else "reduced",
+        help="reduced (default): skip CSS transitions/animations and shorten toasts; full: the app's own "
+        "animations. Tests marked motion(...) override it. Env: MCDYNECT_MOTION.",
+    )
+    group.addoption(
+        "--mcd-network-policy",
+        choices=NETWORK_POLICIES,
+        default=NETWORK_POLICY if NETWORK_POLICY in NETWORK_POLICIES else "safe",
+        help="Requests to block: off, safe (analytics only, default) or lean (also fonts, media, images). "
+        "Tests marked network_policy(...) or visual override it. Env: MCDYNECT_NETWORK_POLICY.",
+    )
+    group.addoption(
+        "--mcd-session-drop",
+        choices=SESSION_DROP_POLICIES,
+        default=SESSION_DROP_POLICY if SESSION_DROP_POLICY in SESSION_DROP_POLICIES else "reauth",
+        help="When the app bounces a signed-in page to /login: reauth (sign back in and resume, default), "
+        "fail (stop the current wait at once) or off. Env: MCDYNECT_SESSION_DROP.",
+    )
+    group.addoption(
+        "--shard",
+        type=parse_shard,
+        default=SHARD or None,
+        dest="mcd_shard",
+        metavar="i/N",
+        help="Run only shard i of N, balanced by durations from the run history. Env: MCDYNECT_SHARD.",
+    )
 
 
 def pytest_configure(config):
     """
-    Called once at test session startup.
+    Called once at test session startup (and once per pytest-xdist worker).
     Creates a timestamped output directory and attaches it to config.
     """
-    # Use project root to keep artifacts under this repo.
-    base_dir = pathlib.Path(__file__).parent.resolve()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    # Create a unique output folder per test session.
-    test_output_dir = os.path.join(base_dir, "test_runs", timestamp)
+    # Workers reuse the folder created by the controller (see pytest_configure_node).
+    test_output_dir = shared_run_dir(config)
+    if test_output_dir is None:
+        # Use project root to keep artifacts under this repo.
+        base_dir = pathlib.Path(__file__).parent.resolve()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Create a unique output folder per test session.
+        test_output_dir = os.path.join(base_dir, "test_runs", timestamp)
     os.makedirs(test_output_dir, exist_ok=True)
     # Store on config so hooks/fixtures can access it.
     config.test_output_dir = test_output_dir
+    # Each process (controller or xdist worker) writes its own artifacts in the background.
+    config.artifact_writer = ArtifactWriter(
+        workers=ARTIFACT_WORKERS,
+        max_pending=ARTIFACT_QUEUE_SIZE,
+        image_format=SCREENSHOT_FORMAT,
+        quality=SCREENSHOT_QUALITY,
+    )
+    config.har_mode, config.har_dir = _har_settings(config, test_output_dir)
+    # HAR runs must see (or replay) every request, so they skip the asset cache.
+    config.asset_cache = None
+    if ASSET_CACHE_ENABLED and config.har_mode == "off":
+        config.asset_cache = AssetCache(ASSET_CACHE_DIR or str(ROOT_DIR / ".pw_home" / "asset_cache"))
+    # Time every Task/Question; wait time comes from the Playwright call clock when it can be installed.
+    ACTIVITY_LOG.enabled = ACTIVITY_TIMING_ENABLED
+    clock_installed = (ACTIVITY_TIMING_ENABLED or TIMING_REPORT_ENABLED) and PLAYWRIGHT_CLOCK.install()
+    if ACTIVITY_TIMING_ENABLED and clock_installed:
+        ACTIVITY_LOG.set_wait_clock(PLAYWRIGHT_CLOCK.elapsed)
+    # Per-test time breakdowns are taken in every process and merged from reports by the controller.
+    config.timing_enabled = TIMING_REPORT_ENABLED and clock_installed
+    # Only the controller sees every report, so it owns the merged results file.
+    if not is_worker(config):
+        config.started_at = datetime.now()
+        config.run_results = RunResults()
+        config.pluginmanager.register(config.run_results, "mcd_run_results")
+        if config.timing_enabled:
+            config.timing_report = TimingReport()
+            config.pluginmanager.register(config.timing_report, "mcd_timing_report")
     # If pytest-html plugin is installed, write report into this run folder.
     if hasattr(config.option, "htmlpath"):
         config.option.htmlpath = os.path.join(test_output_dir, "report.html")
@@ -47,20 +189,211 @@ def pytest_configure(config):
             config.option.self_contained_html = True
 
 
+def _har_settings(config, test_output_dir):
+    """
+    Returns (mode, folder) for --mcd-har: recordings go to this run's folder, replays read
+    --mcd-har-dir or the newest earlier recording.
+    """
+    mode = config.getoption("mcd_har")
+    if mode == "record":
+        return mode, har_dir_for_run(test_output_dir)
+    if mode == "replay":
+        har_dir = config.getoption("mcd_har_dir") or latest_recording(
+            os.path.join(ROOT_DIR, "test_runs"), exclude=har_dir_for_run(test_output_dir)
+        )
+        if not har_dir or not os.path.isdir(har_dir):
+            raise pytest.UsageError(
+                "--mcd-har=replay needs a recording: run --mcd-har=record first or pass --mcd-har-dir."
+            )
+        return mode, har_dir
+    return mode, None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    pytest-xdist hook (controller side): hand the run folder to each worker.
+    """
+    node.workerinput[RUN_DIR_KEY] = node.config.test_output_dir
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    pytest-xdist hook (controller side): merge the Task/Question timings and asset cache counters
+    a worker sent back.
+    """
+    workeroutput = getattr(node, "workeroutput", {})
+    ACTIVITY_LOG.merge(workeroutput.get(ACTIVITY_OUTPUT_KEY, []))
+    if node.config.asset_cache is not None:
+        node.config.asset_cache.merge(workeroutput.get(ASSET_CACHE_OUTPUT_KEY, {}))
+
+
+def pytest_sessionfinish(session):
+    """
+    Flushes queued artifacts, then writes the merged `results.json`, `timing.json`,
+    `activity.json` and `asset_cache.json` once all workers are done, and appends the run
+    to the run history.
+    """
+    config = session.config
+    # Every process drains its own artifact queue before it exits.
+    config.artifact_writer.close()
+    if is_worker(config):
+        # The controller writes activity.json from every worker's samples.
+        config.workeroutput[ACTIVITY_OUTPUT_KEY] = ACTIVITY_LOG.samples()
+        if config.asset_cache is not None:
+            config.workeroutput[ASSET_CACHE_OUTPUT_KEY] = config.asset_cache.stats
+        return
+    config.run_results.write(
+        os.path.join(config.test_output_dir, "results.json"),
+        run_dir=config.test_output_dir,
+    )
+    if config.timing_enabled:
+        config.timing_report.write(os.path.join(config.test_output_dir, "timing.json"), run_dir=config.test_output_dir)
+    if ACTIVITY_LOG.enabled:
+        ACTIVITY_LOG.write(
+            os.path.join(config.test_output_dir, "activity.json"),
+            run_dir=config.test_output_dir,
+            wait_source="playwright" if PLAYWRIGHT_CLOCK.installed else None,
+        )
+    if config.asset_cache is not None:
+        config.asset_cache.write(
+            os.path.join(config.test_output_dir, "asset_cache.json"), run_dir=config.test_output_dir
+        )
+    if RUN_HISTORY_PATH.lower() != "off" and config.run_results.tests:
+        with RunHistory(RUN_HISTORY_PATH or DEFAULT_HISTORY_PATH) as history:
+            history.record_run(
+                config.run_results.tests.values(),
+                started_at=config.started_at,
+                finished_at=datetime.now(),
+                run_dir=config.test_output_dir,
+                browser=os.getenv("MCDYNECT_BROWSER", "chromium").strip().lower(),
+                base_url=BASE_URL,
+            )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Balances the suite by historical duration (see `support/sharding.py`):
+    `--shard i/N` keeps only this machine's shard, and under `-n N --dist loadgroup`
+    every test is pinned to one of N worker groups. Runs before xdist turns the marks into groups.
+    """
+    shard = config.getoption("mcd_shard")
+    if shard is not None:
+        index, count = shard
+        plan = _shard_plan(config, items, count)
+        selected = [item for item in items if plan.shard_of(item.nodeid) == index - 1]
+        deselected = [item for item in items if plan.shard_of(item.nodeid) != index - 1]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+        config.mcd_shard_summary = f"shard {index}/{count} of {plan.describe()}"
+    # xdist resets `dist` on workers and keeps `loadgroup` for them.
+    if is_worker(config) and config.getvalue("loadgroup"):
+        plan = _shard_plan(config, items, config.workerinput["workercount"])
+        for item in items:
+            item.add_marker(pytest.mark.xdist_group(f"shard{plan.shard_of(item.nodeid) + 1}"))
+
+
+def _shard_plan(config, items, count):
+    """
+    Plans `count` shards for `items`. Every process reads the same history, so all compute the same plan.
+    """
+    if not hasattr(config, "mcd_durations"):
+        config.mcd_durations = DurationEstimate(_history_durations())
+    estimate = config.mcd_durations
+    tests = []
+    pool_sizes = {
+        "licensee_account": len(LICENSEE_ACCOUNT_POOL),
+        "switch_outlet_account": len(SWITCH_OUTLET_ACCOUNT_POOL),
+    }
+    leased = {name: 0 for name in LEASE_FIXTURES}
+    for item in items:
+        group = None
+        lease_group = None
+        lease_fixture = _lease_fixture_of(item.fixturenames)
+        if lease_fixture is not None:
+            # One group per pool account: leased tests never queue for an account held by another shard.
+            lease_group = f"{LEASE_FIXTURES[lease_fixture]}_{leased[lease_fixture] % max(pool_sizes[lease_fixture], 1) + 1}"
+            leased[lease_fixture] += 1
+        marker = item.get_closest_marker("xdist_group")
+        if marker is not None:
+            group = str(marker.args[0] if marker.args else marker.kwargs.get("name", "default"))
+        else:
+            group = lease_group
+        role = None
+        if not item.get_closest_marker("fresh_login"):
+            # Leased tests sign in as their pool account, everyone else as their actor's role.
+            role = lease_group or next(
+                (r for name, r in ACTOR_FIXTURE_ROLES.items() if name in item.fixturenames), None
+            )
+        seconds = estimate.seconds(item.nodeid, slow=item.get_closest_marker("slow") is not None)
+        tests.append(ShardTest(item.nodeid, seconds, role=role, group=group))
+    return plan_shards(tests, count)
+
+
+def _history_durations():
+    # Recent average duration per test, or {} when there is no history yet.
+    path = RUN_HISTORY_PATH or DEFAULT_HISTORY_PATH
+    if path.lower() == "off" or not os.path.exists(path):
+        return {}
+    with RunHistory(path) as history:
+        return history.durations()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Prints the shard this run covered, the asset cache hit rate and where the session's time went
+    (full table in `timing.json`).
+    """
+    shard_summary = getattr(config, "mcd_shard_summary", None)
+    if shard_summary:
+        terminalreporter.write_sep("-", shard_summary)
+    if config.asset_cache is not None and config.asset_cache.hit_rate() is not None:
+        terminalreporter.write_sep("-", f"asset cache: {config.asset_cache.describe()}")
+    timing_report = getattr(config, "timing_report", None)
+    if timing_report is not None:
+        timing_report.print_summary(terminalreporter)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Starts the test's wall-time breakdown before any fixture is set up.
+    """
+    if item.config.timing_enabled:
+        item.mcd_timing = TestTiming(PLAYWRIGHT_CLOCK)
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook that captures screenshots after each test execution.
+    Hook that captures a screenshot after each test, following the --mcd-screenshots policy.
     Screenshots are saved in the session-specific output directory.
+    It also attaches the test's time breakdown to its teardown report.
     """
+    timing = getattr(item, "mcd_timing", None)
+    if call.when == "teardown" and timing is not None:
+        # Teardown is the last phase; the report carries the breakdown to the controller (xdist too).
+        item.user_properties.append((TIMING_PROPERTY, timing.finish()))
+
     # Let pytest run the test first, then inspect the result.
     outcome = yield
     rep = outcome.get_result()
 
+    # A replayed test that failed shows which requests were missing from its HAR.
+    har = getattr(item, "mcd_har", None)
+    if rep.failed and har is not None and har.unmatched:
+        rep.sections.append(("HAR replay", har.describe_unmatched()))
+
     # Only proceed if we're in the "call" phase (actual test execution)
     # Only capture screenshots for the test body, not setup/teardown.
     if rep.when != "call":
         return
+    # Skip all artifact work (and its cost) when the policy does not want this report.
+    if not should_capture(item.config.getoption("mcd_screenshots"), rep):
+        return
 
     # Get Playwright page if available
     # Look up the Playwright page fixture if this test uses it.
@@ -79,53 +412,48 @@ def pytest_runtest_makereport(item, call):
 
     # Get the session-wide output directory created in pytest_configure
     # Use the session-scoped output directory created in pytest_configure.
-    test_output_dir = item.config.test_output_dir
-    screenshots_dir = os.path.join(test_output_dir, "screenshots")
-    os.makedirs(screenshots_dir, exist_ok=True)
+    # Under xdist each worker writes to its own subfolder to avoid collisions.
+    screenshots_dir = worker_subdir(item.config, "screenshots")
 
     # Generate safe filename from test nodeid
     # Make a filesystem-safe test name for screenshot files.
-    safe_test_name = (
-        rep.nodeid
-        .replace("/", "_")
-        .replace("::", "__")
-        .replace(".py", "")
-        .replace(" ", "_")
-    )
-    # Put screenshots in a per-test subfolder under the session screenshots dir.
-    test_screenshots_dir = os.path.join(screenshots_dir, safe_test_name)
-    os.makedirs(test_screenshots_dir, exist_ok=True)
-    base_path = os.path.join(test_screenshots_dir, safe_test_name)
+    test_name = safe_test_name(rep.nodeid)
+    # Put screenshots in a per-test subfolder under the session screenshots dir
+    # (the artifact writer creates it when the file is written).
+    base_path = os.path.join(screenshots_dir, test_name, test_name)
+
+    # The settle wait and capture count as artifact time in the test's breakdown.
+    with PLAYWRIGHT_CLOCK.attribute_to("artifacts"):
+        try:
+            # Wait briefly for the DOM to stop changing; networkidle never settles on polling pages.
+            wait_for_dom_stable(page, SCREENSHOT_QUIET_MS, SCREENSHOT_MAX_WAIT_MS)
+        except Exception as e:
+            # E.g. the page was mid-navigation when the test failed: capture it as it is.
+            print(f"⚠️ DOM stability wait skipped for {test_name}: {type(e).__name__}: {e}")
 
     try:
-        # Wait for page stability before screenshot
-        page.wait_for_load_state("networkidle", timeout=10000)
-
-        # Take screenshot on pass or fail
-        if rep.failed:
-            page.screenshot(path=f"{base_path}__FAILED.png", full_page=True)
-            print(f"📸 Screenshot saved: {base_path}__FAILED.png")
-        elif rep.passed:
-            page.screenshot(path=f"{base_path}__PASSED.png", full_page=True)
-            print(f"📸 Screenshot saved: {base_path}__PASSED.png")
+        with PLAYWRIGHT_CLOCK.attribute_to("artifacts"):
+            # Capture raw bytes only; encoding and disk I/O happen on the artifact writer threads.
+            suffix = "__FAILED" if rep.failed else "__PASSED"
+            png_bytes = page.screenshot(full_page=True)
+        saved_path = item.config.artifact_writer.submit_screenshot(f"{base_path}{suffix}", png_bytes)
+        print(f"📸 Screenshot queued: {saved_path}")
 
     except TargetClosedError:
         print(
-            f"⚠️ Skipping screenshot for {safe_test_name} - TargetClosedError (page closed)"
+            f"⚠️ Skipping screenshot for {test_name} - TargetClosedError (page closed)"
         )
     except Exception as e:
-        print(f"⚠️ Screenshot error for {safe_test_name}: {type(e).__name__}: {e}")
+        print(f"⚠️ Screenshot error for {test_name}: {type(e).__name__}: {e}")
 
 
 @pytest.fixture(scope="session")
 def playwright_browser():
     """
     Provides a Playwright browser instance for the entire test session.
-    Set `headless=False` to see the browser UI during tests (useful for debugging).
+    Runs headed unless MCDYNECT_HEADLESS=true (headed is useful for debugging).
     """
     # Read runtime options from env for CI/local toggles.
-    headless_env = os.getenv("MCDYNECT_HEADLESS", "false").strip().lower()
-    headless = headless_env in {"1", "true", "yes", "y"}
     browser_name = os.getenv("MCDYNECT_BROWSER", "chromium").strip().lower()
     launch_env = dict(os.environ)
     # Reduce Crashpad noise and permission errors on macOS.
@@ -143,41 +471,305 @@ def playwright_browser():
         else:
             browser_type = p.chromium
 
-        browser = browser_type.launch(
-            headless=headless,
-            args=[
-                "--disable-crash-reporter",
-                "--disable-crashpad",
-            ],
-            env=launch_env,
-        )
+        # Reuse the warm Chromium from `python -m support.browser_daemon start` when one is running.
+        browser = connect_to_daemon(browser_type) if BROWSER_DAEMON_ENABLED else None
+        if browser is None:
+            browser = browser_type.launch(
+                headless=HEADLESS,
+                args=[
+                    "--disable-crash-reporter",
+                    "--disable-crashpad",
+                ],
+                env=launch_env,
+            )
         yield browser
-        # Always close the shared browser at session end.
+        # Always close the shared browser at session end (a daemon browser is only disconnected).
         browser.close()
 
 
+@pytest.fixture(scope="session")
+def auth_state_cache(playwright_browser, pytestconfig):
+    """
+    Provides the per-role login cache shared by every test in the session.
+    Storage states are written to `test_runs/<timestamp>/auth/<role>.json`.
+    """
+    # Each xdist worker has its own browser and therefore its own sessions.
+    auth_dir = worker_subdir(pytestconfig, "auth")
+    return AuthStateCache(playwright_browser, auth_dir)
+
+
+@pytest.fixture(scope="session")
+def sales_catalog(playwright_browser, pytestconfig):
+    """
+    Provides the catalog of existing sales records per licensee account, crawled once per account.
+    None when MCDYNECT_SALES_CATALOG=false or in HAR runs (the crawl would bypass the recording);
+    tests then read the listing themselves.
+    """
+    if not SALES_CATALOG_ENABLED or pytestconfig.har_mode != "off":
+        return None
+    return SalesCatalog(playwright_browser, str(ROOT_DIR / ".pw_home" / "sales_catalog"), SALES_CATALOG_TTL)
+
+
+# Actor fixture name -> role key in LOGIN_CREDENTIALS, used to pick a cached session.
+ACTOR_FIXTURE_ROLES = {
+    "the_licensee": "licensee",
+    "the_area_manager": "area_manager",
+    "the_inventory": "inventory",
+    "the_procurement": "procurement",
+    "the_production": "production",
+    "the_licensing": "licensing",
+    "the_compliance": "compliance",
+    "the_finance": "finance",
+}
+
+
+def _login_cache_enabled(request) -> bool:
+    # HAR runs log in inside each test so the login traffic is part of that test's recording.
+    if not AUTH_CACHE_ENABLED or request.config.har_mode != "off":
+        return False
+    return not request.node.get_closest_marker("fresh_login")
+
+
+def _cached_role_for(request):
+    """
+    Returns the role whose cached session this test should start with, or None.
+    Tests marked `fresh_login` (or runs with MCDYNECT_AUTH_CACHE=false or --mcd-har) start signed out.
+    """
+    if not _login_cache_enabled(request):
+        return None
+    for fixture_name, role in ACTOR_FIXTURE_ROLES.items():
+        if fixture_name in request.fixturenames:
+            return role
+    return None
+
+
+@pytest.fixture(scope="session")
+def licensee_account_pool(pytestconfig) -> AccountPool:
+    """
+    Provides the pool of licensee accounts (`MCDYNECT_LICENSEE_EMAIL_1..N`).
+    Lock files live in the shared run folder so leases hold across xdist workers.
+    """
+    lease_dir = os.path.join(pytestconfig.test_output_dir, "leases")
+    return AccountPool(LICENSEE_ACCOUNT_POOL, lease_dir, timeout=ACCOUNT_LEASE_TIMEOUT)
+
+
+@pytest.fixture(scope="function")
+def licensee_account(request, licensee_account_pool):
+    """
+    Leases one licensee account exclusively for a test that mutates server state.
+    Blocks until an account is free (MCDYNECT_ACCOUNT_LEASE_TIMEOUT) and releases it afterwards.
+    """
+    lease = licensee_account_pool.acquire(holder=request.node.nodeid)
+    yield lease
+    lease.release()
+
+
+@pytest.fixture(scope="session")
+def switch_outlet_account_pool(pytestconfig) -> AccountPool:
+    """
+    Provides the pool of multi-outlet licensee accounts (`MCDYNECT_SWITCH_OUTLET_EMAIL`, or
+    `MCDYNECT_SWITCH_OUTLET_EMAIL_1..N`). Shares the lock folder with the licensee pool, so an
+    account in both pools is never leased twice.
+    """
+    if not SWITCH_OUTLET_ACCOUNT_POOL:
+        raise RuntimeError("Missing required environment variable for test: MCDYNECT_SWITCH_OUTLET_EMAIL")
+    lease_dir = os.path.join(pytestconfig.test_output_dir, "leases")
+    return AccountPool(
+        SWITCH_OUTLET_ACCOUNT_POOL,
+        lease_dir,
+        timeout=ACCOUNT_LEASE_TIMEOUT,
+        name="switch_outlet",
+        env_prefix="MCDYNECT_SWITCH_OUTLET",
+    )
+
+
+@pytest.fixture(scope="function")
+def switch_outlet_account(request, switch_outlet_account_pool):
+    """
+    Leases one multi-outlet licensee account exclusively, for tests that switch outlets.
+    """
+    lease = switch_outlet_account_pool.acquire(holder=request.node.nodeid)
+    yield lease
+    lease.release()
+
+
+# Fixtures that lease a pool account; a test uses at most one of them.
+LEASE_FIXTURES = {"licensee_account": "account", "switch_outlet_account": "switch_outlet"}
+
+
+def _lease_fixture_of(fixturenames):
+    return next((name for name in LEASE_FIXTURES if name in fixturenames), None)
+
+
+def _cached_session_for(request, auth_state_cache, lease):
+    """
+    Returns the cached session the test's page should start from, or None.
+    A leased pool account takes precedence over the actor's role account.
+    """
+    if lease is not None:
+        if not _login_cache_enabled(request):
+            return None
+        return auth_state_cache.session_for_account(lease.key, lease.email, lease.password)
+    role = _cached_role_for(request)
+    if role is None:
+        return None
+    return auth_state_cache.session_for(role)
+
+
+def _network_policy_for(request) -> NetworkPolicy:
+    """
+    Builds the test's request blocking: `visual` tests block nothing, a `network_policy(mode)`
+    marker picks the mode, and everything else follows --mcd-network-policy.
+    """
+    if request.node.get_closest_marker("visual"):
+        mode = "off"
+    else:
+        marker = request.node.get_closest_marker("network_policy")
+        mode = marker.args[0] if marker else request.config.getoption("mcd_network_policy")
+    return NetworkPolicy(mode, rules_for(mode, BLOCK_URLS))
+
+
 @pytest.fixture(scope="function")
-def page(playwright_browser):
+def page(request, playwright_browser, auth_state_cache):
     """
     Provides a new Playwright Page instance for each test function.
+    The page starts from the cached signed-in state of the test's actor role
+    (or leased account) when available.
     """
-    # Create a fresh page per test to avoid state leaks.
-    page = playwright_browser.new_page()
+    # Take the lease before the page so a blocked lease never holds a browser context open.
+    lease = None
+    lease_fixture = _lease_fixture_of(request.fixturenames)
+    if lease_fixture is not None:
+        lease = request.getfixturevalue(lease_fixture)
+    try:
+        session = _cached_session_for(request, auth_state_cache, lease)
+    except Exception as e:
+        # Fall back to a signed-out page; the test's own Login task will use the form.
+        print(f"⚠️ Login cache unavailable: {e}")
+        session = None
+    har = None
+    if request.config.har_mode != "off":
+        har = HarSession(request.config.har_mode, request.config.har_dir, request.node.nodeid)
+    marker = request.node.get_closest_marker("motion")
+    motion = MotionControl(marker.args[0] if marker else request.config.getoption("mcd_motion"), TOAST_MS)
+    # Create a fresh context per test to avoid state leaks.
+    context = playwright_browser.new_context(
+        storage_state=session.state_path if session else None,
+        **motion.context_options(),
+        **(har.context_options() if har else {}),
+    )
+    motion.attach(context)
+    if har is not None:
+        try:
+            har.attach(context)
+        except FileNotFoundError as e:
+            context.close()
+            pytest.fail(str(e), pytrace=False)
+        request.node.mcd_har = har
+    if request.config.asset_cache is not None:
+        request.config.asset_cache.attach(context)
+    # Attached last so blocked requests never reach the asset cache, the HAR or the network.
+    network_policy = _network_policy_for(request).attach(context)
+    # Actor fixtures read this to tell the Login task which session is already active.
+    request.node.mcd_role_session = session
+    page = context.new_page()
+    # Dismiss the "Maybe Later" modal whenever it blocks an action; free when it never shows.
+    maybe_later = OverlayDismisser.maybe_later().install(page)
     yield page
-    # Ensure pages are closed even if tests fail.
-    page.close()
+    if maybe_later.fired:
+        # Shows up per test in results.json.
+        request.node.user_properties.append((f"{maybe_later.name}_dismissed", maybe_later.fired))
+    # Animation time skipped (or spent, in "full" mode); the timing report sums it per run.
+    request.node.user_properties.append((MOTION_PROPERTY, motion.summary()))
+    if network_policy.blocked:
+        # Rule name -> blocked request count, per test in results.json.
+        request.node.user_properties.append(("blocked_requests", network_policy.blocked))
+    if har is not None and har.unmatched:
+        print(f"⚠️ HAR replay: {har.describe_unmatched()}")
+        request.node.user_properties.append(("har_unmatched", len(har.unmatched)))
+    # Ensure pages and their contexts are closed even if tests fail (this also writes a recorded HAR).
+    context.close()
 
 
 # --- Actor Fixtures ---
-# Each fixture initializes a specific Actor and grants them the BrowseTheWeb ability.
+# Each fixture initializes a specific Actor and grants them the BrowseTheWeb and ControlTheClock abilities
+# and the CallAnAPI ability (used by Login/LoginAs to sign in over HTTP, except in HAR runs).
 # This allows tests to simply request `the_licensee` (or `the_area_manager`, etc.)
 # without needing to set up the actor in every test.
 
 from config.credentials import LOGIN_CREDENTIALS
 
 
+def _browse_the_web(request, page: Page) -> BrowseTheWeb:
+    # Grant the browser ability and note any cached session the page started with.
+    ability = BrowseTheWeb.with_browser_page(page)
+    policy = request.config.getoption("mcd_session_drop")
+    if policy != "off":
+        guard = SessionGuard(page, policy, sign_in=_sign_in_again(request, page)).install()
+        ability.guard_session(guard)
+
+        def report_session_drops():
+            # Each drop, where it happened and how it ended, per test in results.json.
+            if guard.events:
+                request.node.user_properties.append((SESSION_DROP_PROPERTY, guard.events))
+
+        request.addfinalizer(report_session_drops)
+    session = getattr(request.node, "mcd_role_session", None)
+    if session is not None:
+        ability.remember_sign_in(session.email, session.landing_url)
+        # A session the server has expired is dropped, so later tests sign in again.
+        cache = request.getfixturevalue("auth_state_cache")
+        ability.on_cached_session_expired = lambda: cache.invalidate(session.role)
+    return ability
+
+
+def _sign_in_again(request, page: Page):
+    # Fallback for the session guard when restoring the cookies is not enough: a fresh HTTP login.
+    if request.config.har_mode != "off":
+        return None
+
+    def sign_in(email: str) -> bool:
+        known = list(LOGIN_CREDENTIALS.values()) + LICENSEE_ACCOUNT_POOL + SWITCH_OUTLET_ACCOUNT_POOL
+        password = next((creds["password"] for creds in known if creds.get("email") == email), None)
+        if not password:
+            return False
+        try:
+            return CallAnAPI.with_browser_page(page).sign_in(email, password) is not None
+        except Exception as e:
+            print(f"⚠️ Signing {email} back in failed: {type(e).__name__}: {e}")
+            return False
+
+    return sign_in
+
+
+def _control_the_clock(request, page: Page) -> ControlTheClock:
+    # Tests marked `clock` get the controllable clock before their first navigation, optionally pinned.
+    ability = ControlTheClock.with_browser_page(page)
+    marker = request.node.get_closest_marker("clock")
+    if marker is not None:
+        ability.install(_clock_start(marker))
+    return ability
+
+
+def _clock_start(marker):
+    # `today_at="09:00"` pins today's date at a fixed time, so the live backend agrees on the date.
+    today_at = marker.kwargs.get("today_at")
+    if today_at is not None:
+        return datetime.fromisoformat(f"{datetime.now().date().isoformat()}T{today_at}")
+    return marker.args[0] if marker.args else marker.kwargs.get("start")
+
+
+def _grant_abilities(actor: Actor, request, page: Page) -> Actor:
+    actor.who_can(_browse_the_web(request, page))
+    actor.who_can(_control_the_clock(request, page))
+    # API requests bypass HAR recording and replay, so HAR runs sign in through the page instead.
+    if request.config.har_mode == "off":
+        actor.who_can(CallAnAPI.with_browser_page(page))
+    return actor
+
+
 @pytest.fixture(scope="function")
-def the_licensee(page: Page) -> Licensee:
+def the_licensee(request, page: Page) -> Licensee:
     creds = LOGIN_CREDENTIALS["licensee"]
     # Store credentials on the actor so tasks can access them.
     actor = Licensee(
@@ -185,50 +777,51 @@ def the_licensee(page: Page) -> Licensee:
         password=creds["password"],
     )
     actor.current_password = creds.get("current_password", creds["password"])
-    # Grant the browser ability used by tasks and questions.
-    actor.who_can(BrowseTheWeb.with_browser_page(page))
-    return actor
+    # Grant the browser ability used by tasks and questions, plus HTTP for the fast login.
+    return _grant_abilities(actor, request, page)
 
 
 @pytest.fixture(scope="function")
-def the_area_manager(page: Page) -> AreaManager:
-    return AreaManager().who_can(BrowseTheWeb.with_browser_page(page))
+def the_area_manager(request, page: Page) -> AreaManager:
+    return _grant_abilities(AreaManager(), request, page)
 
 
 @pytest.fixture(scope="function")
-def the_inventory(page: Page) -> Inventory:
-    return Inventory().who_can(BrowseTheWeb.with_browser_page(page))
+def the_inventory(request, page: Page) -> Inventory:
+    return _grant_abilities(Inventory(), request, page)
 
 
 @pytest.fixture(scope="function")
-def the_procurement(page: Page) -> Procurement:
-    return Procurement().who_can(BrowseTheWeb.with_browser_page(page))
+def the_procurement(request, page: Page) -> Procurement:
+    return _grant_abilities(Procurement(), request, page)
 
 
 @pytest.fixture(scope="function")
-def the_production(page: Page) -> Production:
-    return Production().who_can(BrowseTheWeb.with_browser_page(page))
+def the_production(request, page: Page) -> Production:
+    return _grant_abilities(Production(), request, page)
 
 
 @pytest.fixture(scope="function")
-def the_licensing(page: Page) -> Licensing:
-    return Licensing().who_can(BrowseTheWeb.with_browser_page(page))
+def the_licensing(request, page: Page) -> Licensing:
+    return _grant_abilities(Licensing(), request, page)
 
 
 @pytest.fixture(scope="function")
-def the_compliance(page: Page) -> Compliance:
-    return Compliance().who_can(BrowseTheWeb.with_browser_page(page))
+def the_compliance(request, page: Page) -> Compliance:
+    return _grant_abilities(Compliance(), request, page)
 
 
 @pytest.fixture(scope="function")
-def the_finance(page: Page) -> Finance:
-    return Finance().who_can(BrowseTheWeb.with_browser_page(page))
+def the_finance(request, page: Page) -> Finance:
+    return _grant_abilities(Finance(), request, page)
 
 
 # --- How to add a new Actor Fixture ---
 # 1. Ensure the Actor class is defined in `actors/` and imported here.
 # 2. Add a new fixture function:
 #    `@pytest.fixture(scope="function")`
-#    `def the_new_actor_role(page: Page) -> NewActorRole:`
-#        `return NewActorRole().who_can(BrowseTheWeb.with_browser_page(page))`
+#    `def the_new_actor_role(request, page: Page) -> NewActorRole:`
+#        `return _grant_abilities(NewActorRole(), request, page)`
 #    (Replace `NewActorRole` with your actual actor class name).
+# 3. Map the fixture name to its LOGIN_CREDENTIALS role in `ACTOR_FIXTURE_ROLES`
+#    so the fixture can start from a cached signed-in session.
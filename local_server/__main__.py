@@ -0,0 +1,39 @@
+"""
+Runs the stand-in MCDynect server: `python -m local_server [--port 8000] [--latency-ms 0]`.
+Point the suite at it with `python -m local_server --print-env > .env` (or export the printed lines).
+"""
+import argparse
+
+from .app import StandInServer
+from .data import suite_env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m local_server", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response.")
+    parser.add_argument("--verbose", action="store_true", help="Log every request.")
+    parser.add_argument(
+        "--print-env", action="store_true", help="Print the MCDYNECT_* settings for this server and exit."
+    )
+    args = parser.parse_args()
+
+    base_url = f"http://{args.host}:{args.port}"
+    if args.print_env:
+        for key, value in suite_env(base_url).items():
+            print(f"{key}={value}")
+        return
+
+    server = StandInServer(args.host, args.port, args.latency_ms, args.verbose)
+    print(f"MCDynect stand-in server on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+This module implements the stand-in MCDynect HTTP server on the standard library's ThreadingHTTPServer.
+It speaks just enough of the real application's protocol for the suite: Laravel-style CSRF login with
+XSRF-TOKEN/session cookies, redirects to role dashboards, server-rendered pages and a small JSON API.
+"""
+import json
+import secrets
+import threading
+import time
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from . import pages
+from .data import SALES_CHANNELS, WEEKDAYS, Store
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+SESSION_COOKIE = "mcdynect_session"
+LOGIN_ERROR = "These credentials do not match our records."
+
+# Role dashboards other than the licensee's: path -> card title.
+ROLE_DASHBOARD_TITLES = {
+    "/area-manager/dashboard": "Area overview",
+    "/inventory/index": "Inventory Dashboard",
+    "/procurement/dashboard": "Procurement Dashboard",
+    "/production/dashboard": "Production Dashboard",
+    "/licensing/dashboard": "Licensing Dashboard",
+    "/compliance/index": "Compliance Dashboard",
+    "/finance/index": "Finance Dashboard",
+}
+
+# Licensee pages that need no state: path -> (heading, extra lines).
+STATIC_LICENSEE_PAGES = {
+    "/licensee/order/index": ("Order Stock", ("Redeemable items",)),
+    "/licensee/trade-in": ("Trade In", ("Create Trade In", "Trade In No.")),
+    "/licensee/application-form/event/index": ("Event participant", ("Event participant application",)),
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(message)
+        self.status = status
+        self.message = message or HTTPStatus(status).phrase
+
+
+class Redirect(Exception):
+    def __init__(self, location: str):
+        super().__init__(location)
+        self.location = location
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Routes one request. The Store is shared through the server instance (`self.server.store`).
+    """
+
+    server_version = "MCDynectStandIn/1.0"
+    protocol_version = "HTTP/1.1"
+
+    # Routing ------------------------------------------------------------------------------------
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+        url = urlsplit(self.path)
+        self.query = parse_qs(url.query)
+        self._new_cookies: Dict[str, str] = {}
+        # Read the body up front so early errors never leave bytes on a keep-alive connection.
+        length = int(self.headers.get("Content-Length") or 0)
+        self.raw_body = self.rfile.read(length) if length else b""
+        path = url.path.rstrip("/") or "/"
+        try:
+            with self.server.store.lock:
+                self.session_id, self.session = self._load_session()
+                handler, args = self._route(method, path)
+                handler(*args)
+        except Redirect as redirect:
+            self._send(HTTPStatus.FOUND, b"", "text/html", {"Location": redirect.location})
+        except HttpError as error:
+            if path.startswith("/api/"):
+                self._send_json({"message": error.message}, error.status)
+            else:
+                self._send_html(pages.document(error.message, pages.simple_page(error.message)), error.status)
+
+    def _route(self, method: str, path: str) -> Tuple[Callable, tuple]:
+        parts = path.strip("/").split("/")
+        if method == "GET" and path.startswith("/static/"):
+            return self.static_file, (path[len("/static/"):],)
+        if path == "/login":
+            return (self.login_form if method == "GET" else self.login), ()
+        if method == "POST" and path == "/logout":
+            return self.logout, ()
+        if method == "GET" and path == "/":
+            return self.home, ()
+        if path.startswith("/api/licensee/"):
+            return self.api, (method, parts[2:])
+        if method == "GET" and path in ROLE_DASHBOARD_TITLES:
+            return self.role_dashboard, (path,)
+        if parts[0] == "licensee":
+            return self.licensee_page, (method, path, parts[1:])
+        raise HttpError(HTTPStatus.NOT_FOUND)
+
+    # Sessions -----------------------------------------------------------------------------------
+
+    def _load_session(self) -> Tuple[str, dict]:
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        session_id = cookies[SESSION_COOKIE].value if SESSION_COOKIE in cookies else ""
+        session = self.server.store.sessions.get(session_id)
+        if session is None:
+            session_id = secrets.token_hex(16)
+            session = {"email": None, "csrf": secrets.token_hex(20), "flash": None, "seen_modal": False}
+            self.server.store.sessions[session_id] = session
+            self._new_cookies[SESSION_COOKIE] = session_id
+            self._new_cookies["XSRF-TOKEN"] = quote(session["csrf"])
+        return session_id, session
+
+    def _regenerate_session(self, email: Optional[str]) -> None:
+        # Like Laravel, sign-in and sign-out issue a new session id and CSRF token.
+        self.server.store.sessions.pop(self.session_id, None)
+        self.session_id = secrets.token_hex(16)
+        self.session = {"email": email, "csrf": secrets.token_hex(20), "flash": None, "seen_modal": False}
+        self.server.store.sessions[self.session_id] = self.session
+        self._new_cookies[SESSION_COOKIE] = self.session_id
+        self._new_cookies["XSRF-TOKEN"] = quote(self.session["csrf"])
+
+    def _account(self):
+        email = self.session["email"]
+        if not email:
+            raise Redirect("/login")
+        return self.server.store.accounts[email]
+
+    def _licensee(self):
+        account = self._account()
+        if account.role != "licensee":
+            raise HttpError(HTTPStatus.FORBIDDEN)
+        return account, self.server.store.licensee(account.email)
+
+    def _check_csrf(self, form: Optional[dict] = None) -> None:
+        token = (form or {}).get("_token") or unquote(self.headers.get("X-XSRF-TOKEN", ""))
+        if not secrets.compare_digest(token or "", self.session["csrf"]):
+            raise HttpError(419, "Page Expired")
+
+    # Request bodies -----------------------------------------------------------------------------
+
+    def _form(self) -> Dict[str, str]:
+        return {key: values[-1] for key, values in parse_qs(self.raw_body.decode("utf-8")).items()}
+
+    def _json(self) -> dict:
+        try:
+            return json.loads(self.raw_body) if self.raw_body else {}
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed JSON body.")
+
+    # Responses ----------------------------------------------------------------------------------
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[dict] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for name, value in self._new_cookies.items():
+            http_only = "; HttpOnly" if name == SESSION_COOKIE else ""
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/; SameSite=Lax{http_only}")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_html(self, html: str, status: int = HTTPStatus.OK) -> None:
+        self._send(status, html.encode("utf-8"), "text/html; charset=utf-8")
+
+    def _send_json(self, payload, status: int = HTTPStatus.OK) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send_page(self, title: str, content: str, modals: str = "") -> None:
+        account = self._account()
+        self._send_html(pages.layout(title, content, self.session["csrf"], account.code, account.role, modals))
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # Pages --------------------------------------------------------------------------------------
+
+    def static_file(self, name: str) -> None:
+        file_path = (STATIC_DIR / name).resolve()
+        if STATIC_DIR not in file_path.parents or not file_path.is_file():
+            raise HttpError(HTTPStatus.NOT_FOUND)
+        self._send(HTTPStatus.OK, file_path.read_bytes(), "application/javascript; charset=utf-8")
+
+    def login_form(self) -> None:
+        if self.session["email"]:
+            raise Redirect(self._account().dashboard_path)
+        error, self.session["flash"] = self.session["flash"], None
+        self._send_html(pages.login_page(self.session["csrf"], error))
+
+    def login(self) -> None:
+        form = self._form()
+        self._check_csrf(form)
+        account = self.server.store.authenticate(form.get("email", ""), form.get("password", ""))
+        if account is None:
+            self.session["flash"] = LOGIN_ERROR
+            raise Redirect("/login")
+        self._regenerate_session(account.email)
+        raise Redirect(account.dashboard_path)
+
+    def logout(self) -> None:
+        self._check_csrf(self._form())
+        self._regenerate_session(None)
+        raise Redirect("/login")
+
+    def home(self) -> None:
+        raise Redirect(self._account().dashboard_path)
+
+    def role_dashboard(self, path: str) -> None:
+        account = self._account()
+        if account.dashboard_path != path:
+            raise Redirect(account.dashboard_path)
+        self._send_page(ROLE_DASHBOARD_TITLES[path], pages.role_dashboard(ROLE_DASHBOARD_TITLES[path], account.code))
+
+    def licensee_page(self, method: str, path: str, parts: list) -> None:
+        account, state = self._licensee()
+        if method == "POST":
+            return self.save_sale(state, parts)
+        if path == "/licensee/dashboard":
+            show_modal = not self.session["seen_modal"]
+            self.session["seen_modal"] = True
+            content, modals = pages.licensee_dashboard(
+                account.code, self.server.store.snapshot(account.email), show_modal
+            )
+            return self._send_page("Dashboard", content, modals)
+        if path in STATIC_LICENSEE_PAGES:
+            heading, lines = STATIC_LICENSEE_PAGES[path]
+            return self._send_page(heading, pages.simple_page(heading, lines))
+        if path == "/licensee/sales/index":
+            tab = "extra" if self.query.get("tab") == ["extra"] else "daily"
+            sales = sorted(state.sales, key=lambda sale: sale["date"], reverse=True)
+            return self._send_page("Sales", pages.sales_index(sales, tab))
+        if path == "/licensee/sales/create":
+            return self._send_page("Add Sale", pages.sales_form("daily", self.session["csrf"]))
+        if path == "/licensee/sales/extra/create":
+            return self._send_page("Add Extra Sets", pages.sales_form("extra", self.session["csrf"]))
+        if parts[:2] == ["sales", "show"] and len(parts) == 3:
+            return self._send_page("Sale details", *pages.sales_details(self._sale(state, parts[2])))
+        if parts[0] == "sales" and len(parts) == 3 and parts[2] == "edit":
+            sale = self._sale(state, parts[1])
+            return self._send_page("Edit Sales", pages.sales_form(sale["kind"], self.session["csrf"], sale))
+        if path == "/licensee/staff/index":
+            return self._send_page("Staff Directory", *pages.staff_index(state.staff))
+        if path == "/licensee/announcement/index":
+            return self._send_page("Announcements", pages.announcements_index())
+        if parts[0] == "announcement" and len(parts) == 2 and parts[1].isdigit():
+            return self._send_page("Announcement", pages.announcement(int(parts[1])))
+        if path == "/licensee/application-form/index":
+            return self._send_page("Applications", *pages.application_forms())
+        if path == "/licensee/profile":
+            return self._send_page("Settings", pages.profile(state.name, account.email))
+        raise HttpError(HTTPStatus.NOT_FOUND)
+
+    def save_sale(self, state, parts: list) -> None:
+        form = self._form()
+        self._check_csrf(form)
+        amounts = {channel: self._int(form.get(channel)) for channel in SALES_CHANNELS}
+        kg_sold = self._int(form.get("kg_sold"))
+        if parts[0] == "sales" and len(parts) == 3 and parts[2] == "edit":
+            sale = self._sale(state, parts[1])
+            sale["amounts"].update(amounts)
+            sale["kg_sold"] = kg_sold
+            sale["date"] = form.get("date") or sale["date"]
+            raise Redirect(f"/licensee/sales/show/{sale['id']}")
+        if parts not in (["sales", "create"], ["sales", "extra", "create"]):
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+        if not form.get("date"):
+            raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "The date field is required.")
+        kind = "extra" if parts[1] == "extra" else "daily"
+        sale = state.add_sale(kind, form["date"], amounts, kg_sold)
+        if form.get("closed"):
+            sale["status"] = "Completed"
+        raise Redirect("/licensee/sales/index" + ("?tab=extra" if kind == "extra" else ""))
+
+    @staticmethod
+    def _int(value: Optional[str]) -> int:
+        try:
+            return max(int(float(value)), 0)
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _sale(state, sale_id: str) -> dict:
+        sale = state.sale(int(sale_id)) if sale_id.isdigit() else None
+        if sale is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, "Sale record not found.")
+        return sale
+
+    # JSON API -----------------------------------------------------------------------------------
+
+    def api(self, method: str, parts: list) -> None:
+        if not self.session["email"]:
+            raise HttpError(HTTPStatus.UNAUTHORIZED, "Unauthenticated.")
+        account, state = self._licensee()
+        if method != "GET":
+            self._check_csrf()
+        store = self.server.store
+        body = self._json() if method in ("POST", "PUT") else {}
+
+        if method == "GET" and parts == ["dashboard"]:
+            return self._send_json(store.snapshot(account.email))
+        if method == "POST" and parts == ["outlets", "switch"]:
+            if body.get("outlet") not in state.outlets:
+                raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "Unknown outlet.")
+            state.current_outlet = body["outlet"]
+            return self._send_json(store.snapshot(account.email))
+        if method == "POST" and parts[:1] == ["opening-days"] and len(parts) == 3 and parts[1] in WEEKDAYS:
+            day = state.opening_days[parts[1]]
+            if parts[2] == "toggle":
+                day["open"] = not day["open"]
+            elif parts[2] == "hours":
+                day["opens_at"] = body.get("opens_at") or day["opens_at"]
+                day["closes_at"] = body.get("closes_at") or day["closes_at"]
+            else:
+                raise HttpError(HTTPStatus.NOT_FOUND)
+            return self._send_json(store.snapshot(account.email))
+        if method == "GET" and parts == ["sales"]:
+            return self._send_json(state.sales)
+        if method == "DELETE" and parts[:1] == ["sales"] and len(parts) == 2:
+            state.sales.remove(self._sale(state, parts[1]))
+            return self._send_json({"message": "Sale record deleted."})
+        if method == "GET" and parts == ["staff"]:
+            return self._send_json(state.staff)
+        if method == "POST" and parts == ["staff"]:
+            if not body.get("name"):
+                raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "The name field is required.")
+            member = state.add_staff(body["name"], body.get("phone", ""), body.get("start_date", ""))
+            return self._send_json(member, HTTPStatus.CREATED)
+        if method == "PUT" and parts[:1] == ["staff"] and len(parts) == 2:
+            member = next((m for m in state.staff if str(m["id"]) == parts[1]), None)
+            if member is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, "Staff member not found.")
+            member.update({key: body[key] for key in ("name", "phone", "start_date") if body.get(key)})
+            return self._send_json(member)
+        if method == "POST" and parts == ["profile"]:
+            if not body.get("name"):
+                raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "The name field is required.")
+            state.name = body["name"]
+            return self._send_json({"message": "Saved"})
+        if method == "POST" and parts == ["password"]:
+            if body.get("current_password") != account.password:
+                raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "The password is incorrect.")
+            if not body.get("password") or body["password"] != body.get("password_confirmation"):
+                raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, "The password confirmation does not match.")
+            account.password = body["password"]
+            return self._send_json({"message": "Saved"})
+        raise HttpError(HTTPStatus.NOT_FOUND)
+
+
+class StandInServer:
+    """
+    Runs the stand-in server on a background thread, e.g. from a fixture or a benchmark script:
+
+        with StandInServer(port=0) as server:
+            os.environ.update(suite_env(server.base_url))
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8000, latency_ms: float = 0, verbose: bool = False):
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = Store()
+        self.httpd.latency_ms = latency_ms
+        self.httpd.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mcdynect-stand-in", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
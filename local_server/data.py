@@ -0,0 +1,186 @@
+"""
+This module holds the stand-in server's accounts and the in-memory state behind every page.
+Each licensee account gets its own outlets, opening days, staff and sales, so tests on
+different (leased) accounts never see each other's changes.
+"""
+import copy
+import itertools
+import threading
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+# Password accepted for every seeded account.
+DEFAULT_PASSWORD = "password"
+
+# Role key (as in LOGIN_CREDENTIALS) -> (email, dashboard path, user code shown in "Welcome Back, <code>").
+ROLE_ACCOUNTS = {
+    "licensee": ("licensee@mcdynect.local", "/licensee/dashboard", "L23#304"),
+    "area_manager": ("area-manager@mcdynect.local", "/area-manager/dashboard", "HQO#05"),
+    "inventory": ("inventory@mcdynect.local", "/inventory/index", "INV#01"),
+    "procurement": ("procurement@mcdynect.local", "/procurement/dashboard", "PRC#01"),
+    "production": ("production@mcdynect.local", "/production/dashboard", "PRD#01"),
+    "licensing": ("licensing@mcdynect.local", "/licensing/dashboard", "LCS#01"),
+    "compliance": ("compliance@mcdynect.local", "/compliance/index", "CMP#01"),
+    "finance": ("finance@mcdynect.local", "/finance/index", "FIN#01"),
+}
+
+# Extra licensee accounts: the multi-outlet account and the lease pool (MCDYNECT_LICENSEE_EMAIL_<n>).
+SWITCH_OUTLET_EMAIL = "multi-outlet@mcdynect.local"
+POOL_SIZE = 3
+POOL_EMAILS = [f"licensee{n}@mcdynect.local" for n in range(1, POOL_SIZE + 1)]
+
+# The licensee password the suite uses as "current password" in the negative password test.
+WRONG_CURRENT_PASSWORD = "not-the-password"
+
+OUTLETS = ("Cyberjaya", "Putrajaya", "Bangi")
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+SALES_CHANNELS = ("cash", "online", "grabfood", "shopeefood", "foodpanda", "misi", "haloje")
+SEED_STAFF = ("Aisyah Rahman", "Daniel Lim", "Kavitha Nair")
+
+ANNOUNCEMENTS = (
+    (1, "Ramadan operating hours", "Outlets may close one hour earlier during Ramadan."),
+    (2, "New churros dip flavour", "Salted caramel dip is available for ordering from next week."),
+    (3, "System maintenance", "MCDynect will be unavailable on Sunday 2am-4am."),
+)
+APPLICATIONS = (("EVN-0001", "Event participant", "Pending"),)
+
+
+class Account:
+    """
+    A user that can sign in to the stand-in server.
+    """
+
+    def __init__(self, email: str, role: str, dashboard_path: str, code: str):
+        self.email = email
+        self.role = role
+        self.dashboard_path = dashboard_path
+        self.code = code
+        self.password = DEFAULT_PASSWORD
+
+
+def seed_accounts() -> Dict[str, Account]:
+    accounts = {
+        email: Account(email, role, path, code) for role, (email, path, code) in ROLE_ACCOUNTS.items()
+    }
+    licensee_path = ROLE_ACCOUNTS["licensee"][1]
+    for index, email in enumerate([SWITCH_OUTLET_EMAIL] + POOL_EMAILS):
+        accounts[email] = Account(email, "licensee", licensee_path, f"L23#{310 + index}")
+    return accounts
+
+
+class LicenseeState:
+    """
+    Everything a licensee account can see and change.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str):
+        self.name = name
+        self.outlets = list(OUTLETS)
+        self.current_outlet = OUTLETS[0]
+        self.opening_days = {
+            day: {"open": day != "Sunday", "opens_at": "10:00", "closes_at": "22:00"} for day in WEEKDAYS
+        }
+        self.staff = [
+            {"id": next(self._ids), "name": name, "phone": f"01{2345670 + i}", "start_date": "2025-01-06"}
+            for i, name in enumerate(SEED_STAFF)
+        ]
+        self.sales = self._seed_sales()
+
+    def _seed_sales(self) -> List[dict]:
+        today = date.today()
+        statuses = ("Submitted", "Not filled", "Completed", "Pending", "Not complete")
+        sales = []
+        for offset in range(1, 8):
+            status = statuses[offset % len(statuses)]
+            sales.append(self._sale("daily", today - timedelta(days=offset), status, 120 + offset * 15))
+        sales.append(self._sale("extra", today - timedelta(days=3), "Submitted", 60))
+        return sales
+
+    def _sale(self, kind: str, day: date, status: str, cash: int) -> dict:
+        filled = status != "Not filled"
+        amounts = {channel: 0 for channel in SALES_CHANNELS}
+        if filled:
+            amounts.update(cash=cash, online=cash // 4, grabfood=cash // 5)
+        return {
+            "id": next(self._ids),
+            "kind": kind,
+            "date": day.isoformat(),
+            "status": status,
+            "kg_sold": 12 if filled else 0,
+            "unsold_sets": 2 if kind == "extra" else 0,
+            "amounts": amounts,
+        }
+
+    def sale(self, sale_id: int) -> Optional[dict]:
+        return next((sale for sale in self.sales if sale["id"] == sale_id), None)
+
+    def add_sale(self, kind: str, day: str, amounts: Dict[str, int], kg_sold: int) -> dict:
+        sale = self._sale(kind, date.fromisoformat(day), "Submitted", 0)
+        sale["amounts"].update(amounts)
+        sale["kg_sold"] = kg_sold
+        self.sales.append(sale)
+        return sale
+
+    def add_staff(self, name: str, phone: str, start_date: str) -> dict:
+        member = {"id": next(self._ids), "name": name, "phone": phone, "start_date": start_date}
+        self.staff.append(member)
+        return member
+
+
+class Store:
+    """
+    Thread-safe state for the whole server. Handlers hold `store.lock` while reading or changing it.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.accounts = seed_accounts()
+        self._licensees: Dict[str, LicenseeState] = {}
+        # Session id -> {"email", "csrf", "flash", "seen_modal"}.
+        self.sessions: Dict[str, dict] = {}
+
+    def licensee(self, email: str) -> LicenseeState:
+        if email not in self._licensees:
+            self._licensees[email] = LicenseeState(self.accounts[email].code)
+        return self._licensees[email]
+
+    def authenticate(self, email: str, password: str) -> Optional[Account]:
+        account = self.accounts.get(email.strip().lower())
+        if account is None or account.password != password:
+            return None
+        return account
+
+    def snapshot(self, email: str) -> dict:
+        """
+        JSON-ready copy of a licensee's dashboard data.
+        """
+        state = self.licensee(email)
+        return copy.deepcopy(
+            {
+                "outlets": [{"name": name, "current": name == state.current_outlet} for name in state.outlets],
+                "opening_days": [{"day": day, **hours} for day, hours in state.opening_days.items()],
+                "staff": state.staff,
+            }
+        )
+
+
+def suite_env(base_url: str) -> Dict[str, str]:
+    """
+    The MCDYNECT_* settings that point the suite at a stand-in server on `base_url`.
+    """
+    env = {"MCDYNECT_BASE_URL": base_url, "MCDYNECT_HEADLESS": "true", "MCDYNECT_BROWSER": "chromium"}
+    for role, (email, path, _) in ROLE_ACCOUNTS.items():
+        prefix = f"MCDYNECT_{role.upper()}"
+        env[f"{prefix}_EMAIL"] = email
+        env[f"{prefix}_PASSWORD"] = DEFAULT_PASSWORD
+        env[f"{prefix}_DASHBOARD_URL"] = f"{base_url}{path}"
+    env["MCDYNECT_LICENSEE_CURRENT_PASSWORD"] = WRONG_CURRENT_PASSWORD
+    env["MCDYNECT_LICENSEE_NEW_PASSWORD"] = "new-password"
+    env["MCDYNECT_SWITCH_OUTLET_EMAIL"] = SWITCH_OUTLET_EMAIL
+    env["MCDYNECT_SWITCH_OUTLET_PASSWORD"] = DEFAULT_PASSWORD
+    for n, email in enumerate(POOL_EMAILS, start=1):
+        env[f"MCDYNECT_LICENSEE_EMAIL_{n}"] = email
+        env[f"MCDYNECT_LICENSEE_PASSWORD_{n}"] = DEFAULT_PASSWORD
+    return env
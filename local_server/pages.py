@@ -0,0 +1,326 @@
+"""
+This module renders the stand-in server's HTML pages.
+Markup mirrors the MCDynect structure the locators in `ui/`, `config/selectors.py` and the tests rely on
+(class names, roles, button texts, modal titles); it is not meant to look like the real application.
+"""
+import json
+from html import escape
+from typing import Iterable, List, Optional
+
+from .data import ANNOUNCEMENTS, APPLICATIONS, SALES_CHANNELS
+
+# Channel field id -> label, in the order the sales forms show them.
+CHANNEL_LABELS = {
+    "cash": "Cash",
+    "online": "Online (QR)",
+    "grabfood": "GrabFood",
+    "shopeefood": "ShopeeFood",
+    "foodpanda": "Foodpanda",
+    "misi": "Misi Delivery",
+    "haloje": "Haloje",
+}
+
+_STYLE = """
+body { font-family: sans-serif; margin: 0; display: flex; min-height: 100vh; }
+aside { width: 200px; background: #f4f4f4; padding: 16px; display: flex; flex-direction: column; }
+aside .border-t { margin-top: auto; border-top: 1px solid #ccc; padding-top: 8px; }
+header { display: flex; justify-content: flex-end; padding: 8px 16px; border-bottom: 1px solid #ddd; position: relative; }
+main { flex: 1; display: flex; flex-direction: column; }
+section.content { padding: 16px; }
+.rounded { border: 1px solid #ddd; border-radius: 8px; padding: 12px; margin: 12px 0; background: #fff; }
+.flex { display: flex; } .justify-between { justify-content: space-between; } .items-center { align-items: center; }
+.px-2 { padding-left: 8px; padding-right: 8px; }
+.menu { position: absolute; right: 16px; top: 44px; background: #fff; border: 1px solid #ccc; }
+.modal { position: fixed; top: 80px; left: 30%; width: 40%; z-index: 10; box-shadow: 0 4px 24px #0003; }
+.text-error-500 { color: #c00; } .toast { position: fixed; bottom: 16px; right: 16px; }
+[hidden] { display: none !important; }
+"""
+
+
+def _attr(value) -> str:
+    return escape(str(value), quote=True)
+
+
+def document(title: str, body: str, csrf: str = "") -> str:
+    """
+    Wraps a page body in the shared <head> (CSRF meta tag, styles, app.js).
+    """
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="csrf-token" content="{_attr(csrf)}">
+<title>{escape(title)} - MCDynect</title>
+<style>{_STYLE}</style>
+<script src="/static/app.js" defer></script>
+</head>
+<body>
+{body}
+</body>
+</html>"""
+
+
+def login_page(csrf: str, error: Optional[str] = None) -> str:
+    error_html = f'<p class="text-error-500">{escape(error)}</p>' if error else ""
+    body = f"""<main><section class="content">
+<h1>Sign in to MCDynect</h1>
+<form method="post" action="/login">
+  <input type="hidden" name="_token" value="{_attr(csrf)}">
+  <label for="email">Email</label>
+  <input id="email" name="email" type="email" placeholder="me@example.com" autocomplete="username">
+  <label for="password">Password</label>
+  <input id="password" name="password" type="password" autocomplete="current-password">
+  {error_html}
+  <button type="submit">Sign in</button>
+</form>
+</section></main>"""
+    return document("Login", body, csrf)
+
+
+def layout(title: str, content: str, csrf: str, code: str, role: str, modals: str = "") -> str:
+    """
+    Signed-in page: sidebar, header with the account menu, content, then modals (last in the DOM).
+    """
+    sales_link = '<a href="/licensee/sales/index">Sales</a>' if role == "licensee" else ""
+    settings_href = "/licensee/profile" if role == "licensee" else "#"
+    body = f"""<aside>
+  <a href="/">Home</a>
+  {sales_link}
+  <div class="border-t">
+    <form method="post" action="/logout" id="logout-form"><input type="hidden" name="_token" value="{_attr(csrf)}"></form>
+    <button type="button" aria-label="Sign out" data-action="logout">&#x23FB;</button>
+  </div>
+</aside>
+<main>
+  <header>
+    <button type="button" aria-haspopup="menu" data-action="toggle-menu">{escape(code)}</button>
+    <div class="menu" role="menu" hidden>
+      <a role="menuitem" href="{settings_href}">Settings</a>
+      <button type="button" role="menuitem" data-action="logout">Log out</button>
+    </div>
+  </header>
+  <section class="content">
+{content}
+  </section>
+</main>
+{modals}"""
+    return document(title, body, csrf)
+
+
+def modal(name: str, title: str, inner: str, heading: str = "h2") -> str:
+    return f"""<div class="modal rounded" data-modal="{_attr(name)}" role="dialog" hidden>
+  <{heading}>{escape(title)}</{heading}>
+{inner}
+</div>"""
+
+
+def role_dashboard(title: str, code: str) -> str:
+    return f"""<h1>Welcome Back, {escape(code)}</h1>
+<div class="rounded"><h2>{escape(title)}</h2><p>Nothing needs your attention today.</p></div>"""
+
+
+def licensee_dashboard(code: str, snapshot: dict, show_credentials_modal: bool) -> tuple:
+    """
+    Returns (content, modals) for the licensee dashboard. Cards are filled by app.js from `snapshot`.
+    """
+    staff_items = "".join(f"<li>{escape(member['name'])}</li>" for member in snapshot["staff"][:3])
+    content = f"""<h1>Welcome Back, {escape(code)}</h1>
+<script type="application/json" id="dashboard-data">{json.dumps(snapshot)}</script>
+<div class="flex">
+  <button type="button" data-href="/licensee/order/index?tab=redeemable">Redeem</button>
+  <button type="button" data-href="/licensee/trade-in">Trade In</button>
+</div>
+<div class="rounded" data-card="outlets"><h2>Outlet Account Switcher</h2><div data-rows></div></div>
+<div class="rounded" data-card="opening-days"><h2>Opening Day</h2><div data-rows></div></div>
+<div class="rounded"><h2>Staff directory</h2><ul>{staff_items}</ul>
+  <button type="button" data-href="/licensee/staff/index">See more</button></div>
+<div class="rounded"><h2>Announcements</h2><p>{escape(ANNOUNCEMENTS[0][1])}</p>
+  <button type="button" data-href="/licensee/announcement/index">See more</button>
+  <a href="/licensee/announcement/index">See all announcements</a></div>
+<div class="rounded"><h2>Activities</h2><p>Apply to join outlet events.</p>
+  <button type="button" data-href="/licensee/application-form/index">See more</button></div>"""
+    modals = modal(
+        "opening-hours",
+        "Edit Opening Hours for",
+        """  <label>Opens at <input type="time" name="opens_at"></label>
+  <label>Closes at <input type="time" name="closes_at"></label>
+  <button type="button" data-action="save-hours">Save</button>
+  <button type="button" data-action="close-modal">Cancel</button>""",
+    )
+    if show_credentials_modal:
+        modals += """
+<div class="modal rounded" data-modal="credentials" role="dialog">
+  <h2>Save your login details?</h2>
+  <button type="button" data-action="close-modal">Maybe Later</button>
+</div>"""
+    return content, modals
+
+
+def _channel_inputs(values: Optional[dict] = None) -> str:
+    values = values or {}
+    return "\n".join(
+        f'  <label for="{key}">{label}</label>'
+        f'<input id="{key}" name="{key}" type="number" min="0" value="{_attr(values.get(key, ""))}">'
+        for key, label in CHANNEL_LABELS.items()
+    )
+
+
+def sales_index(sales: List[dict], active_tab: str) -> str:
+    return f"""<h1>Sales</h1>
+<p>Sales Dashboard</p>
+<div role="tablist">
+  <button type="button" role="tab" data-tab="daily">Daily sales</button>
+  <button type="button" role="tab" data-tab="extra">Extra sets</button>
+</div>
+<div class="flex">
+  <a href="/licensee/sales/create" data-tab-action="daily">Add sale</a>
+  <a href="/licensee/sales/extra/create" data-tab-action="extra">Add Extra Sets</a>
+</div>
+<script type="application/json" id="sales-data">{json.dumps({"sales": sales, "tab": active_tab})}</script>
+<table>
+  <thead><tr><th>Date</th><th>Status</th><th>Total</th><th></th></tr></thead>
+  <tbody></tbody>
+</table>"""
+
+
+def sales_form(kind: str, csrf: str, sale: Optional[dict] = None) -> str:
+    """
+    Add sale / Add Extra Sets form, or the Edit Sales form when `sale` is given.
+    """
+    if sale:
+        heading, action, submit = "Edit Sales", f"/licensee/sales/{sale['id']}/edit", "Update Sale"
+        day, kg_sold, values = sale["date"], sale["kg_sold"], sale["amounts"]
+    else:
+        heading = "Add Extra Sets" if kind == "extra" else "Add Sale"
+        action = "/licensee/sales/extra/create" if kind == "extra" else "/licensee/sales/create"
+        submit, day, kg_sold, values = "Key in sale", "", "", {}
+    closed_button = "" if sale else '<button type="submit" name="closed" value="1">Set the day as closed</button>'
+    return f"""<h1>{heading}</h1>
+<form method="post" action="{action}" class="rounded">
+  <input type="hidden" name="_token" value="{_attr(csrf)}">
+  <label for="date">Date</label><input id="date" name="date" type="date" value="{_attr(day)}">
+  <label for="kg-sold">KG sold</label><input id="kg-sold" name="kg_sold" type="number" min="0" value="{_attr(kg_sold)}">
+{_channel_inputs(values)}
+  {closed_button}
+  <button type="submit">{submit}</button>
+</form>"""
+
+
+def sales_details(sale: dict) -> tuple:
+    total = sum(sale["amounts"].values())
+    unsold = (
+        f"<dt>Unsold sets (Excess)</dt><dd>{sale['unsold_sets']}</dd>" if sale["kind"] == "extra" else ""
+    )
+    channels = "".join(
+        f"<dt>{CHANNEL_LABELS[key]}</dt><dd>RM {sale['amounts'].get(key, 0)}</dd>" for key in SALES_CHANNELS
+    )
+    content = f"""<h1>Sale details</h1>
+<div class="flex">
+  <a href="/licensee/sales/{sale['id']}/edit">Edit</a>
+  <button type="button" data-action="open-modal" data-target="delete-sale">Delete</button>
+</div>
+<dl class="rounded" data-sale-id="{sale['id']}">
+  <dt>Date</dt><dd>{sale['date']}</dd>
+  <dt>Total Sales</dt><dd>RM {total}</dd>
+  <dt>Status</dt><dd>{escape(sale['status'])}</dd>
+  <dt>KG sold</dt><dd>{sale['kg_sold']}</dd>
+  {unsold}
+  {channels}
+</dl>"""
+    modals = modal(
+        "delete-sale",
+        "Delete Sales Record",
+        f"""  <p>You are deleting this sale record. This cannot be undone.</p>
+  <button type="button" data-action="close-modal">Cancel</button>
+  <button type="button" data-action="delete-sale" data-sale-id="{sale['id']}">Delete</button>""",
+    )
+    return content, modals
+
+
+def staff_index(staff: Iterable[dict]) -> tuple:
+    rows = "".join(
+        f"""<li class="flex justify-between" data-staff-id="{member['id']}" data-start-date="{_attr(member['start_date'])}">
+  <span>{escape(member['name'])}</span><span>{escape(member['phone'])}</span>
+  <button type="button" data-action="edit-staff">Edit</button></li>"""
+        for member in staff
+    )
+    content = f"""<h1>Staff Directory</h1>
+<button type="button" data-action="open-modal" data-target="add-staff">Add Staff</button>
+<ul class="rounded" data-staff-list>{rows}</ul>"""
+    modals = modal(
+        "add-staff",
+        "Add New Staff",
+        """  <input name="name" placeholder="Enter staff name">
+  <input name="phone" placeholder="Enter phone number">
+  <input name="start_date" type="date">
+  <button type="button" data-action="create-staff">Add New Staff</button>
+  <button type="button" data-action="close-modal">Cancel</button>""",
+    ) + modal(
+        "edit-staff",
+        "Edit staff",
+        """  <input name="name" placeholder="Enter staff name">
+  <input name="start_date" type="date">
+  <button type="button" data-action="update-staff">Update staff</button>
+  <button type="button" data-action="close-modal">Cancel</button>""",
+    )
+    return content, modals
+
+
+def announcements_index() -> str:
+    items = "".join(
+        f"""<li class="rounded"><a href="/licensee/announcement/{number}" target="_blank">{escape(title)}</a>
+  <p>{escape(summary)}</p></li>"""
+        for number, title, summary in ANNOUNCEMENTS
+    )
+    return f"<h1>Announcements</h1><ul>{items}</ul>"
+
+
+def announcement(number: int) -> str:
+    title, summary = next(((t, s) for n, t, s in ANNOUNCEMENTS if n == number), ("Announcement", ""))
+    return f"<h1>{escape(title)}</h1><p>{escape(summary)}</p>"
+
+
+def application_forms() -> tuple:
+    rows = "".join(
+        f"""<tr><td>{reference}</td><td>{escape(kind)}</td><td>{escape(status)}</td>
+  <td><button type="button" data-action="open-modal" data-target="form-details">View</button></td></tr>"""
+        for reference, kind, status in APPLICATIONS
+    )
+    content = f"""<h1>Licensee activities form application</h1>
+<button type="button" data-action="open-modal" data-target="application-type">Create application</button>
+<table><thead><tr><th>Reference</th><th>Type</th><th>Status</th><th></th></tr></thead><tbody>{rows}</tbody></table>"""
+    reference, kind, status = APPLICATIONS[0]
+    modals = modal(
+        "form-details",
+        "Form Details",
+        f"""  <p>{reference} &middot; {escape(kind)} &middot; {escape(status)}</p>
+  <button type="button" data-action="close-modal">Close</button>""",
+    ) + modal(
+        "application-type",
+        "Select the application type",
+        """  <a href="/licensee/application-form/event/index">Event participant</a>
+  <button type="button" data-action="close-modal">Close</button>""",
+    )
+    return content, modals
+
+
+def profile(name: str, email: str) -> str:
+    return f"""<h1>Settings</h1>
+<div role="tablist"><button type="button" role="tab">User</button><button type="button" role="tab">Company</button></div>
+<form class="rounded" data-form="profile">
+  <label for="name">Name</label><input id="name" name="name" placeholder="Enter Name" value="{_attr(name)}">
+  <label for="email">Email</label><input id="email" name="email" value="{_attr(email)}" readonly>
+  <button type="submit">Save</button>
+</form>
+<form class="rounded" data-form="password">
+  <h2>Update Password</h2>
+  <input id="current_password" name="current_password" type="password" placeholder="Enter Old Password">
+  <input id="password" name="password" type="password" placeholder="Enter New Password">
+  <input id="password_confirmation" name="password_confirmation" type="password" placeholder="Enter Confirm Password">
+  <button type="submit">Save</button>
+</form>
+<p class="toast" data-toast hidden></p>"""
+
+
+def simple_page(heading: str, lines: Iterable[str] = ()) -> str:
+    return f"<h1>{escape(heading)}</h1>" + "".join(f"<p>{escape(line)}</p>" for line in lines)
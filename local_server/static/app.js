@@ -0,0 +1,234 @@
+// Client-side behaviour for the MCDynect stand-in server: menus, modals, and the JSON API calls
+// behind the dashboard cards, sales tabs, staff directory and profile forms.
+(function () {
+  "use strict";
+
+  function csrfToken() {
+    var meta = document.querySelector("meta[name='csrf-token']");
+    return meta ? meta.content : "";
+  }
+
+  function api(method, path, body) {
+    return fetch(path, {
+      method: method,
+      credentials: "same-origin",
+      headers: { "Content-Type": "application/json", "X-XSRF-TOKEN": csrfToken() },
+      body: body === undefined ? undefined : JSON.stringify(body),
+    }).then(function (response) {
+      return response.json().then(function (data) {
+        if (!response.ok) {
+          throw new Error(data.message || ("HTTP " + response.status));
+        }
+        return data;
+      });
+    });
+  }
+
+  function el(tag, attrs, children) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (key) {
+      if (key === "className") node.className = attrs[key];
+      else node.setAttribute(key, attrs[key]);
+    });
+    (children || []).forEach(function (child) {
+      node.appendChild(typeof child === "string" ? document.createTextNode(child) : child);
+    });
+    return node;
+  }
+
+  function readJson(id) {
+    var node = document.getElementById(id);
+    return node ? JSON.parse(node.textContent) : null;
+  }
+
+  function modalNamed(name) {
+    return document.querySelector("[data-modal='" + name + "']");
+  }
+
+  function openModal(name) {
+    var modal = modalNamed(name);
+    if (modal) modal.hidden = false;
+    return modal;
+  }
+
+  function closeModal(node) {
+    var modal = node.closest("[data-modal]");
+    if (modal) modal.hidden = true;
+  }
+
+  function toast(message) {
+    var node = document.querySelector("[data-toast]");
+    if (!node) return;
+    node.textContent = message;
+    node.hidden = false;
+  }
+
+  // Dashboard cards ------------------------------------------------------------------------------
+
+  var dashboard = readJson("dashboard-data");
+
+  function renderOutlets() {
+    var rows = document.querySelector("[data-card='outlets'] [data-rows]");
+    if (!rows) return;
+    rows.replaceChildren.apply(rows, dashboard.outlets.map(function (outlet) {
+      var button = el("button", { type: "button", "data-outlet": outlet.name }, [
+        el("p", {}, [outlet.current ? "Current" : "Switch"]),
+      ]);
+      if (!outlet.current) {
+        button.addEventListener("click", function () {
+          api("POST", "/api/licensee/outlets/switch", { outlet: outlet.name }).then(function (data) {
+            dashboard = data;
+            renderOutlets();
+          });
+        });
+      }
+      return el("div", { className: "flex justify-between px-2" }, [
+        el("p", { className: "text-grey-800" }, [outlet.name]),
+        button,
+      ]);
+    }));
+  }
+
+  var editingDay = null;
+
+  function renderOpeningDays() {
+    var rows = document.querySelector("[data-card='opening-days'] [data-rows]");
+    if (!rows) return;
+    rows.replaceChildren.apply(rows, dashboard.opening_days.map(function (entry) {
+      var toggle = el("button", { type: "button" }, [el("p", {}, [entry.open ? "Open" : "Closed"])]);
+      toggle.addEventListener("click", function () {
+        api("POST", "/api/licensee/opening-days/" + entry.day + "/toggle").then(function (data) {
+          dashboard = data;
+          renderOpeningDays();
+        });
+      });
+      var edit = el("button", { type: "button", title: "Edit opening hours" }, ["✎"]);
+      edit.addEventListener("click", function () {
+        editingDay = entry;
+        var modal = openModal("opening-hours");
+        modal.querySelector("h2").textContent = "Edit Opening Hours for " + entry.day;
+        modal.querySelector("[name='opens_at']").value = entry.opens_at;
+        modal.querySelector("[name='closes_at']").value = entry.closes_at;
+      });
+      return el("div", { className: "flex items-center justify-between" }, [
+        el("p", {}, [entry.day]),
+        toggle,
+        edit,
+      ]);
+    }));
+  }
+
+  // Sales listing -------------------------------------------------------------------------------
+
+  var salesData = readJson("sales-data");
+
+  function renderSales(tab) {
+    var body = document.querySelector("table tbody");
+    var rows = salesData.sales.filter(function (sale) { return sale.kind === tab; }).map(function (sale) {
+      var total = Object.keys(sale.amounts).reduce(function (sum, key) { return sum + sale.amounts[key]; }, 0);
+      return el("tr", {}, [
+        el("td", {}, [sale.date]),
+        el("td", {}, [sale.status]),
+        el("td", {}, ["RM " + total]),
+        el("td", {}, [el("a", { href: "/licensee/sales/show/" + sale.id }, ["View"])]),
+      ]);
+    });
+    body.replaceChildren.apply(body, rows);
+    document.querySelectorAll("[data-tab]").forEach(function (button) {
+      button.setAttribute("aria-selected", String(button.dataset.tab === tab));
+    });
+    document.querySelectorAll("[data-tab-action]").forEach(function (link) {
+      link.hidden = link.dataset.tabAction !== tab;
+    });
+  }
+
+  // Click handling ------------------------------------------------------------------------------
+
+  function formValues(container) {
+    var values = {};
+    container.querySelectorAll("input[name]").forEach(function (input) {
+      values[input.name] = input.value;
+    });
+    return values;
+  }
+
+  var editingStaffId = null;
+
+  var actions = {
+    "toggle-menu": function () {
+      var menu = document.querySelector("header [role='menu']");
+      menu.hidden = !menu.hidden;
+    },
+    "logout": function () {
+      document.getElementById("logout-form").submit();
+    },
+    "open-modal": function (button) {
+      openModal(button.dataset.target);
+    },
+    "close-modal": function (button) {
+      closeModal(button);
+    },
+    "save-hours": function (button) {
+      var values = formValues(button.closest("[data-modal]"));
+      api("POST", "/api/licensee/opening-days/" + editingDay.day + "/hours", values).then(function (data) {
+        dashboard = data;
+        renderOpeningDays();
+        closeModal(button);
+      });
+    },
+    "delete-sale": function (button) {
+      api("DELETE", "/api/licensee/sales/" + button.dataset.saleId).then(function () {
+        window.location.assign("/licensee/sales/index");
+      });
+    },
+    "create-staff": function (button) {
+      api("POST", "/api/licensee/staff", formValues(button.closest("[data-modal]"))).then(function () {
+        window.location.reload();
+      });
+    },
+    "edit-staff": function (button) {
+      var row = button.closest("[data-staff-id]");
+      editingStaffId = row.dataset.staffId;
+      var modal = openModal("edit-staff");
+      modal.querySelector("[name='name']").value = row.querySelector("span").textContent;
+      modal.querySelector("[name='start_date']").value = row.dataset.startDate;
+    },
+    "update-staff": function (button) {
+      var values = formValues(button.closest("[data-modal]"));
+      api("PUT", "/api/licensee/staff/" + editingStaffId, values).then(function () {
+        window.location.reload();
+      });
+    },
+  };
+
+  document.addEventListener("click", function (event) {
+    var button = event.target.closest("[data-action], [data-href], [data-tab]");
+    if (!button) return;
+    if (button.dataset.action) {
+      actions[button.dataset.action](button);
+    } else if (button.dataset.href) {
+      window.location.assign(button.dataset.href);
+    } else {
+      renderSales(button.dataset.tab);
+    }
+  });
+
+  document.querySelectorAll("form[data-form]").forEach(function (form) {
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var path = form.dataset.form === "profile" ? "/api/licensee/profile" : "/api/licensee/password";
+      api("POST", path, formValues(form)).then(
+        function (data) { toast(data.message); },
+        function (error) { toast(error.message); }
+      );
+    });
+  });
+
+  if (dashboard) {
+    renderOutlets();
+    renderOpeningDays();
+  }
+  if (salesData) {
+    renderSales(salesData.tab);
+  }
+})();
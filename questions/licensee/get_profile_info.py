@@ -11,9 +11,7 @@ class GetProfileInfo(Question):
 
         # Ensure the User tab is active before reading fields.
         if not page.is_visible(ProfileSelectors.NAME_INPUT):
-            user_tab = page.locator(ProfileSelectors.USER_TAB)
-            if user_tab.count() > 0 and user_tab.first.is_visible():
-                user_tab.first.click()
+            actor.uses_ability(BrowseTheWeb).click_first_visible([ProfileSelectors.USER_TAB])
 
         # Wait for fields to be ready before reading.
         page.wait_for_selector(ProfileSelectors.NAME_INPUT, state="visible", timeout=5000)
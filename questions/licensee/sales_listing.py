@@ -0,0 +1,136 @@
+# questions/licensee/sales_listing.py
+"""
+This module defines the SalesListing question for the licensee Sales page (`/licensee/sales/index`).
+The whole table is read in one `eval_on_selector_all` call, so tests pick a row in memory
+instead of probing rows one locator round-trip at a time.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from abilities.browse_the_web import BrowseTheWeb
+from abilities.wait_for import WaitFor
+from ..questions import Question
+
+SALES_ROWS = "table tbody tr"
+# Either rendering of the Extra sets tab (ARIA tab or plain button).
+EXTRA_SETS_TAB = "[role='tab']:has-text('Extra sets'), button:has-text('Extra sets')"
+
+# Row status labels, in the order tests prefer them when picking a record to open.
+STATUS_LABELS = ("Not filled", "Not complete", "Completed", "Submitted", "Pending")
+
+# Sales paths that are listings or forms, not a record's details page.
+_NON_DETAILS_SEGMENTS = {"index", "add", "create", "edit"}
+_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+
+# Per row: cell texts, visibility and every link target inside the row.
+_ROWS_JS = """
+(rows) => rows.map((row) => {
+    const rect = row.getBoundingClientRect();
+    return {
+        cells: Array.from(row.querySelectorAll('td')).map((td) => (td.innerText || '').trim()),
+        visible: rect.width > 0 && rect.height > 0 && row.offsetParent !== null,
+        hrefs: Array.from(row.querySelectorAll('a[href]')).map((a) => a.href),
+    };
+})
+"""
+
+
+def is_sales_details_url(url: str, include_extra: bool = False) -> bool:
+    """
+    True for a single sales record (`/licensee/sales/show/<id>`, `/licensee/sales/<id>`),
+    False for the listing and the add/create/edit forms.
+    Extra-sets records (`/licensee/sales/extra/<id>`) count only with `include_extra=True`.
+    """
+    if "/licensee/sales/show/" in url:
+        return True
+    match = re.search(r"/licensee/sales/(extra/)?([^/?#]+)/?(?:[?#].*)?$", url)
+    if not match or match.group(2).lower() in _NON_DETAILS_SEGMENTS:
+        return False
+    return include_extra or not match.group(1)
+
+
+@dataclass(frozen=True)
+class SalesRow:
+    """
+    One row of the sales table.
+    """
+    # Position among `table tbody tr`, for clicking rows that have no link.
+    index: int
+    cells: Tuple[str, ...]
+    visible: bool
+    # First matching STATUS_LABELS entry, or "" when the row shows none.
+    status: str
+    # First YYYY-MM-DD date in the row, if any.
+    date: Optional[date]
+    # Absolute URL of the record's details page, if the row links to one.
+    details_href: Optional[str]
+
+
+@dataclass
+class SalesRecords:
+    """
+    All rows of the sales table, indexed by status and by date.
+    """
+    rows: List[SalesRow]
+    by_status: Dict[str, List[SalesRow]] = field(default_factory=dict)
+    by_date: Dict[date, List[SalesRow]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for row in self.rows:
+            if row.status:
+                self.by_status.setdefault(row.status, []).append(row)
+            if row.date:
+                self.by_date.setdefault(row.date, []).append(row)
+
+    def first_to_open(self, statuses: Iterable[str] = STATUS_LABELS) -> Optional[SalesRow]:
+        """
+        Picks the first visible row to open, trying `statuses` in order and then any visible row.
+        Rows with a details link win over rows that must be clicked.
+        """
+        candidates = [row for status in statuses for row in self.by_status.get(status, [])]
+        candidates += [row for row in self.rows if row not in candidates]
+        visible = [row for row in candidates if row.visible]
+        linked = [row for row in visible if row.details_href]
+        return (linked or visible or [None])[0]
+
+
+class SalesListing(Question):
+    """
+    Reads the sales table currently shown (Daily sales or Extra sets tab).
+    Example: `records = the_licensee.asks_for(SalesListing())`
+    """
+
+    def __init__(self, include_extra: bool = False, timeout_ms: float = 5000):
+        # Accept extra-sets detail links as a row's details page.
+        self.include_extra = include_extra
+        # How long to wait for the first row; an empty listing returns no records.
+        self.timeout_ms = timeout_ms
+
+    def answered_by(self, actor) -> SalesRecords:
+        page = actor.uses_ability(BrowseTheWeb).page
+        WaitFor.on(page).element(SALES_ROWS, timeout_ms=self.timeout_ms, required=False)
+        raw_rows = page.eval_on_selector_all(SALES_ROWS, _ROWS_JS)
+        return SalesRecords([self._to_row(index, raw) for index, raw in enumerate(raw_rows)])
+
+    def _to_row(self, index: int, raw: dict) -> SalesRow:
+        text = " ".join(raw["cells"])
+        lowered = text.lower()
+        status = next((label for label in STATUS_LABELS if label.lower() in lowered), "")
+        match = _DATE.search(text)
+        try:
+            row_date = date(*map(int, match.groups())) if match else None
+        except ValueError:
+            row_date = None
+        details_href = next(
+            (href for href in raw["hrefs"] if is_sales_details_url(href, self.include_extra)), None
+        )
+        return SalesRow(
+            index=index,
+            cells=tuple(raw["cells"]),
+            visible=raw["visible"],
+            status=status,
+            date=row_date,
+            details_href=details_href,
+        )
@@ -0,0 +1,153 @@
+"""
+This module defines the RoleDashboard question, shared by every role's landing dashboard.
+It waits (in the browser) for a heading that matches the role's rules, then reads all h1/h2
+headings in one round-trip and picks the welcome heading in Python.
+"""
+from typing import Dict, List, Tuple
+
+from actors.base_actor import Actor
+from abilities.browse_the_web import BrowseTheWeb
+from abilities.wait_for import WaitFor
+
+# How long a welcome heading may take to render after the dashboard URL and first heading show.
+# Kept short, so a wrong-role dashboard fails fast; pass `welcome_timeout_ms` for slower pages.
+WELCOME_TIMEOUT_MS = 500
+
+# Returns [{tag, text, visible}] for every h1/h2 on the page, in document order.
+_HEADINGS_JS = """
+() => Array.from(document.querySelectorAll('h1, h2')).map((el) => {
+    const rect = el.getBoundingClientRect();
+    const style = window.getComputedStyle(el);
+    return {
+        tag: el.tagName.toLowerCase(),
+        text: (el.textContent || '').replace(/\\s+/g, ' ').trim(),
+        visible: rect.width > 0 && rect.height > 0
+            && style.visibility !== 'hidden' && style.display !== 'none',
+    };
+})
+"""
+
+# True once a visible h1/h2 contains "welcome back" or one of the role's keywords.
+_WELCOME_RENDERED_JS = """
+(keywords) => Array.from(document.querySelectorAll('h1, h2')).some((el) => {
+    const rect = el.getBoundingClientRect();
+    const text = (el.textContent || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    return rect.width > 0 && rect.height > 0
+        && (text.includes('welcome back') || keywords.some((keyword) => text.includes(keyword)));
+})
+"""
+
+
+class DashboardRules:
+    """
+    How to recognise the welcome heading on one role's dashboard.
+    """
+
+    def __init__(self, keywords: Tuple[str, ...], first_heading_fallback: bool = False):
+        # Lower-case fragments a welcome heading may contain, checked after "welcome back".
+        self.keywords = keywords
+        # Some dashboards only show their title (e.g. "Inventory Dashboard"); accept the first h1 then.
+        self.first_heading_fallback = first_heading_fallback
+
+
+# Role key (as in LOGIN_CREDENTIALS) -> welcome heading rules.
+DASHBOARD_RULES: Dict[str, DashboardRules] = {
+    "licensee": DashboardRules(("welcome back",)),
+    "area_manager": DashboardRules(("welcome back",)),
+    "inventory": DashboardRules(("welcome", "dashboard"), first_heading_fallback=True),
+    "procurement": DashboardRules(("welcome", "dashboard"), first_heading_fallback=True),
+    "production": DashboardRules(("welcome", "dashboard"), first_heading_fallback=True),
+    "licensing": DashboardRules(("welcome", "dashboard"), first_heading_fallback=True),
+    "compliance": DashboardRules(("welcome", "dashboard"), first_heading_fallback=True),
+    "finance": DashboardRules(("welcome", "dashboard"), first_heading_fallback=True),
+}
+
+
+class RoleDashboard:
+    """
+    Questions for verifying the welcome message on a role's dashboard.
+    Example: `welcome_text = the_finance.asks_for(RoleDashboard.for_role("finance"))`
+    """
+
+    def __init__(self, role: str, welcome_timeout_ms: float = WELCOME_TIMEOUT_MS):
+        if role not in DASHBOARD_RULES:
+            raise ValueError(f"No dashboard rules for role '{role}'. Add it to DASHBOARD_RULES.")
+        self.role = role
+        self.rules = DASHBOARD_RULES[role]
+        self.welcome_timeout_ms = welcome_timeout_ms
+
+    @staticmethod
+    def for_role(role: str, welcome_timeout_ms: float = WELCOME_TIMEOUT_MS) -> "RoleDashboard":
+        """
+        Factory method for the dashboard of a role key from LOGIN_CREDENTIALS.
+        `welcome_timeout_ms` bounds the wait for the welcome heading once the dashboard has loaded.
+        """
+        return RoleDashboard(role, welcome_timeout_ms)
+
+    def answered_by(self, actor: Actor) -> str:
+        """
+        Same as `welcome_header_text`, so the question works with `actor.asks_for(...)`.
+        """
+        return self.welcome_header_text(actor)
+
+    def welcome_header_text(self, actor: Actor) -> str:
+        """
+        Retrieves the text of the welcome heading (e.g. "Welcome Back, L23#304"), or "" if none matches.
+        """
+        self._wait_for_welcome(actor)
+        heading = self._welcome_heading(self.headings(actor))
+        return heading["text"] if heading else ""
+
+    def has_personal_welcome(self, actor: Actor) -> bool:
+        """
+        Checks that the welcome heading starts with "Welcome Back," followed by a user identifier.
+        """
+        return self.welcome_header_text(actor).startswith("Welcome Back,")
+
+    def is_welcome_message_visible(self, actor: Actor) -> bool:
+        """
+        Checks that the matched welcome heading is rendered visibly.
+        """
+        self._wait_for_welcome(actor)
+        heading = self._welcome_heading(self.headings(actor))
+        return bool(heading and heading["visible"])
+
+    @staticmethod
+    def headings(actor: Actor) -> List[dict]:
+        """
+        Returns every h1/h2 as {tag, text, visible}, collected in a single `page.evaluate`.
+        Useful in assertion messages to show what the dashboard actually rendered.
+        """
+        browser = actor.uses_ability(BrowseTheWeb)
+        return browser.page.evaluate(_HEADINGS_JS)
+
+    def _wait_for_welcome(self, actor: Actor) -> bool:
+        # The welcome heading often renders after the page title. Dashboards that only show
+        # a title (first_heading_fallback) fall back to it once the wait runs out.
+        page = actor.uses_ability(BrowseTheWeb).page
+        return WaitFor.on(page).condition(
+            _WELCOME_RENDERED_JS, arg=list(self.rules.keywords), timeout_ms=self.welcome_timeout_ms, required=False
+        )
+
+    def _welcome_heading(self, headings: List[dict]):
+        # Visible headings win over hidden ones (e.g. a collapsed mobile header), then the
+        # strongest rule wins, then h1 over h2; document order breaks remaining ties.
+        best, best_key = None, None
+        for index, heading in enumerate(headings):
+            rank = self._rule_rank(heading) if heading["text"] else None
+            if rank is None:
+                continue
+            key = (not heading["visible"], rank, heading["tag"] != "h1", index)
+            if best_key is None or key < best_key:
+                best, best_key = heading, key
+        return best
+
+    def _rule_rank(self, heading: dict):
+        text = heading["text"].lower()
+        if "welcome back" in text:
+            return 0
+        if any(keyword in text for keyword in self.rules.keywords):
+            return 1
+        if self.rules.first_heading_fallback and heading["tag"] == "h1":
+            return 2
+        return None
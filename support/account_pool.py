@@ -0,0 +1,133 @@
+"""
+This module hands out exclusive leases on accounts from a pool.
+Tests that change shared server state (outlet, opening days, staff, profile) lease an account
+so concurrent pytest-xdist workers never mutate the same account at the same time.
+
+Leases are lock files in a folder shared by all workers (`test_runs/<timestamp>/leases/`),
+so they work across processes without any extra service. Lock files are named after the
+account's email, so an account that belongs to two pools is still leased by one test at a time.
+"""
+import json
+import os
+import pathlib
+import re
+import time
+from typing import List, Optional
+
+
+class AccountLease:
+    """
+    Exclusive use of one pool account until `release()` is called.
+    """
+
+    def __init__(self, pool: "AccountPool", index: int, email: str, password: str):
+        self._pool = pool
+        self.index = index
+        self.email = email
+        self.password = password
+
+    @property
+    def key(self) -> str:
+        # Stable name for per-account artifacts (e.g. cached login state).
+        return f"{self._pool.name}_{self.index}"
+
+    @property
+    def credentials(self) -> dict:
+        # Same shape as the entries in LOGIN_CREDENTIALS.
+        return {"email": self.email, "password": self.password}
+
+    def release(self) -> None:
+        self._pool.release(self)
+
+
+class AccountPool:
+    """
+    A fixed set of accounts shared by every worker of the run.
+    `acquire()` blocks until an account is free or `timeout` seconds pass.
+    `name` prefixes lease keys; `env_prefix` names the variables that configure the pool.
+    """
+
+    def __init__(
+        self,
+        accounts: List[dict],
+        lease_dir: str,
+        timeout: float,
+        poll_interval: float = 0.25,
+        name: str = "account",
+        env_prefix: str = "MCDYNECT_LICENSEE",
+    ):
+        if not accounts:
+            raise ValueError(f"Account pool needs at least one account ({env_prefix}_EMAIL_<n>).")
+        self.accounts = accounts
+        self.name = name
+        self.env_prefix = env_prefix
+        self.lease_dir = pathlib.Path(lease_dir)
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    def acquire(self, holder: str) -> AccountLease:
+        """
+        Leases the first free account for `holder` (usually the test node id).
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            for index, account in enumerate(self.accounts, start=1):
+                if self._try_lock(account["email"], holder):
+                    return AccountLease(self, index, account["email"], account["password"])
+            if time.monotonic() >= deadline:
+                raise RuntimeError(
+                    f"No pool account became free within {self.timeout:g}s for {holder} "
+                    f"(pool size {len(self.accounts)}). Add {self.env_prefix}_EMAIL_<n>/"
+                    f"{self.env_prefix}_PASSWORD_<n> accounts or raise MCDYNECT_ACCOUNT_LEASE_TIMEOUT."
+                )
+            time.sleep(self.poll_interval)
+
+    def release(self, lease: AccountLease) -> None:
+        try:
+            self._lock_path(lease.email).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _lock_path(self, email: str) -> pathlib.Path:
+        return self.lease_dir / f"{re.sub(r'[^A-Za-z0-9]+', '_', email.lower())}.lock"
+
+    def _try_lock(self, email: str, holder: str) -> bool:
+        path = self._lock_path(email)
+        try:
+            # O_EXCL makes creation atomic across processes: exactly one worker wins.
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if self._is_stale(path):
+                # The holder process died without releasing; reclaim and retry once.
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                return self._try_lock(email, holder)
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"pid": os.getpid(), "holder": holder, "since": time.time()}, handle)
+        return True
+
+    @staticmethod
+    def _is_stale(path: pathlib.Path) -> bool:
+        owner_pid = _read_owner_pid(path)
+        if owner_pid is None:
+            return False
+        try:
+            os.kill(owner_pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            # Process exists but belongs to someone else.
+            return False
+        return False
+
+
+def _read_owner_pid(path: pathlib.Path) -> Optional[int]:
+    try:
+        return int(json.loads(path.read_text(encoding="utf-8"))["pid"])
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or half-written lock file: treat as held.
+        return None
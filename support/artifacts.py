@@ -0,0 +1,129 @@
+"""
+This module writes test artifacts (screenshots, traces, logs) on background threads.
+The test thread only captures raw bytes and queues them; encoding and disk I/O happen off the critical path.
+"""
+import io
+import os
+import queue
+import threading
+from typing import Optional
+
+try:
+    # Optional: only needed to re-encode PNG screenshots as WebP/JPEG.
+    from PIL import Image
+except ImportError:  # pragma: no cover - depends on the local environment
+    Image = None
+
+# Accepted values for MCDYNECT_SCREENSHOT_FORMAT.
+IMAGE_FORMATS = ("png", "webp", "jpeg")
+
+# Queue entry that tells a worker thread to exit.
+_STOP = object()
+
+
+def safe_test_name(nodeid: str) -> str:
+    """
+    Turns a pytest node id into a filesystem-safe name for per-test artifacts.
+    """
+    return nodeid.replace("/", "_").replace("::", "__").replace(".py", "").replace(" ", "_")
+
+
+class ArtifactWriter:
+    """
+    A bounded queue drained by a small pool of writer threads.
+    `submit_*` blocks only when `max_pending` artifacts are already waiting (back-pressure).
+    Call `flush()` before reading artifacts back and `close()` at session end.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, image_format: str = "png", quality: int = 80):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported screenshot format '{image_format}'. Use one of {IMAGE_FORMATS}.")
+        if image_format != "png" and Image is None:
+            print(f"⚠️ Pillow is not installed; saving screenshots as PNG instead of {image_format}.")
+            image_format = "png"
+        self.image_format = image_format
+        self.quality = quality
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        # Simple counters for the end-of-run summary.
+        self.written = 0
+        self.bytes_written = 0
+        self.errors = 0
+        self._threads = [
+            threading.Thread(target=self._run, name=f"artifact-writer-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit_screenshot(self, base_path: str, png_bytes: bytes) -> str:
+        """
+        Queues a PNG screenshot; returns the final path (extension follows the configured format).
+        """
+        extension = "jpg" if self.image_format == "jpeg" else self.image_format
+        path = f"{base_path}.{extension}"
+        self._queue.put((path, png_bytes, self.image_format))
+        return path
+
+    def submit_bytes(self, path: str, data: bytes) -> str:
+        """
+        Queues raw bytes (e.g. a trace zip) to be written as-is.
+        """
+        self._queue.put((path, data, None))
+        return path
+
+    def submit_text(self, path: str, text: str) -> str:
+        """
+        Queues a text artifact (e.g. console logs) encoded as UTF-8.
+        """
+        return self.submit_bytes(path, text.encode("utf-8"))
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued artifact has been written.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Flushes pending artifacts and stops the writer threads.
+        """
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                path, data, image_format = item
+                self._write(path, self._encode(data, image_format))
+            except Exception as e:
+                with self._lock:
+                    self.errors += 1
+                print(f"⚠️ Artifact write error: {type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _encode(self, png_bytes: bytes, image_format: Optional[str]) -> bytes:
+        # PNG (or non-image data) is written untouched; WebP/JPEG are re-encoded here, off the test thread.
+        if image_format in (None, "png"):
+            return png_bytes
+        image = Image.open(io.BytesIO(png_bytes))
+        if image_format == "jpeg":
+            image = image.convert("RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format.upper(), quality=self.quality)
+        return buffer.getvalue()
+
+    def _write(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.write(data)
+        with self._lock:
+            self.written += 1
+            self.bytes_written += len(data)
@@ -0,0 +1,221 @@
+"""
+This module serves static assets (scripts, stylesheets, fonts, images) from a content-addressed cache
+under `.pw_home/asset_cache`, shared by every test, worker and run. Pages and API traffic are never cached.
+
+Versioned URLs (a hashed file name such as `app.3f9a1c2e.js`, or a query made only of version
+parameters such as `?v=3` or `?id=5d2c91ab`) are served from the cache as they are. Other assets,
+including thumbnails (`?w=200`) and signed URLs, are revalidated with the server once per run (If-None-Match /
+If-Modified-Since), then served from the cache for the rest of that run.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Error, Route
+
+# Bump when the on-disk format changes; entries written by other versions are ignored.
+CACHE_VERSION = 1
+
+STATIC_RESOURCE_TYPES = {"script", "stylesheet", "font", "image", "media"}
+STATIC_EXTENSIONS = {
+    ".js", ".mjs", ".css", ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".ico", ".avif",
+}
+# Headers replayed with a cached body; the rest (lengths, encodings, cookies) are per response.
+_KEPT_HEADERS = {"content-type", "cache-control", "etag", "last-modified", "access-control-allow-origin"}
+# "app.3f9a1c2e.js", "chunk-5d2c91ab.css": the file name changes whenever the content does.
+_HASHED_NAME = re.compile(r"[.-][0-9a-f]{8,}\.[a-z0-9]+$", re.IGNORECASE)
+# Query parameters that only carry a content version ("app.js?v=3"). Not "id": it usually picks
+# which resource to serve, so "?id=" URLs are revalidated like the rest.
+VERSION_PARAMS = {"v", "ver", "version", "hash", "rev"}
+# A bare hash as the whole query ("app.js?5d2c91ab").
+_HASH_QUERY = re.compile(r"^[0-9a-f]{8,}$", re.IGNORECASE)
+
+# Counter names, in report order.
+STAT_KEYS = ("hits", "revalidated", "misses", "bypassed", "fetch_errors", "bytes_from_cache", "bytes_downloaded")
+
+
+def is_versioned(url: str) -> bool:
+    """
+    True when the URL changes whenever the content does, so a cached copy never needs revalidating.
+    Any other query parameter (sizes, signatures, expiry) makes the URL revalidated like the rest.
+    """
+    parts = urlsplit(url)
+    if _HASHED_NAME.search(parts.path):
+        return True
+    if not parts.query:
+        return False
+    if _HASH_QUERY.match(parts.query):
+        return True
+    names = {pair.split("=", 1)[0].lower() for pair in parts.query.split("&") if pair}
+    return bool(names) and names <= VERSION_PARAMS
+
+
+class AssetCache:
+    """
+    On-disk asset cache: `index/<url hash>.json` describes a response, `blobs/<sha256>` holds its body.
+    Files are written atomically, so concurrent xdist workers can share the folder.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.index_dir = os.path.join(cache_dir, "index")
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        os.makedirs(self.index_dir, exist_ok=True)
+        os.makedirs(self.blob_dir, exist_ok=True)
+        # URLs already revalidated in this process; they are served without asking the server again.
+        self._fresh = set()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {key: 0 for key in STAT_KEYS}
+
+    def attach(self, context: BrowserContext) -> "AssetCache":
+        context.route("**/*", self._handle)
+        return self
+
+    def hit_rate(self) -> Optional[float]:
+        """
+        Share of cacheable requests answered from disk (including revalidated ones), or None if there were none.
+        """
+        served = self.stats["hits"] + self.stats["revalidated"]
+        total = served + self.stats["misses"]
+        return served / total if total else None
+
+    def merge(self, stats: Dict[str, int]) -> None:
+        # Adds counters reported by another process (an xdist worker).
+        with self._lock:
+            for key in STAT_KEYS:
+                self.stats[key] += stats.get(key, 0)
+
+    def describe(self) -> str:
+        rate = self.hit_rate()
+        return (
+            f"{self.stats['hits']} hits, {self.stats['revalidated']} revalidated, {self.stats['misses']} misses"
+            f" ({'n/a' if rate is None else f'{100 * rate:.0f}%'} hit rate),"
+            f" {self.stats['bytes_from_cache'] / 1e6:.1f} MB from cache,"
+            f" {self.stats['bytes_downloaded'] / 1e6:.1f} MB downloaded"
+        )
+
+    def write(self, path: str, **extra) -> None:
+        payload = dict(extra)
+        payload["cache_dir"] = self.cache_dir
+        payload["hit_rate"] = self.hit_rate()
+        payload.update(self.stats)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+
+    # Routing ------------------------------------------------------------------------------------
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        if not self._cacheable(request):
+            self._count("bypassed")
+            route.fallback()
+            return
+        url = request.url
+        entry = self._load(url)
+        if entry is not None and (url in self._fresh or is_versioned(url)):
+            self._serve(route, entry, "hits")
+            return
+        headers = dict(request.headers)
+        if entry is not None:
+            if entry["headers"].get("etag"):
+                headers["if-none-match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                headers["if-modified-since"] = entry["headers"]["last-modified"]
+        try:
+            response = route.fetch(headers=headers)
+            body = b"" if entry is not None and response.status == 304 else response.body()
+        except Error as e:
+            # Network error, or the page closed mid-fetch: hand the request on instead of leaving it hanging.
+            self._count("fetch_errors")
+            print(f"⚠️ Asset cache could not fetch {url}: {e}")
+            try:
+                route.fallback()
+            except Error:
+                # The page is gone; nothing is waiting for the response.
+                pass
+            return
+        if entry is not None and response.status == 304:
+            self._fresh.add(url)
+            self._serve(route, entry, "revalidated")
+            return
+        self._count("misses")
+        self._count("bytes_downloaded", len(body))
+        if response.status == 200 and "no-store" not in response.headers.get("cache-control", ""):
+            self._store(url, response.status, response.headers, body)
+            self._fresh.add(url)
+        route.fulfill(response=response, body=body)
+
+    @staticmethod
+    def _cacheable(request) -> bool:
+        if request.method != "GET":
+            return False
+        path = urlsplit(request.url).path
+        if path.startswith("/api/"):
+            return False
+        if request.resource_type in STATIC_RESOURCE_TYPES:
+            return True
+        return os.path.splitext(path)[1].lower() in STATIC_EXTENSIONS and request.resource_type != "document"
+
+    def _serve(self, route: Route, entry: dict, counter: str) -> None:
+        try:
+            with open(os.path.join(self.blob_dir, entry["sha256"]), "rb") as handle:
+                body = handle.read()
+        except FileNotFoundError:
+            # Index without its blob (e.g. a half-cleared cache): fetch as if it were a miss.
+            self._fresh.discard(entry["url"])
+            try:
+                os.remove(self._index_path(entry["url"]))
+            except FileNotFoundError:
+                pass
+            self._handle(route)
+            return
+        self._count(counter)
+        self._count("bytes_from_cache", len(body))
+        route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+
+    # Storage ------------------------------------------------------------------------------------
+
+    def _index_path(self, url: str) -> str:
+        key = hashlib.sha256(f"{CACHE_VERSION}:{url}".encode("utf-8")).hexdigest()
+        return os.path.join(self.index_dir, f"{key}.json")
+
+    def _load(self, url: str) -> Optional[dict]:
+        try:
+            with open(self._index_path(url), encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return None
+        return entry if entry.get("version") == CACHE_VERSION and entry.get("url") == url else None
+
+    def _store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = os.path.join(self.blob_dir, digest)
+        if not os.path.exists(blob_path):
+            _write_atomic(blob_path, body)
+        entry = {
+            "version": CACHE_VERSION,
+            "url": url,
+            "status": status,
+            "headers": {name: value for name, value in headers.items() if name.lower() in _KEPT_HEADERS},
+            "sha256": digest,
+            "stored": time.time(),
+        }
+        _write_atomic(self._index_path(url), json.dumps(entry).encode("utf-8"))
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # Write then rename, so readers in other processes never see a partial file.
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(temp_path, path)
@@ -0,0 +1,88 @@
+"""
+This module caches an authenticated Playwright storage_state per role.
+Each role in `LOGIN_CREDENTIALS` logs in once per session; later pages start from the saved state.
+"""
+import pathlib
+from typing import Dict
+
+from playwright.sync_api import Browser
+
+from abilities.browse_the_web import BrowseTheWeb
+from abilities.call_an_api import CallAnAPI
+from abilities.wait_for import WaitFor
+from actors.base_actor import Actor
+from config.credentials import LOGIN_CREDENTIALS
+from tasks.login import Login
+
+
+class RoleSession:
+    """
+    A signed-in session for one role, saved as a Playwright storage_state file.
+    """
+
+    def __init__(self, role: str, email: str, state_path: str, landing_url: str):
+        self.role = role
+        self.email = email
+        # JSON file accepted by `browser.new_context(storage_state=...)`.
+        self.state_path = state_path
+        # Where the original login landed (usually the role dashboard).
+        self.landing_url = landing_url
+
+
+class AuthStateCache:
+    """
+    Lazily signs in each role the first time a test needs it and keeps the result for the session.
+    Files are written to `test_runs/<timestamp>/auth/<role>.json`.
+    """
+
+    def __init__(self, browser: Browser, auth_dir: str):
+        self.browser = browser
+        self.auth_dir = pathlib.Path(auth_dir)
+        self._sessions: Dict[str, RoleSession] = {}
+
+    def session_for(self, role: str) -> RoleSession:
+        """
+        Returns the cached session for `role`, logging in on first use.
+        """
+        if role not in self._sessions:
+            creds = LOGIN_CREDENTIALS[role]
+            self._sessions[role] = self._sign_in(role, creds["email"], creds["password"])
+        return self._sessions[role]
+
+    def session_for_account(self, key: str, email: str, password: str) -> RoleSession:
+        """
+        Same as `session_for`, for accounts outside LOGIN_CREDENTIALS (e.g. leased pool accounts).
+        """
+        if key not in self._sessions:
+            self._sessions[key] = self._sign_in(key, email, password)
+        return self._sessions[key]
+
+    def invalidate(self, role: str) -> None:
+        """
+        Forgets a role's session so the next request logs in again.
+        """
+        self._sessions.pop(role, None)
+
+    def _sign_in(self, role: str, email: str, password: str) -> RoleSession:
+        self.auth_dir.mkdir(parents=True, exist_ok=True)
+        state_path = self.auth_dir / f"{role}.json"
+
+        # Use a throwaway context so the login never leaks into a test's own page.
+        context = self.browser.new_context()
+        try:
+            page = context.new_page()
+            actor = (
+                Actor(role)
+                .who_can(BrowseTheWeb.with_browser_page(page))
+                .who_can(CallAnAPI.with_browser_page(page))
+            )
+            actor.attempts_to(Login.with_credentials(email, password))
+            if not WaitFor.on(page).url(lambda url: "/login" not in url, required=False):
+                raise RuntimeError(
+                    f"Could not cache a signed-in session for role '{role}': "
+                    f"still on {page.url} after login."
+                )
+            context.storage_state(path=str(state_path))
+            return RoleSession(role, email, str(state_path), page.url)
+        finally:
+            context.close()
@@ -0,0 +1,183 @@
+"""
+This module keeps one Chromium running between pytest invocations, so re-running a single test does
+not pay for a browser launch. The browser listens on a local CDP port recorded in
+`.pw_home/browser_daemon.json`; the `playwright_browser` fixture connects to it when it is running
+and launches its own browser otherwise.
+
+    python -m support.browser_daemon start      # headless when MCDYNECT_HEADLESS=true, like pytest
+    python -m support.browser_daemon status
+    python -m support.browser_daemon stop
+"""
+import argparse
+import json
+import os
+import pathlib
+import signal
+import subprocess
+import time
+import urllib.request
+from typing import Optional
+
+from playwright.sync_api import Browser, BrowserType, sync_playwright
+
+from config.settings import HEADLESS
+
+PW_HOME = pathlib.Path(__file__).resolve().parents[1] / ".pw_home"
+# Written by `start`, read by the fixture, removed by `stop` (or when found stale).
+STATE_FILE = PW_HOME / "browser_daemon.json"
+# Browser profile of the daemon; Chromium writes its CDP port to `DevToolsActivePort` here.
+PROFILE_DIR = PW_HOME / "daemon-profile"
+LOG_FILE = PW_HOME / "browser_daemon.log"
+
+# Only Chromium exposes CDP; Firefox and WebKit runs always launch their own browser.
+DAEMON_BROWSER = "chromium"
+
+
+def read_state() -> Optional[dict]:
+    try:
+        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def is_alive(state: dict) -> bool:
+    """
+    True when the recorded process exists and its CDP endpoint answers.
+    """
+    try:
+        os.kill(state["pid"], 0)
+    except (OSError, KeyError):
+        return False
+    try:
+        with urllib.request.urlopen(f"{state['endpoint']}/json/version", timeout=1) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def running_endpoint() -> Optional[str]:
+    """
+    CDP endpoint of a live daemon, or None. A state file left by a dead daemon is removed.
+    """
+    state = read_state()
+    if state is None:
+        return None
+    if not is_alive(state):
+        STATE_FILE.unlink(missing_ok=True)
+        return None
+    return state["endpoint"]
+
+
+def connect(browser_type: BrowserType, timeout_ms: float = 5000) -> Optional[Browser]:
+    """
+    Connects `browser_type` to the running daemon, or returns None so the caller launches instead.
+    Closing the returned browser only disconnects; the daemon keeps running.
+    """
+    if browser_type.name != DAEMON_BROWSER:
+        return None
+    endpoint = running_endpoint()
+    if endpoint is None:
+        return None
+    try:
+        return browser_type.connect_over_cdp(endpoint, timeout=timeout_ms)
+    except Exception as e:
+        print(f"⚠️ Browser daemon at {endpoint} did not accept the connection: {e}")
+        return None
+
+
+def start(headless: bool = True, port: int = 0, timeout: float = 30.0) -> dict:
+    """
+    Starts the daemon Chromium in its own process group and records its endpoint.
+    Port 0 lets Chromium pick a free port.
+    """
+    state = read_state()
+    if state is not None and is_alive(state):
+        return state
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    port_file = PROFILE_DIR / "DevToolsActivePort"
+    port_file.unlink(missing_ok=True)
+    with sync_playwright() as p:
+        executable = p.chromium.executable_path
+    args = [
+        executable,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={PROFILE_DIR}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-crash-reporter",
+        "--disable-crashpad",
+        "about:blank",
+    ]
+    if headless:
+        args.insert(1, "--headless=new")
+    env = dict(os.environ, HOME=str(PW_HOME), PLAYWRIGHT_DISABLE_CRASH_REPORTER="1")
+    with open(LOG_FILE, "ab") as log:
+        try:
+            process = subprocess.Popen(
+                args, stdout=log, stderr=log, stdin=subprocess.DEVNULL, env=env, start_new_session=True
+            )
+        except FileNotFoundError:
+            raise RuntimeError(f"Chromium not found at {executable}. Run `playwright install chromium` first.") from None
+    deadline = time.monotonic() + timeout
+    while not port_file.exists() or not port_file.read_text(encoding="utf-8").strip():
+        if process.poll() is not None or time.monotonic() >= deadline:
+            process.kill()
+            raise RuntimeError(f"Browser daemon did not start; see {LOG_FILE}.")
+        time.sleep(0.1)
+    active_port = int(port_file.read_text(encoding="utf-8").splitlines()[0])
+    state = {
+        "pid": process.pid,
+        "endpoint": f"http://127.0.0.1:{active_port}",
+        "browser": DAEMON_BROWSER,
+        "headless": headless,
+        "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    return state
+
+
+def stop() -> bool:
+    """
+    Stops the daemon. Returns False when none was running.
+    """
+    state = read_state()
+    STATE_FILE.unlink(missing_ok=True)
+    if state is None:
+        return False
+    try:
+        os.killpg(state["pid"], signal.SIGTERM)
+    except (OSError, KeyError):
+        return False
+    return True
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m support.browser_daemon", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    start_parser = commands.add_parser("start", help="Start the shared Chromium (no-op if already running).")
+    start_parser.add_argument(
+        "--headed",
+        action="store_true",
+        default=not HEADLESS,
+        help="Show the browser window (default follows MCDYNECT_HEADLESS).",
+    )
+    start_parser.add_argument("--port", type=int, default=0, help="CDP port (default: any free port).")
+    commands.add_parser("status", help="Print the running daemon's endpoint.")
+    commands.add_parser("stop", help="Stop the shared Chromium.")
+    args = parser.parse_args(argv)
+
+    if args.command == "start":
+        try:
+            state = start(headless=not args.headed, port=args.port)
+        except RuntimeError as e:
+            parser.exit(1, f"{e}\n")
+        print(f"Browser daemon (pid {state['pid']}) listening at {state['endpoint']}")
+    elif args.command == "status":
+        endpoint = running_endpoint()
+        print(f"Browser daemon listening at {endpoint}" if endpoint else "Browser daemon is not running.")
+    else:
+        print("Browser daemon stopped." if stop() else "Browser daemon was not running.")
+
+
+if __name__ == "__main__":
+    main()
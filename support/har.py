@@ -0,0 +1,87 @@
+"""
+This module records each test's network traffic to a HAR file and replays it later (`--mcd-har`).
+Replayed runs take the backend out of the timing, so framework changes can be benchmarked on their own.
+"""
+import glob
+import os
+from typing import List, Optional
+
+from playwright.sync_api import BrowserContext, Route
+
+from support.artifacts import safe_test_name
+
+# Accepted values for MCDYNECT_HAR / --mcd-har.
+HAR_MODES = ("off", "record", "replay")
+
+# Status served for requests that are not in the HAR, so they fail loudly instead of hanging.
+UNMATCHED_STATUS = 599
+
+
+def har_dir_for_run(run_dir: str) -> str:
+    return os.path.join(run_dir, "har")
+
+
+def latest_recording(runs_root: str, exclude: Optional[str] = None) -> Optional[str]:
+    """
+    Returns the newest `test_runs/<timestamp>/har` folder (other than `exclude`), or None.
+    Run folders are timestamped, so name order is age order.
+    """
+    excluded = os.path.abspath(exclude) if exclude else None
+    for har_dir in sorted(glob.glob(os.path.join(runs_root, "*", "har")), reverse=True):
+        if os.path.abspath(har_dir) != excluded and os.listdir(har_dir):
+            return har_dir
+    return None
+
+
+class HarSession:
+    """
+    HAR recording or replay for one test's browser context.
+    Create it before the context (it supplies `new_context` options), then `attach` it to the context.
+    """
+
+    def __init__(self, mode: str, har_dir: str, nodeid: str):
+        self.mode = mode
+        self.nodeid = nodeid
+        self.path = os.path.join(har_dir, f"{safe_test_name(nodeid)}.har")
+        # "METHOD url" of every request replay could not serve.
+        self.unmatched: List[str] = []
+
+    def context_options(self) -> dict:
+        """
+        Keyword arguments for `browser.new_context(...)`. Playwright writes the HAR when the context closes.
+        """
+        if self.mode != "record":
+            return {}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        return {"record_har_path": self.path, "record_har_content": "embed"}
+
+    def attach(self, context: BrowserContext) -> "HarSession":
+        """
+        In replay mode, serves the context from the recorded HAR. Raises FileNotFoundError without one.
+        """
+        if self.mode != "replay":
+            return self
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(
+                f"No HAR recorded for {self.nodeid} (expected {self.path}). Run with --mcd-har=record first."
+            )
+        # Routes registered later run first: the HAR answers, and only misses fall back to `_unmatched`.
+        context.route("**/*", self._unmatched)
+        context.route_from_har(self.path, not_found="fallback")
+        return self
+
+    def describe_unmatched(self) -> str:
+        lines = "\n".join(f"  {request}" for request in self.unmatched)
+        return (
+            f"{len(self.unmatched)} request(s) were not in {self.path} and got HTTP {UNMATCHED_STATUS}:\n"
+            f"{lines}\nRe-record with --mcd-har=record if the test or the app changed."
+        )
+
+    def _unmatched(self, route: Route) -> None:
+        request = route.request
+        self.unmatched.append(f"{request.method} {request.url}")
+        route.fulfill(
+            status=UNMATCHED_STATUS,
+            content_type="text/plain",
+            body=f"Not recorded in HAR: {request.method} {request.url}",
+        )
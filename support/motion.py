@@ -0,0 +1,162 @@
+"""
+This module takes animation time out of UI tests. In "reduced" mode every context prefers reduced
+motion, CSS transitions and animations finish at once, and toasts are hidden after a short lifetime,
+so actionability checks no longer wait for modals and menus to settle.
+
+An init script also measures the animation time involved: in "reduced" mode, what the app's CSS
+would have taken; in "full" mode, what it actually took. Each test reports the totals, which
+the timing report (`support/timing_report.py`) shows per test and per run.
+"""
+import json
+from typing import Dict
+
+from playwright.sync_api import BrowserContext
+
+# Accepted values for MCDYNECT_MOTION and the `motion(...)` marker.
+MOTION_MODES = ("reduced", "full")
+
+# user_properties key carrying a test's motion summary.
+MOTION_PROPERTY = "motion"
+
+# Toast containers only: the app's `.toast` / `[data-toast]` and common Vue/JS toast libraries.
+# Not `[role='status']`: that live region also holds loading indicators and inline "Saved" messages.
+DEFAULT_TOAST_SELECTOR = (
+    ".toast, [data-toast], .Toastify__toast, .swal2-toast, .v-toast__item, .notyf__toast"
+)
+
+_BINDING = "__mcdMotionReport"
+
+_INIT_SCRIPT = """
+(({ reduce, toastMs, toastSelector, binding }) => {
+  if (window.__mcdMotion) return;
+  window.__mcdMotion = true;
+  const css = `
+    *, *::before, *::after {
+      transition-duration: 0.01ms !important; transition-delay: 0s !important;
+      animation-duration: 0.01ms !important; animation-delay: 0s !important;
+      animation-iteration-count: 1 !important; scroll-behavior: auto !important;
+    }
+    [data-mcd-toast-expired] { display: none !important; }`;
+  const style = document.createElement("style");
+  style.textContent = css;
+  const addStyle = () => (document.head || document.documentElement).appendChild(style);
+  if (reduce) {
+    if (document.documentElement) addStyle();
+    else new MutationObserver((_, observer) => {
+      if (document.documentElement) { observer.disconnect(); addStyle(); }
+    }).observe(document, { childList: true });
+  }
+
+  const seconds = (value) => value.split(",").map((part) => {
+    const number = parseFloat(part);
+    return isNaN(number) ? 0 : (part.trim().endsWith("ms") ? number / 1000 : number);
+  });
+  // What the app's CSS asks for: with the override active, read the styles without it.
+  const declaredMs = (target, kind) => {
+    if (reduce) style.disabled = true;
+    const computed = getComputedStyle(target);
+    const durations = seconds(computed[kind + "Duration"]);
+    const delays = seconds(computed[kind + "Delay"]);
+    if (reduce) style.disabled = false;
+    return 1000 * Math.max(0, ...durations.map((duration, i) => duration + (delays[i % delays.length] || 0)));
+  };
+
+  // Animations started in the same frame overlap, so each frame counts its longest one.
+  const pending = { interactions: 0, transitions: 0, animations: 0, toasts: 0, animated_ms: 0 };
+  let frameMax = 0;
+  let flushQueued = false;
+  const flush = () => {
+    flushQueued = false;
+    if (frameMax > 0) { pending.interactions += 1; pending.animated_ms += frameMax; frameMax = 0; }
+    const report = Object.assign({}, pending);
+    Object.keys(pending).forEach((key) => { pending[key] = 0; });
+    if (report.transitions || report.animations || report.toasts) window[binding](report).catch(() => {});
+  };
+  const queue = () => {
+    if (!flushQueued) { flushQueued = true; requestAnimationFrame(() => setTimeout(flush, 0)); }
+  };
+  const started = (kind) => (event) => {
+    if (!(event.target instanceof Element)) return;
+    pending[kind + "s"] += 1;
+    frameMax = Math.max(frameMax, declaredMs(event.target, kind));
+    queue();
+  };
+  addEventListener("transitionrun", started("transition"), true);
+  addEventListener("animationstart", started("animation"), true);
+
+  if (toastMs > 0) {
+    const timers = new WeakMap();
+    const schedule = (toast) => {
+      clearTimeout(timers.get(toast));
+      toast.removeAttribute("data-mcd-toast-expired");
+      if (toast.hidden || !toast.getClientRects().length) return;
+      timers.set(toast, setTimeout(() => {
+        toast.setAttribute("data-mcd-toast-expired", "");
+        pending.toasts += 1;
+        queue();
+      }, toastMs));
+    };
+    new MutationObserver((mutations) => {
+      const toasts = new Set();
+      for (const mutation of mutations) {
+        if (mutation.attributeName === "data-mcd-toast-expired") continue;
+        const node = mutation.target.nodeType === 1 ? mutation.target : mutation.target.parentElement;
+        const toast = node && node.closest(toastSelector);
+        if (toast) toasts.add(toast);
+        for (const added of mutation.addedNodes) {
+          if (added.nodeType !== 1) continue;
+          if (added.matches(toastSelector)) toasts.add(added);
+          added.querySelectorAll(toastSelector).forEach((found) => toasts.add(found));
+        }
+      }
+      toasts.forEach(schedule);
+    }).observe(document, {
+      childList: true, subtree: true, characterData: true,
+      attributes: true, attributeFilter: ["hidden", "class", "style"],
+    });
+  }
+})
+"""
+
+
+class MotionControl:
+    """
+    Animation handling and accounting for one browser context.
+    Create it before the context (it supplies `new_context` options), then `attach` it to the context.
+    """
+
+    def __init__(self, mode: str, toast_ms: int, toast_selector: str = DEFAULT_TOAST_SELECTOR):
+        if mode not in MOTION_MODES:
+            raise ValueError(f"Unknown motion mode {mode!r}; use one of {', '.join(MOTION_MODES)}.")
+        self.mode = mode
+        # Toasts are hidden after this many ms in "reduced" mode (0 keeps the app's own timing).
+        self.toast_ms = toast_ms if mode == "reduced" else 0
+        self.toast_selector = toast_selector
+        self.totals: Dict[str, float] = {
+            "interactions": 0, "transitions": 0, "animations": 0, "toasts": 0, "animated_ms": 0.0,
+        }
+
+    def context_options(self) -> dict:
+        return {"reduced_motion": "reduce"} if self.mode == "reduced" else {}
+
+    def attach(self, context: BrowserContext) -> "MotionControl":
+        context.expose_binding(_BINDING, self._report)
+        options = {
+            "reduce": self.mode == "reduced",
+            "toastMs": self.toast_ms,
+            "toastSelector": self.toast_selector,
+            "binding": _BINDING,
+        }
+        context.add_init_script(f"{_INIT_SCRIPT}({json.dumps(options)});")
+        return self
+
+    def summary(self) -> dict:
+        """
+        The test's motion figures: `animated_ms` is the animation time skipped ("reduced") or spent
+        ("full"), counted once per animated interaction (animations started together).
+        """
+        return {"mode": self.mode, **{key: round(value, 1) for key, value in self.totals.items()}}
+
+    def _report(self, source, report: dict) -> None:
+        for key in self.totals:
+            self.totals[key] += report.get(key, 0)
@@ -0,0 +1,115 @@
+"""
+This module blocks requests a test never needs (analytics beacons, web fonts, media, images) before
+they leave the browser, and counts what it blocked per test.
+
+Modes, from least to most aggressive:
+- "off": nothing is blocked;
+- "safe": only analytics and tracking requests, which never change what the app renders;
+- "lean": "safe" plus fonts and media (aborted) and images (answered with a 1x1 GIF).
+
+The mode comes from `MCDYNECT_NETWORK_POLICY` (default "safe") or a test's
+`@pytest.mark.network_policy("lean")` marker. Tests marked `@pytest.mark.visual` always run with "off".
+"""
+import base64
+import re
+from typing import Dict, List, Optional, Pattern, Set
+
+from playwright.sync_api import BrowserContext, Route
+
+# Accepted values for MCDYNECT_NETWORK_POLICY and the network_policy marker.
+NETWORK_POLICIES = ("off", "safe", "lean")
+
+ANALYTICS_URL = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|connect\.facebook\.net|facebook\.com/tr"
+    r"|hotjar\.com|clarity\.ms|segment\.(io|com)|mixpanel\.com|amplitude\.com|sentry\.io|newrelic\.com"
+    r"|nr-data\.net|tiktok\.com/i18n/pixel|analytics\.tiktok\.com"
+)
+
+# Smallest valid transparent GIF, served in place of blocked images so `load` events still fire.
+_BLANK_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+# Empty bodies for stubbed requests, by resource type; anything else gets 204 No Content.
+_STUBS = {
+    "image": ("image/gif", _BLANK_GIF),
+    "script": ("application/javascript", b""),
+    "stylesheet": ("text/css", b""),
+}
+
+
+class BlockRule:
+    """
+    Blocks requests whose resource type is in `resource_types` (any type when empty) and whose URL
+    matches `url_pattern` (any URL when None), by aborting them or answering with an empty stub.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        action: str,
+        resource_types: Optional[Set[str]] = None,
+        url_pattern: Optional[Pattern] = None,
+    ):
+        if action not in ("abort", "stub"):
+            raise ValueError(f"Unknown block action {action!r}; use 'abort' or 'stub'.")
+        self.name = name
+        self.action = action
+        self.resource_types = resource_types or set()
+        self.url_pattern = url_pattern
+
+    def matches(self, resource_type: str, url: str) -> bool:
+        if self.resource_types and resource_type not in self.resource_types:
+            return False
+        return self.url_pattern is None or bool(self.url_pattern.search(url))
+
+
+def rules_for(mode: str, extra_patterns: Optional[List[str]] = None) -> List[BlockRule]:
+    """
+    Rules of a mode, plus an abort rule per `extra_patterns` regex (MCDYNECT_BLOCK_URLS) unless the mode is "off".
+    """
+    if mode not in NETWORK_POLICIES:
+        raise ValueError(f"Unknown network policy {mode!r}; use one of {', '.join(NETWORK_POLICIES)}.")
+    if mode == "off":
+        return []
+    rules = [BlockRule("analytics", "stub", url_pattern=ANALYTICS_URL)]
+    rules += [BlockRule(f"url:{pattern}", "abort", url_pattern=re.compile(pattern)) for pattern in extra_patterns or []]
+    if mode == "lean":
+        rules += [
+            BlockRule("font", "abort", {"font"}),
+            BlockRule("media", "abort", {"media"}),
+            BlockRule("image", "stub", {"image"}),
+        ]
+    return rules
+
+
+class NetworkPolicy:
+    """
+    Applies a list of BlockRules to one browser context and counts blocked requests by rule name.
+    Requests no rule matches fall through to the other route handlers (asset cache, HAR) or the network.
+    """
+
+    def __init__(self, mode: str, rules: List[BlockRule]):
+        self.mode = mode
+        self.rules = rules
+        # Rule name -> number of requests it blocked.
+        self.blocked: Dict[str, int] = {}
+
+    def attach(self, context: BrowserContext) -> "NetworkPolicy":
+        # Registered last, so it runs before the other route handlers and blocked requests cost nothing.
+        if self.rules:
+            context.route("**/*", self._handle)
+        return self
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        for rule in self.rules:
+            if rule.matches(request.resource_type, request.url):
+                self.blocked[rule.name] = self.blocked.get(rule.name, 0) + 1
+                if rule.action == "abort":
+                    route.abort("blockedbyclient")
+                else:
+                    content_type, body = _STUBS.get(request.resource_type, (None, None))
+                    if body is None:
+                        route.fulfill(status=204)
+                    else:
+                        route.fulfill(status=200, content_type=content_type, body=body)
+                return
+        route.fallback()
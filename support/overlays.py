@@ -0,0 +1,43 @@
+"""
+This module dismisses known overlays (e.g. the "Grab credentials" modal) whenever they block a test.
+It uses Playwright's `page.add_locator_handler`: the check runs only before actions and
+auto-waiting assertions, so pages where the overlay never appears pay nothing.
+"""
+from playwright.sync_api import Locator, Page
+
+from ui.dashboard_page_ui import DashboardPageUI
+
+
+class OverlayDismisser:
+    """
+    Clicks an overlay's dismiss button every time the overlay appears, and counts how often it did.
+    """
+
+    def __init__(self, name: str, dismiss_selector: str):
+        # Short name used in results (e.g. "maybe_later").
+        self.name = name
+        self.dismiss_selector = dismiss_selector
+        self.fired = 0
+
+    @staticmethod
+    def maybe_later() -> "OverlayDismisser":
+        """
+        Dismisser for the post-login "Grab credentials" modal ("Maybe Later").
+        """
+        return OverlayDismisser("maybe_later", DashboardPageUI.MAYBE_LATER_BUTTON)
+
+    def install(self, page: Page) -> "OverlayDismisser":
+        """
+        Registers the handler on `page`; it stays active for the page's whole life.
+        """
+        page.add_locator_handler(page.locator(self.dismiss_selector), self._dismiss)
+        return self
+
+    def _dismiss(self, button: Locator) -> None:
+        self.fired += 1
+        # Playwright then waits for the overlay to disappear before retrying the blocked action.
+        button = button.first
+        try:
+            button.click()
+        except Exception:
+            button.click(force=True)
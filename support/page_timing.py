@@ -0,0 +1,168 @@
+"""
+This module measures how long the test thread spends blocked inside Playwright calls, by kind of call.
+Every sync API call (actions, waits, navigations, `expect` assertions) goes through `SyncBase._sync`,
+so timing that one method covers BrowseTheWeb, tasks and tests that use the page directly alike.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+try:
+    # Internal but stable chokepoint of the sync API; timing is skipped if it ever moves.
+    from playwright._impl._sync_base import SyncBase
+except ImportError:  # pragma: no cover - depends on the installed Playwright version
+    SyncBase = None
+
+# Where a test's wall time can go. "overhead" is whatever is left: Python, pytest and fixtures.
+CATEGORIES = ("sleep", "navigation", "locator", "screenshot", "artifacts", "other_playwright", "overhead")
+
+_SLEEP_METHODS = {"wait_for_timeout"}
+_NAVIGATION_METHODS = {
+    "goto", "reload", "go_back", "go_forward", "wait_for_url", "wait_for_load_state", "wait_for_navigation",
+    "set_content",
+}
+# Page/Frame methods that resolve a selector (and so auto-wait for it).
+_SELECTOR_METHODS = {
+    "click", "dblclick", "fill", "type", "press", "check", "uncheck", "set_checked", "hover", "focus", "tap",
+    "select_option", "set_input_files", "dispatch_event", "drag_and_drop", "is_visible", "is_hidden",
+    "is_enabled", "is_disabled", "is_checked", "is_editable", "inner_text", "inner_html", "text_content",
+    "get_attribute", "input_value", "wait_for_selector", "wait_for_function", "query_selector",
+    "query_selector_all", "eval_on_selector", "eval_on_selector_all",
+}
+_LOCATOR_OWNERS = {"Locator", "FrameLocator", "ElementHandle", "LocatorAssertions", "PageAssertions"}
+
+
+def categorize(qualname: str) -> str:
+    """
+    Maps a Playwright implementation method (e.g. "Page.goto", "Locator.click") to a timing category.
+    """
+    owner, _, method = qualname.rpartition(".")
+    if method in _SLEEP_METHODS:
+        return "sleep"
+    if method in _NAVIGATION_METHODS:
+        return "navigation"
+    if method == "screenshot":
+        return "screenshot"
+    if owner in _LOCATOR_OWNERS or (owner in ("Page", "Frame") and method in _SELECTOR_METHODS):
+        return "locator"
+    return "other_playwright"
+
+
+class PlaywrightClock:
+    """
+    Per-thread running totals of seconds spent in Playwright sync calls, overall and per category.
+    Nested calls (e.g. a call made from an event handler during another call) are counted once.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._original_sync = None
+        # Coroutine qualname -> category, filled lazily.
+        self._categories: Dict[str, str] = {}
+
+    @property
+    def installed(self) -> bool:
+        return self._original_sync is not None
+
+    def install(self) -> bool:
+        """
+        Starts timing Playwright calls. Returns False when the sync API chokepoint is unavailable.
+        """
+        if self.installed:
+            return True
+        if SyncBase is None or not hasattr(SyncBase, "_sync"):
+            return False
+        original = SyncBase._sync
+        clock = self
+
+        def _timed_sync(sync_base, coro):
+            __tracebackhide__ = True
+            local = clock._local
+            if getattr(local, "depth", 0):
+                return original(sync_base, coro)
+            local.depth = 1
+            started = time.perf_counter()
+            try:
+                return original(sync_base, coro)
+            finally:
+                local.depth = 0
+                clock._add(local, coro, time.perf_counter() - started)
+
+        self._original_sync = original
+        SyncBase._sync = _timed_sync
+        return True
+
+    def uninstall(self) -> None:
+        if self.installed:
+            SyncBase._sync = self._original_sync
+            self._original_sync = None
+
+    def elapsed(self) -> Optional[float]:
+        """
+        Seconds this thread has spent in Playwright calls so far, or None when not installed.
+        Callers take differences between two readings.
+        """
+        if not self.installed:
+            return None
+        return getattr(self._local, "total", 0.0)
+
+    def by_category(self) -> Dict[str, float]:
+        """
+        Copy of this thread's running totals per category (differences give per-test figures).
+        """
+        return dict(getattr(self._local, "by_category", {}))
+
+    @contextmanager
+    def attribute_to(self, category: str):
+        """
+        Counts every Playwright call inside the block as `category` (e.g. "artifacts" for screenshot work).
+        """
+        previous = getattr(self._local, "override", None)
+        self._local.override = category
+        try:
+            yield
+        finally:
+            self._local.override = previous
+
+    def _add(self, local, coro, seconds: float) -> None:
+        category = getattr(local, "override", None)
+        if category is None:
+            qualname = getattr(coro, "__qualname__", "")
+            category = self._categories.get(qualname)
+            if category is None:
+                category = self._categories[qualname] = categorize(qualname)
+        local.total = getattr(local, "total", 0.0) + seconds
+        if not hasattr(local, "by_category"):
+            local.by_category = {}
+        local.by_category[category] = local.by_category.get(category, 0.0) + seconds
+
+
+class TestTiming:
+    """
+    Splits one test's wall time (setup to teardown) into CATEGORIES.
+    """
+
+    # Not a test class, despite the name.
+    __test__ = False
+
+    def __init__(self, clock: PlaywrightClock):
+        self.clock = clock
+        self.started = time.perf_counter()
+        self.before = clock.by_category()
+
+    def finish(self) -> Dict[str, float]:
+        wall = time.perf_counter() - self.started
+        after = self.clock.by_category()
+        breakdown = {
+            category: round(after.get(category, 0.0) - self.before.get(category, 0.0), 3)
+            for category in CATEGORIES
+            if category != "overhead"
+        }
+        breakdown["overhead"] = round(max(wall - sum(breakdown.values()), 0.0), 3)
+        breakdown["wall"] = round(wall, 3)
+        return breakdown
+
+
+# One clock per process; conftest installs it at session start.
+PLAYWRIGHT_CLOCK = PlaywrightClock()
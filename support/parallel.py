@@ -0,0 +1,46 @@
+"""
+This module contains helpers for running the suite under pytest-xdist (`pytest -n auto`).
+The controller process owns the run folder; every worker launches its own browser
+and writes its artifacts into a per-worker subfolder of that run folder.
+"""
+import os
+
+# Key used to hand the controller's run folder to each worker.
+RUN_DIR_KEY = "mcd_test_output_dir"
+# Key under which each worker returns its Task/Question timing samples to the controller.
+ACTIVITY_OUTPUT_KEY = "mcd_activity_samples"
+# Key under which each worker returns its asset cache counters to the controller.
+ASSET_CACHE_OUTPUT_KEY = "mcd_asset_cache_stats"
+# Worker id used when the suite runs in a single process.
+MAIN_WORKER = "main"
+
+
+def is_worker(config) -> bool:
+    # xdist sets `workerinput` only on worker processes.
+    return hasattr(config, "workerinput")
+
+
+def worker_id(config) -> str:
+    # "gw0", "gw1", ... under xdist, "main" otherwise.
+    if is_worker(config):
+        return config.workerinput.get("workerid", MAIN_WORKER)
+    return MAIN_WORKER
+
+
+def shared_run_dir(config):
+    # The run folder created by the controller, or None outside a worker.
+    if is_worker(config):
+        return config.workerinput.get(RUN_DIR_KEY)
+    return None
+
+
+def worker_subdir(config, *parts: str) -> str:
+    """
+    Returns `<run folder>/<parts...>[/<worker id>]` and creates it.
+    The worker segment keeps artifacts from concurrent workers from colliding.
+    """
+    path = os.path.join(config.test_output_dir, *parts)
+    if is_worker(config):
+        path = os.path.join(path, worker_id(config))
+    os.makedirs(path, exist_ok=True)
+    return path
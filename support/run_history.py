@@ -0,0 +1,295 @@
+"""
+This module keeps every run's per-test results in one SQLite file (`test_runs/history.sqlite` by default),
+so durations, trends and flakiness can be queried across runs instead of read from single run folders.
+
+    python -m support.run_history slowest --limit 10
+    python -m support.run_history trend test_licensee_add_staff
+    python -m support.run_history flaky --min-runs 5
+    python -m support.run_history runs
+"""
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_HISTORY_PATH = str(Path(__file__).resolve().parents[1] / "test_runs" / "history.sqlite")
+
+
+def base_nodeid(nodeid: str) -> str:
+    """
+    Drops the `@<group>` suffix pytest-xdist adds under `--dist loadgroup`, so history keys stay stable.
+    """
+    # Same rule as xdist: an "@" after the last "]" is a group suffix, not part of a parameter id.
+    at = nodeid.rfind("@")
+    return nodeid[:at] if at > nodeid.rfind("]") else nodeid
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at  TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    run_dir     TEXT,
+    browser     TEXT,
+    base_url    TEXT,
+    workers     INTEGER,
+    summary     TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id    INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    nodeid    TEXT NOT NULL,
+    outcome   TEXT NOT NULL,
+    duration  REAL NOT NULL,
+    setup     REAL,
+    call      REAL,
+    teardown  REAL,
+    retries   INTEGER NOT NULL DEFAULT 0,
+    worker    TEXT,
+    run_date  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_results_nodeid ON results(nodeid, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_run_date ON results(run_date);
+CREATE INDEX IF NOT EXISTS idx_results_run_id ON results(run_id);
+"""
+
+
+class RunHistory:
+    """
+    Reads and writes the run-history database. Only the pytest controller writes, once per session.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "RunHistory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Writing ------------------------------------------------------------------------------------
+
+    def record_run(
+        self,
+        tests: Iterable,
+        started_at: datetime,
+        finished_at: datetime,
+        run_dir: Optional[str] = None,
+        browser: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ) -> int:
+        """
+        Stores one session's `TestResult`s (see `support/run_results.py`) and returns the run id.
+        """
+        tests = list(tests)
+        summary: Dict[str, int] = {}
+        for result in tests:
+            summary[result.outcome] = summary.get(result.outcome, 0) + 1
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, finished_at, run_dir, browser, base_url, workers, summary) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    started_at.isoformat(timespec="seconds"),
+                    finished_at.isoformat(timespec="seconds"),
+                    run_dir,
+                    browser,
+                    base_url,
+                    len({result.worker for result in tests}),
+                    json.dumps(summary),
+                ),
+            )
+            run_id = cursor.lastrowid
+            run_date = started_at.date().isoformat()
+            self.connection.executemany(
+                "INSERT INTO results (run_id, nodeid, outcome, duration, setup, call, teardown, retries, worker, "
+                "run_date) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        base_nodeid(result.nodeid),
+                        result.outcome,
+                        round(result.duration, 3),
+                        self._phase(result, "setup"),
+                        self._phase(result, "call"),
+                        self._phase(result, "teardown"),
+                        result.retries,
+                        result.worker,
+                        run_date,
+                    )
+                    for result in tests
+                ],
+            )
+        return run_id
+
+    @staticmethod
+    def _phase(result, when: str) -> Optional[float]:
+        phase = result.phases.get(when)
+        return round(phase[1], 3) if phase else None
+
+    # Queries ------------------------------------------------------------------------------------
+
+    def runs(self, limit: int = 20) -> List[sqlite3.Row]:
+        return self.connection.execute(
+            "SELECT * FROM runs ORDER BY started_at DESC, id DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+    def durations(self, last_runs: int = 10) -> Dict[str, float]:
+        """
+        Average seconds per node id over the last `last_runs` runs, ignoring skipped results.
+        """
+        rows = self.connection.execute(
+            """
+            SELECT nodeid, AVG(duration) AS avg_duration FROM results
+            WHERE run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?) AND outcome != 'skipped'
+            GROUP BY nodeid
+            """,
+            (last_runs,),
+        ).fetchall()
+        return {row["nodeid"]: row["avg_duration"] for row in rows}
+
+    def slowest(self, limit: int = 10, since: Optional[str] = None, last_runs: int = 10) -> List[sqlite3.Row]:
+        """
+        Tests by average duration over the last `last_runs` runs (optionally only runs on/after `since`).
+        """
+        return self.connection.execute(
+            """
+            SELECT nodeid, COUNT(*) AS runs, AVG(duration) AS avg_duration, MAX(duration) AS max_duration
+            FROM results
+            WHERE run_id IN (SELECT id FROM runs WHERE started_at >= ? ORDER BY id DESC LIMIT ?)
+              AND outcome != 'skipped'
+            GROUP BY nodeid
+            ORDER BY avg_duration DESC
+            LIMIT ?
+            """,
+            (since or "", last_runs, limit),
+        ).fetchall()
+
+    def trend(self, nodeid_part: str, limit: int = 20) -> List[sqlite3.Row]:
+        """
+        Most recent results of tests whose node id contains `nodeid_part`, newest first.
+        """
+        return self.connection.execute(
+            """
+            SELECT runs.started_at, results.nodeid, results.outcome, results.duration, results.retries
+            FROM results JOIN runs ON runs.id = results.run_id
+            WHERE results.nodeid LIKE ?
+            ORDER BY runs.started_at DESC, runs.id DESC
+            LIMIT ?
+            """,
+            (f"%{nodeid_part}%", limit),
+        ).fetchall()
+
+    def flaky(self, min_runs: int = 3, last_runs: int = 50) -> List[dict]:
+        """
+        Flake report over the last `last_runs` runs. A test counts as flaky in a run when it passed
+        only after a retry; `flip_rate` is how often its outcome changed between consecutive runs.
+        """
+        rows = self.connection.execute(
+            """
+            SELECT nodeid, outcome, retries FROM results
+            WHERE run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?) AND outcome != 'skipped'
+            ORDER BY nodeid, run_id
+            """,
+            (last_runs,),
+        ).fetchall()
+        by_test: Dict[str, List[sqlite3.Row]] = {}
+        for row in rows:
+            by_test.setdefault(row["nodeid"], []).append(row)
+        report = []
+        for nodeid, results in by_test.items():
+            if len(results) < min_runs:
+                continue
+            outcomes = [row["outcome"] for row in results]
+            flips = sum(1 for before, after in zip(outcomes, outcomes[1:]) if before != after)
+            retried_passes = sum(1 for row in results if row["retries"] and row["outcome"] == "passed")
+            failures = sum(1 for outcome in outcomes if outcome in ("failed", "error"))
+            report.append(
+                {
+                    "nodeid": nodeid,
+                    "runs": len(results),
+                    "fail_rate": failures / len(results),
+                    "flake_rate": retried_passes / len(results),
+                    "flip_rate": flips / (len(results) - 1),
+                }
+            )
+        report.sort(key=lambda entry: (-(entry["flake_rate"] + entry["flip_rate"]), entry["nodeid"]))
+        return [entry for entry in report if entry["flake_rate"] or entry["flip_rate"]]
+
+
+def _print_table(headers: List[str], rows: List[list]) -> None:
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)] if rows else []
+    if not rows:
+        print("(no data)")
+        return
+    for line in [headers] + rows:
+        print("  ".join(str(value).ljust(width) for value, width in zip(line, widths)))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m support.run_history", description="Query the run history.")
+    parser.add_argument(
+        "--db", default=os.getenv("MCDYNECT_RUN_HISTORY") or DEFAULT_HISTORY_PATH, help="SQLite file to read."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    slowest = commands.add_parser("slowest", help="Slowest tests by average duration.")
+    slowest.add_argument("--limit", type=int, default=10)
+    slowest.add_argument("--last-runs", type=int, default=10)
+    slowest.add_argument("--since", help="Only runs started on/after this date (YYYY-MM-DD).")
+    trend = commands.add_parser("trend", help="Duration and outcome history of matching tests.")
+    trend.add_argument("nodeid", help="Substring of the test node id.")
+    trend.add_argument("--limit", type=int, default=20)
+    flaky = commands.add_parser("flaky", help="Tests that pass after retries or change outcome between runs.")
+    flaky.add_argument("--min-runs", type=int, default=3)
+    flaky.add_argument("--last-runs", type=int, default=50)
+    runs = commands.add_parser("runs", help="Recent runs.")
+    runs.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.exit(1, f"No run history at {args.db}. Run the suite first.\n")
+    with RunHistory(args.db) as history:
+        if args.command == "slowest":
+            rows = history.slowest(args.limit, args.since, args.last_runs)
+            _print_table(
+                ["avg s", "max s", "runs", "test"],
+                [[f"{r['avg_duration']:.2f}", f"{r['max_duration']:.2f}", r["runs"], r["nodeid"]] for r in rows],
+            )
+        elif args.command == "trend":
+            rows = history.trend(args.nodeid, args.limit)
+            _print_table(
+                ["started", "outcome", "s", "retries", "test"],
+                [[r["started_at"], r["outcome"], f"{r['duration']:.2f}", r["retries"], r["nodeid"]] for r in rows],
+            )
+        elif args.command == "flaky":
+            entries = history.flaky(args.min_runs, args.last_runs)
+            _print_table(
+                ["flake %", "flip %", "fail %", "runs", "test"],
+                [
+                    [f"{100 * e['flake_rate']:.0f}", f"{100 * e['flip_rate']:.0f}", f"{100 * e['fail_rate']:.0f}",
+                     e["runs"], e["nodeid"]]
+                    for e in entries
+                ],
+            )
+        else:
+            rows = history.runs(args.limit)
+            _print_table(
+                ["id", "started", "browser", "workers", "summary", "base url"],
+                [[r["id"], r["started_at"], r["browser"], r["workers"], r["summary"], r["base_url"]] for r in rows],
+            )
+
+
+if __name__ == "__main__":
+    main()
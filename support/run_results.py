@@ -0,0 +1,93 @@
+"""
+This module collects per-test results from pytest reports and writes them as one JSON file.
+Under pytest-xdist the controller receives every worker's reports, so the file covers the whole run.
+"""
+import json
+from typing import Dict
+
+from support.parallel import MAIN_WORKER
+
+
+class TestResult:
+    """
+    Outcome and phase timings for one test node id.
+    """
+
+    # Not a test class, despite the name.
+    __test__ = False
+
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+        self.worker = MAIN_WORKER
+        # Phase ("setup"/"call"/"teardown") -> (outcome, duration in seconds).
+        self.phases: Dict[str, tuple] = {}
+        # `user_properties` recorded by fixtures (e.g. how often an overlay was dismissed).
+        self.properties: Dict[str, object] = {}
+        # Attempts that pytest-rerunfailures discarded before the final one.
+        self.retries = 0
+
+    @property
+    def outcome(self) -> str:
+        outcomes = {when: outcome for when, (outcome, _) in self.phases.items()}
+        if outcomes.get("call") == "failed":
+            return "failed"
+        if "failed" in outcomes.values():
+            # Setup/teardown failures are reported as errors, like pytest does.
+            return "error"
+        if "skipped" in outcomes.values():
+            return "skipped"
+        return "passed"
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for _, duration in self.phases.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "nodeid": self.nodeid,
+            "outcome": self.outcome,
+            "duration": round(self.duration, 3),
+            "worker": self.worker,
+            "retries": self.retries,
+            "phases": {
+                when: {"outcome": outcome, "duration": round(duration, 3)}
+                for when, (outcome, duration) in self.phases.items()
+            },
+            "properties": self.properties,
+        }
+
+
+class RunResults:
+    """
+    Accumulates test reports for the session and writes `results.json`.
+    Registered as a pytest plugin on the controller so it sees every worker's reports.
+    """
+
+    def __init__(self):
+        self.tests: Dict[str, TestResult] = {}
+
+    def pytest_runtest_logreport(self, report) -> None:
+        self.record(report)
+
+    def record(self, report) -> None:
+        result = self.tests.setdefault(report.nodeid, TestResult(report.nodeid))
+        # xdist attaches the id of the worker that produced the report.
+        result.worker = getattr(report, "worker_id", None) or result.worker
+        if report.outcome == "rerun":
+            result.retries += 1
+        result.phases[report.when] = (report.outcome, report.duration)
+        result.properties.update(dict(report.user_properties))
+
+    def summary(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for result in self.tests.values():
+            counts[result.outcome] = counts.get(result.outcome, 0) + 1
+        return counts
+
+    def write(self, path: str, **extra) -> None:
+        payload = dict(extra)
+        payload["summary"] = self.summary()
+        payload["workers"] = sorted({result.worker for result in self.tests.values()})
+        payload["tests"] = [result.to_dict() for result in self.tests.values()]
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
@@ -0,0 +1,213 @@
+"""
+This module catalogs the sales records each licensee account already has, so data-dependent tests
+(MCD-LCSE-16..20) open a record by URL instead of rediscovering one from the listing every time.
+
+The Daily sales and Extra sets listings of an account are crawled once, the first time a test asks,
+in a throwaway browser context. The catalog is kept for the session and saved to
+`.pw_home/sales_catalog/` for MCDYNECT_SALES_CATALOG_TTL seconds, so other xdist workers and
+quick re-runs reuse it without crawling. Each worker re-reads the file when it changes, so a
+record one worker forgets (deleted) or a catalog it invalidates (outlet switched, record added)
+reaches the others too.
+"""
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Browser
+
+from abilities.browse_the_web import BrowseTheWeb
+from abilities.call_an_api import CallAnAPI
+from abilities.wait_for import WaitFor
+from actors.base_actor import Actor
+from config.credentials import BASE_URL
+from questions.licensee.sales_listing import EXTRA_SETS_TAB, SalesListing, SalesRecords, SalesRow
+from tasks.login import Login
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
+
+# Listings that are crawled, keyed by the record kind tests ask for.
+SALES_KINDS = ("daily", "extra")
+
+# Bump when the file format changes; files written by other versions are ignored.
+CATALOG_VERSION = 1
+
+
+class SalesCatalog:
+    """
+    Per-account catalog of sales records that have a details page, by kind ("daily" or "extra").
+    With `ttl_seconds` 0 nothing is written to disk and each session crawls for itself.
+    """
+
+    def __init__(self, browser: Browser, catalog_dir: str, ttl_seconds: float):
+        self.browser = browser
+        self.catalog_dir = catalog_dir
+        self.ttl_seconds = ttl_seconds
+        # email -> kind -> rows with a details link.
+        self._catalogs: Dict[str, Dict[str, List[SalesRow]]] = {}
+        # email -> when its listings were crawled (epoch seconds); the TTL counts from here.
+        self._crawled_at: Dict[str, float] = {}
+        # email -> mtime (ns) of the saved file the in-memory catalog matches; None when unsaved.
+        self._file_mtime: Dict[str, Optional[int]] = {}
+        if ttl_seconds > 0:
+            os.makedirs(catalog_dir, exist_ok=True)
+
+    def records_for(self, email: str, password: str, kind: str = "daily") -> SalesRecords:
+        """
+        The account's `kind` records, crawling the listings on first use.
+        Empty when the crawl failed; callers then read the listing themselves.
+        Example: `row = sales_catalog.records_for(email, password).first_to_open()`.
+        """
+        if kind not in SALES_KINDS:
+            raise ValueError(f"Unknown sales kind {kind!r}; use one of {', '.join(SALES_KINDS)}.")
+        if email in self._catalogs and self._changed_on_disk(email):
+            # Another worker forgot a record, invalidated the catalog or crawled again.
+            del self._catalogs[email]
+        if email not in self._catalogs:
+            self._catalogs[email] = self._load(email) or self._crawl_or_empty(email, password)
+        return SalesRecords(list(self._catalogs[email][kind]))
+
+    def forget(self, email: str, details_href: str) -> None:
+        """
+        Drops one record (e.g. after a test deleted it) from the session's and the saved catalog.
+        """
+        catalog = self._catalogs.get(email)
+        if catalog is None:
+            return
+        for kind in SALES_KINDS:
+            catalog[kind] = [row for row in catalog[kind] if row.details_href != details_href]
+        # A catalog the crawl could not fill stays unsaved.
+        if email in self._crawled_at:
+            self._save(email, catalog)
+
+    def invalidate(self, email: str) -> None:
+        """
+        Forgets an account's catalog (e.g. after a test added records or switched the account's
+        outlet), so the next request crawls again.
+        """
+        self._catalogs.pop(email, None)
+        self._crawled_at.pop(email, None)
+        self._file_mtime.pop(email, None)
+        if self.ttl_seconds > 0:
+            try:
+                os.remove(self._path(email))
+            except FileNotFoundError:
+                pass
+
+    # Crawling -----------------------------------------------------------------------------------
+
+    def _crawl_or_empty(self, email: str, password: str) -> Dict[str, List[SalesRow]]:
+        try:
+            return self._crawl(email, password)
+        except Exception as e:
+            # Kept (unsaved) for the session, so later tests do not crawl again.
+            print(f"⚠️ Sales catalog unavailable for {email}: {type(e).__name__}: {e}")
+            return {kind: [] for kind in SALES_KINDS}
+
+    def _crawl(self, email: str, password: str) -> Dict[str, List[SalesRow]]:
+        # A throwaway context keeps the crawl's navigation out of the test's own page.
+        context = self.browser.new_context()
+        try:
+            page = context.new_page()
+            actor = (
+                Actor("sales catalog")
+                .who_can(BrowseTheWeb.with_browser_page(page))
+                .who_can(CallAnAPI.with_browser_page(page))
+            )
+            actor.attempts_to(Login.with_credentials(email, password))
+            if not WaitFor.on(page).url(lambda url: "/login" not in url, required=False):
+                raise RuntimeError(f"Could not crawl sales records of {email}: still on {page.url} after login.")
+            actor.attempts_to(NavigateTo.the(LicenseeRoutes.SALES))
+            catalog = {"daily": self._linked_rows(actor, SalesListing())}
+            # Same page, other tab: the Extra sets tab has no URL of its own.
+            tab = page.locator(EXTRA_SETS_TAB).first
+            if WaitFor.on(page).element(tab, timeout_ms=5000, required=False):
+                tab.click()
+                catalog["extra"] = self._linked_rows(actor, SalesListing(include_extra=True))
+            else:
+                # No Extra sets tab for this outlet.
+                catalog["extra"] = []
+        finally:
+            context.close()
+        self._crawled_at[email] = time.time()
+        self._save(email, catalog)
+        return catalog
+
+    @staticmethod
+    def _linked_rows(actor: Actor, listing: SalesListing) -> List[SalesRow]:
+        # Only rows with a details link can be opened without the listing page.
+        return [row for row in actor.asks_for(listing).rows if row.details_href]
+
+    # Storage ------------------------------------------------------------------------------------
+
+    def _path(self, email: str) -> str:
+        key = hashlib.sha256(f"{BASE_URL}|{email}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.catalog_dir, f"{key}.json")
+
+    def _mtime(self, email: str) -> Optional[int]:
+        try:
+            return os.stat(self._path(email)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _changed_on_disk(self, email: str) -> bool:
+        if self.ttl_seconds <= 0:
+            return False
+        return self._mtime(email) != self._file_mtime.get(email)
+
+    def _load(self, email: str) -> Optional[Dict[str, List[SalesRow]]]:
+        self._file_mtime[email] = None
+        if self.ttl_seconds <= 0:
+            return None
+        try:
+            with open(self._path(email), encoding="utf-8") as handle:
+                payload = json.load(handle)
+                mtime = os.fstat(handle.fileno()).st_mtime_ns
+        except (FileNotFoundError, ValueError):
+            return None
+        # Remembered even when the file is unusable, so it is not re-read until it changes again.
+        self._file_mtime[email] = mtime
+        if payload.get("version") != CATALOG_VERSION or payload.get("email") != email:
+            return None
+        if time.time() - payload.get("crawled_at", 0) > self.ttl_seconds:
+            return None
+        self._crawled_at[email] = payload["crawled_at"]
+        return {kind: [_row_from_dict(raw) for raw in payload["records"].get(kind, [])] for kind in SALES_KINDS}
+
+    def _save(self, email: str, catalog: Dict[str, List[SalesRow]]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        payload = {
+            "version": CATALOG_VERSION,
+            "email": email,
+            "base_url": BASE_URL,
+            "crawled_at": self._crawled_at[email],
+            "records": {kind: [_row_to_dict(row) for row in rows] for kind, rows in catalog.items()},
+        }
+        # Write then rename, so other workers never read a partial file.
+        path = self._path(email)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+        os.replace(temp_path, path)
+        self._file_mtime[email] = self._mtime(email)
+
+
+def _row_to_dict(row: SalesRow) -> dict:
+    raw = dataclasses.asdict(row)
+    raw["date"] = row.date.isoformat() if row.date else None
+    return raw
+
+
+def _row_from_dict(raw: dict) -> SalesRow:
+    return SalesRow(
+        index=raw["index"],
+        cells=tuple(raw["cells"]),
+        visible=raw["visible"],
+        status=raw["status"],
+        date=date.fromisoformat(raw["date"]) if raw["date"] else None,
+        details_href=raw["details_href"],
+    )
@@ -0,0 +1,53 @@
+"""
+This module decides when the post-test screenshot is taken and when the page is settled enough for it.
+It replaces waiting for `networkidle`, which never settles on pages that poll or hold websockets.
+"""
+from playwright.sync_api import Page
+
+# Accepted values for MCDYNECT_SCREENSHOTS / --mcd-screenshots.
+SCREENSHOT_POLICIES = ("off", "on-failure", "always")
+
+# Resolves true once the DOM has had no mutations for `quietMs`, or false when `maxMs` is reached first.
+_DOM_STABLE_JS = """
+([quietMs, maxMs]) => new Promise((resolve) => {
+    let quietTimer = null;
+    let capTimer = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    const finish = (stable) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        resolve(stable);
+    };
+    observer.observe(document.documentElement || document, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        characterData: true,
+    });
+    quietTimer = setTimeout(() => finish(true), quietMs);
+    capTimer = setTimeout(() => finish(false), maxMs);
+})
+"""
+
+
+def should_capture(policy: str, report) -> bool:
+    """
+    Returns True when the screenshot policy asks for a capture of this test report.
+    """
+    if policy == "always":
+        return report.passed or report.failed
+    if policy == "on-failure":
+        return report.failed
+    return False
+
+
+def wait_for_dom_stable(page: Page, quiet_ms: int, max_ms: int) -> bool:
+    """
+    Waits until the DOM stops mutating for `quiet_ms`, with a hard cap of `max_ms`.
+    Returns False when the cap was hit (the page kept changing); the caller captures anyway.
+    """
+    return bool(page.evaluate(_DOM_STABLE_JS, [quiet_ms, max_ms]))
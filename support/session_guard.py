@@ -0,0 +1,178 @@
+"""
+This module notices when the app drops a signed-in session and bounces the page back to `/login`.
+
+A `framenavigated` listener on the actor's page flags the redirect the moment it happens. WaitFor
+checks the flag while it waits (see `abilities/wait_for.py`), so a dropped session no longer costs
+a full wait timeout. What happens next depends on the policy (MCDYNECT_SESSION_DROP):
+- "reauth": restore the session cookies (or sign in again over HTTP), reopen the page the redirect
+  came from and carry on with the wait;
+- "fail": stop the wait at once with a SessionDropped error that says where the session was lost;
+- "off": no listener; waits time out as before.
+"""
+import time
+import weakref
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Error, Frame, Page, Request
+
+# Accepted values for MCDYNECT_SESSION_DROP.
+SESSION_DROP_POLICIES = ("off", "fail", "reauth")
+
+# user_properties key listing a test's session drops.
+SESSION_DROP_PROPERTY = "session_drops"
+
+LOGIN_PATH = "/login"
+
+# Guard of each page, so WaitFor can find it from the page alone.
+_GUARDS: "weakref.WeakKeyDictionary[Page, SessionGuard]" = weakref.WeakKeyDictionary()
+
+
+def is_login_url(url: str) -> bool:
+    return urlsplit(url).path.rstrip("/").endswith(LOGIN_PATH)
+
+
+class SessionDropped(AssertionError):
+    """
+    Raised when the app redirected a signed-in page to the login form and the session could not be restored.
+    """
+
+
+class SessionGuard:
+    """
+    Watches one page for unexpected redirects to the login form while it is armed (signed in).
+    `sign_in`, when given, signs the account in again over HTTP and returns whether it worked;
+    it is the fallback when restoring the cookies does not bring the session back.
+    """
+
+    def __init__(self, page: Page, policy: str, sign_in: Optional[Callable[[str], bool]] = None):
+        if policy not in SESSION_DROP_POLICIES:
+            raise ValueError(f"Unknown session drop policy {policy!r}; use one of {', '.join(SESSION_DROP_POLICIES)}.")
+        self.page = page
+        self.policy = policy
+        self.sign_in = sign_in
+        # Account the page is signed in as; None while disarmed.
+        self.email: Optional[str] = None
+        # Cookies of the signed-in session, restored on "reauth".
+        self._cookies: List[dict] = []
+        # Last main-frame URL seen while signed in, and the latest main-frame document request.
+        self._last_url: Optional[str] = None
+        self._navigation: Optional[Request] = None
+        # The pending drop, if any: {"from": ..., "to": ..., "detected": monotonic seconds}.
+        self.dropped: Optional[dict] = None
+        # Every drop of the test and how it ended, for results.json.
+        self.events: List[Dict[str, object]] = []
+
+    @staticmethod
+    def for_page(page: Page) -> Optional["SessionGuard"]:
+        return _GUARDS.get(page)
+
+    def install(self) -> "SessionGuard":
+        if self.policy != "off":
+            self.page.on("request", self._on_request)
+            self.page.on("framenavigated", self._on_navigated)
+            _GUARDS[self.page] = self
+        return self
+
+    def arm(self, email: str, landing_url: Optional[str] = None) -> None:
+        """
+        Starts guarding: the page is signed in as `email` from now on.
+        `landing_url` is reopened after a drop when the page has not been anywhere else yet.
+        """
+        self.email = email
+        self.dropped = None
+        self._cookies = self.page.context.cookies() if self.policy == "reauth" else []
+        current = self.page.url
+        self._last_url = current if current.startswith("http") and not is_login_url(current) else landing_url
+
+    def disarm(self) -> None:
+        """
+        Stops guarding (logout, cleared session): the next trip to the login form is expected.
+        """
+        self.email = None
+        self.dropped = None
+        self._cookies = []
+
+    @property
+    def armed(self) -> bool:
+        return self.email is not None
+
+    def recover(self, waiting_for: str) -> None:
+        """
+        Handles the pending drop for a wait on `waiting_for`: re-authenticates and reopens the page
+        ("reauth"), or raises SessionDropped ("fail", or when re-authentication did not work).
+        """
+        drop, self.dropped = self.dropped, None
+        if drop is None:
+            return
+        drop["waiting_for"] = waiting_for
+        self.events.append(drop)
+        if self.policy == "reauth" and self._reauthenticate(drop["from"]):
+            drop["outcome"] = "reauthenticated"
+            drop["recovery_ms"] = round(1000 * (time.monotonic() - drop.pop("detected")), 1)
+            return
+        drop["outcome"] = "failed"
+        drop.pop("detected", None)
+        detail = "" if self.policy == "fail" else " and signing in again did not help"
+        raise SessionDropped(
+            f"Session of {self.email} was dropped while waiting for {waiting_for}: "
+            f"{drop['from'] or 'the page'} redirected to {drop['to']}{detail}."
+        )
+
+    # Events -------------------------------------------------------------------------------------
+
+    def _on_request(self, request: Request) -> None:
+        if not request.is_navigation_request():
+            return
+        try:
+            if request.frame == self.page.main_frame:
+                self._navigation = request
+        except Error:
+            # Navigation of a frame that does not exist yet (a new iframe).
+            pass
+
+    def _on_navigated(self, frame: Frame) -> None:
+        if frame != self.page.main_frame or not self.armed:
+            return
+        url = frame.url
+        if not is_login_url(url):
+            self._last_url = url
+            return
+        if self.dropped is None:
+            self.dropped = {"from": self._redirected_from(url), "to": url, "detected": time.monotonic()}
+
+    def _redirected_from(self, login_url: str) -> Optional[str]:
+        # A server redirect starts from the page that was asked for; a client-side one from the current page.
+        request = self._navigation
+        if request is not None and request.url == login_url and request.redirected_from is not None:
+            while request.redirected_from is not None:
+                request = request.redirected_from
+            return request.url
+        return self._last_url
+
+    # Recovery -----------------------------------------------------------------------------------
+
+    def _reauthenticate(self, resume_url: Optional[str]) -> bool:
+        resume_url = resume_url or self._last_url
+        if self._cookies:
+            self.page.context.add_cookies(self._cookies)
+            if self._reopen(resume_url):
+                return True
+        if self.sign_in is not None and self.sign_in(self.email):
+            self._cookies = self.page.context.cookies()
+            return self._reopen(resume_url)
+        return False
+
+    def _reopen(self, url: Optional[str]) -> bool:
+        if url is None:
+            return False
+        try:
+            self.page.goto(url, wait_until="domcontentloaded")
+        except Exception as e:
+            print(f"⚠️ Could not reopen {url} after a session drop: {e}")
+            return False
+        if is_login_url(self.page.url):
+            # Still signed out: the redirect was noted again, but this attempt owns it.
+            self.dropped = None
+            return False
+        return True
@@ -0,0 +1,115 @@
+"""
+This module splits the suite into shards of near-equal wall time, for `--shard i/N` (one slice per
+machine) and for `pytest -n N --dist loadgroup` (one `xdist_group` per worker).
+
+Durations come from the run history (`support/run_history.py`). Tests are placed longest first onto
+the shard that would finish earliest (longest-processing-time-first), keeping grouped tests together.
+"""
+import argparse
+import statistics
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Estimated seconds for a test with no history when the history is empty too.
+DEFAULT_TEST_SECONDS = 10.0
+# Tests marked `slow` with no history are assumed to take this many times the typical test.
+SLOW_FACTOR = 3.0
+# One-off cost of a role's first test on a shard: that shard's worker has to sign the role in.
+ROLE_LOGIN_SECONDS = 3.0
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parses `--shard i/N` (1-based) into (i, N).
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N such as 1/4, got {value!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and N, got {value!r}")
+    return index, count
+
+
+class ShardTest:
+    """
+    One test as the scheduler sees it.
+    """
+
+    # Not a test class, despite the name.
+    __test__ = False
+
+    def __init__(self, nodeid: str, seconds: float, role: Optional[str] = None, group: Optional[str] = None):
+        self.nodeid = nodeid
+        self.seconds = seconds
+        # Role whose cached login the test reuses; shards that already have it save a login.
+        self.role = role
+        # Tests with the same group always land on the same shard (e.g. they share an account).
+        self.group = group
+
+
+class DurationEstimate:
+    """
+    Expected seconds per node id: the recent average from history, else the typical (median) test.
+    """
+
+    def __init__(self, history: Dict[str, float]):
+        self.history = history
+        self.typical = statistics.median(history.values()) if history else DEFAULT_TEST_SECONDS
+
+    def seconds(self, nodeid: str, slow: bool = False) -> float:
+        if nodeid in self.history:
+            return self.history[nodeid]
+        return self.typical * (SLOW_FACTOR if slow else 1.0)
+
+    def known(self, nodeids: Iterable[str]) -> int:
+        return sum(1 for nodeid in nodeids if nodeid in self.history)
+
+
+class ShardPlan:
+    """
+    Assignment of node ids to shards 0..count-1, with each shard's estimated seconds.
+    """
+
+    def __init__(self, count: int):
+        self.count = count
+        self.assignment: Dict[str, int] = {}
+        self.loads = [0.0] * count
+        self.roles: List[set] = [set() for _ in range(count)]
+
+    def shard_of(self, nodeid: str) -> int:
+        return self.assignment[nodeid]
+
+    def describe(self) -> str:
+        sizes = [0] * self.count
+        for shard in self.assignment.values():
+            sizes[shard] += 1
+        return ", ".join(
+            f"{index + 1}/{self.count}: {sizes[index]} tests ~{load:.0f}s" for index, load in enumerate(self.loads)
+        )
+
+
+def plan_shards(tests: List[ShardTest], count: int, login_seconds: float = ROLE_LOGIN_SECONDS) -> ShardPlan:
+    """
+    Balances `tests` over `count` shards. Grouped tests move as one unit, the biggest units are
+    placed first, and each goes to the shard with the lowest resulting load (a role new to the
+    shard adds `login_seconds`). Ties go to the lower shard, so every process computes the same plan.
+    """
+    units: Dict[str, List[ShardTest]] = {}
+    for test in tests:
+        units.setdefault(f"group:{test.group}" if test.group else test.nodeid, []).append(test)
+    ordered = sorted(units.items(), key=lambda item: (-sum(test.seconds for test in item[1]), item[0]))
+
+    plan = ShardPlan(count)
+    for _, members in ordered:
+        seconds = sum(test.seconds for test in members)
+        roles = {test.role for test in members if test.role}
+
+        def cost(shard: int) -> float:
+            return plan.loads[shard] + seconds + login_seconds * len(roles - plan.roles[shard])
+
+        shard = min(range(count), key=lambda index: (cost(index), index))
+        plan.loads[shard] = cost(shard)
+        plan.roles[shard] |= roles
+        for test in members:
+            plan.assignment[test.nodeid] = shard
+    return plan
@@ -0,0 +1,100 @@
+"""
+This module collects each test's wall-time breakdown (see `support/page_timing.py`) and animation
+figures (see `support/motion.py`) and writes `timing.json`.
+Both travel on the teardown report's `user_properties`, so under pytest-xdist the controller sees them all.
+"""
+import json
+from typing import Dict
+
+from support.motion import MOTION_PROPERTY
+from support.page_timing import CATEGORIES
+
+# user_properties key carrying a test's breakdown.
+TIMING_PROPERTY = "timing"
+
+
+class TimingReport:
+    """
+    Per-test and per-session time split into sleep / navigation / locator / screenshot / artifacts /
+    other Playwright / overhead. Registered as a pytest plugin on the controller.
+    """
+
+    def __init__(self):
+        # Node id -> breakdown dict (CATEGORIES plus "wall").
+        self.tests: Dict[str, Dict[str, float]] = {}
+        # Node id -> motion summary (mode, animated interactions, animated_ms, ...).
+        self.motion: Dict[str, dict] = {}
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when != "teardown":
+            return
+        properties = dict(report.user_properties)
+        breakdown = properties.get(TIMING_PROPERTY)
+        if breakdown:
+            self.tests[report.nodeid] = breakdown
+        if properties.get(MOTION_PROPERTY):
+            self.motion[report.nodeid] = properties[MOTION_PROPERTY]
+
+    def session_totals(self) -> Dict[str, float]:
+        totals = {key: 0.0 for key in CATEGORIES + ("wall",)}
+        for breakdown in self.tests.values():
+            for key in totals:
+                totals[key] += breakdown.get(key, 0.0)
+        return {key: round(value, 3) for key, value in totals.items()}
+
+    def motion_totals(self) -> dict:
+        """
+        Animation time across the run: skipped when motion was reduced, spent when it ran in full.
+        """
+        interactions = sum(motion.get("interactions", 0) for motion in self.motion.values())
+        animated_ms = sum(motion.get("animated_ms", 0) for motion in self.motion.values())
+        return {
+            "modes": sorted({motion.get("mode") for motion in self.motion.values()}),
+            "interactions": interactions,
+            "animated_s": round(animated_ms / 1000, 3),
+            "per_interaction_ms": round(animated_ms / interactions, 1) if interactions else None,
+            "toasts_shortened": sum(motion.get("toasts", 0) for motion in self.motion.values()),
+        }
+
+    def write(self, path: str, **extra) -> None:
+        payload = dict(extra)
+        payload["categories"] = list(CATEGORIES)
+        payload["session"] = self.session_totals()
+        payload["motion"] = self.motion_totals()
+        payload["tests"] = [
+            {"nodeid": nodeid, **breakdown, "motion": self.motion.get(nodeid)}
+            for nodeid, breakdown in sorted(self.tests.items(), key=lambda item: -item[1].get("wall", 0.0))
+        ]
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+
+    def print_summary(self, terminalreporter, slowest: int = 5) -> None:
+        """
+        Prints the session split and the slowest tests' splits at the end of the run.
+        """
+        if not self.tests:
+            return
+        totals = self.session_totals()
+        wall = totals["wall"] or 1.0
+        terminalreporter.write_sep("-", "time breakdown (timing.json)")
+        for category in CATEGORIES:
+            terminalreporter.write_line(
+                f"{category:>17}: {totals[category]:9.2f}s  {100 * totals[category] / wall:5.1f}%"
+            )
+        terminalreporter.write_line(f"{'wall':>17}: {totals['wall']:9.2f}s")
+        motion = self.motion_totals()
+        if motion["interactions"]:
+            verb = "skipped" if motion["modes"] == ["reduced"] else "animated"
+            terminalreporter.write_line(
+                f"motion ({'/'.join(motion['modes'])}): {motion['animated_s']:.1f}s {verb} over "
+                f"{motion['interactions']} animated interactions (~{motion['per_interaction_ms']:.0f} ms each)"
+            )
+        terminalreporter.write_line(f"slowest {min(slowest, len(self.tests))} tests:")
+        ranked = sorted(self.tests.items(), key=lambda item: -item[1].get("wall", 0.0))[:slowest]
+        for nodeid, breakdown in ranked:
+            parts = ", ".join(
+                f"{category} {breakdown.get(category, 0.0):.1f}s"
+                for category in CATEGORIES
+                if breakdown.get(category, 0.0) >= 0.05
+            )
+            terminalreporter.write_line(f"  {breakdown['wall']:7.2f}s {nodeid} ({parts})")
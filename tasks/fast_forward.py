@@ -0,0 +1,22 @@
+from abilities.control_the_clock import ControlTheClock, Ticks
+
+
+class FastForward:
+    """
+    Runs the browser's timers forward instead of sleeping: polling loops, debounced inputs and
+    toast timeouts that fall due in `ticks` fire at once. Needs the clock installed before the
+    page loaded (`@pytest.mark.clock`), otherwise only timers created after this call are controlled.
+    """
+
+    def __init__(self, ticks: Ticks):
+        self.ticks = ticks
+
+    @staticmethod
+    def by(ticks: Ticks) -> "FastForward":
+        """
+        Example: `actor.attempts_to(FastForward.by("00:20"))` runs 20 seconds of timers.
+        """
+        return FastForward(ticks)
+
+    def perform_as(self, actor) -> None:
+        actor.uses_ability(ControlTheClock).run_for(self.ticks)
@@ -18,17 +18,11 @@ class Logout:
     def perform_as(self, actor: Actor):
         browser = actor.uses_ability(BrowseTheWeb)
         page = browser.page
-
-        def click_first_visible(selectors):
-            for selector in selectors:
-                locator = page.locator(selector)
-                if locator.count() > 0 and locator.first.is_visible():
-                    locator.first.click()
-                    return True
-            return False
+        # The redirect to /login that follows is expected, not a dropped session.
+        browser.forget_sign_in()
 
         if self.use_sidebar:
-            clicked = click_first_visible(
+            clicked = browser.click_first_visible(
                 [
                     DashboardPageUI.SIDEBAR_LOGOUT_ICON,
                     "aside [role='menuitem']:has-text('Log out')",
@@ -39,16 +33,18 @@ class Logout:
             if not clicked:
                 raise AssertionError("Sidebar logout button was not found.")
         else:
-            menu_clicked = click_first_visible([DashboardPageUI.ACCOUNT_MENU_BUTTON])
+            menu_clicked = browser.click_first_visible([DashboardPageUI.ACCOUNT_MENU_BUTTON])
             if not menu_clicked:
                 raise AssertionError("Account menu button was not found.")
 
-            clicked = click_first_visible(
+            # The menu opens on the click; give its items a moment to render.
+            clicked = browser.click_first_visible(
                 [
                     DashboardPageUI.LOGOUT_MENU_ITEM,
                     "[role='menuitem']:has-text('Logout')",
                     "button:has-text('Logout')",
-                ]
+                ],
+                timeout_ms=5000,
             )
             if not clicked:
                 raise AssertionError("Logout menu item was not found.")
@@ -0,0 +1,31 @@
+from abilities.browse_the_web import BrowseTheWeb
+from abilities.wait_for import WaitFor
+from questions.licensee.sales_listing import SALES_ROWS, SalesRow
+
+
+class OpenSalesRecord:
+    """
+    Opens the details page of a row picked from `SalesListing`.
+    Rows with a details link are opened by URL; other rows are clicked.
+    """
+
+    def __init__(self, row: SalesRow):
+        self.row = row
+
+    @staticmethod
+    def from_row(row: SalesRow) -> "OpenSalesRecord":
+        return OpenSalesRecord(row)
+
+    def perform_as(self, actor):
+        browser = actor.uses_ability(BrowseTheWeb)
+        page = browser.page
+        if self.row.details_href:
+            # Direct navigation: no hunting for the row's View button.
+            browser.go_to(self.row.details_href)
+            return
+
+        # No link in the row (button/onclick layouts): click its View action or first cell.
+        row = page.locator(SALES_ROWS).nth(self.row.index)
+        view = row.locator("button:has-text('View'), a:has-text('View')").first
+        (view if view.count() > 0 else row.locator("td").first).click()
+        WaitFor.on(page).url("**/licensee/sales/**", required=False)
@@ -16,9 +16,7 @@ class UpdateUserProfile:
 
         # Ensure we are on the User profile tab before editing.
         if not page.is_visible(ProfileSelectors.NAME_INPUT):
-            user_tab = page.locator(ProfileSelectors.USER_TAB)
-            if user_tab.count() > 0 and user_tab.first.is_visible():
-                user_tab.first.click()
+            actor.uses_ability(BrowseTheWeb).click_first_visible([ProfileSelectors.USER_TAB])
 
         # Update profile fields if provided.
         if self.name:
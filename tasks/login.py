@@ -2,22 +2,30 @@
 This module defines the Login task.
 Tasks represent high-level business actions an Actor attempts.
 """
+import time
+
 from actors.base_actor import Actor
 from abilities.browse_the_web import BrowseTheWeb
+from abilities.call_an_api import CallAnAPI
+from abilities.wait_for import WaitFor
 from ui.login_page_ui import LoginPageUI
 from config.credentials import BASE_URL
+from config.settings import API_LOGIN_ENABLED, WAIT_TIMEOUT_MS
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 
 class Login:
     """
     A task for an Actor to log into the application.
+    Signs in over HTTP when the actor can CallAnAPI, and through the login form otherwise.
     """
 
-    def __init__(self, email, password):
+    def __init__(self, email, password, via_form=False):
         # Store credentials for this login attempt.
         self.email = email
         self.password = password
+        # Tests whose subject is the login form itself must drive the UI.
+        self.via_form = via_form
 
     @staticmethod
     def with_credentials(email, password):
@@ -28,14 +36,28 @@ class Login:
         # Factory to keep call sites concise.
         return Login(email, password)
 
+    @staticmethod
+    def through_the_form(email, password):
+        """
+        Factory method for a Login that always fills and submits the login form.
+        Example: `Login.through_the_form("user@example.com", "password")`
+        """
+        return Login(email, password, via_form=True)
+
     def perform_as(self, actor: Actor):
         """
         Performs the login action using the Actor's BrowseTheWeb ability.
         """
         # Use the actor's browser ability to drive the UI.
         browser = actor.uses_ability(BrowseTheWeb)
+        # Reuse the cached session when the page already started signed in as this user.
+        if browser.signed_in_as == self.email and self._resume_cached_session(browser):
+            return
         # Ensure we are logged out before attempting a new login.
         browser.clear_session()
+        # Fast path: one GET + one POST, then open the dashboard the server redirected to.
+        if self._can_sign_in_over_api(actor) and self._sign_in_over_api(actor, browser):
+            return
         # Navigate to login page using configurable base URL.
         browser.go_to(f"{BASE_URL}/login")
 
@@ -53,8 +75,57 @@ class Login:
         browser.find_and_fill(LoginPageUI.PASSWORD_FIELD, self.password)
         browser.find_and_click(LoginPageUI.SIGN_IN_BUTTON)
 
-        # After sign in, wait a moment for the redirect/load to settle.
-        page.wait_for_timeout(2000)
+        # After sign in, wait for the redirect off the login route instead of a fixed sleep.
+        # A rejected login stays on /login; callers assert on that themselves.
+        if self._wait_for_redirect(page):
+            browser.remember_sign_in(self.email, page.url)
+
+    @staticmethod
+    def _wait_for_redirect(page) -> bool:
+        """
+        Waits for the form login to leave /login. Returns False as soon as the form shows an error,
+        so a rejected login does not sit out the whole wait timeout.
+        """
+        error = page.locator(LoginPageUI.ERROR_MESSAGE).or_(page.locator(LoginPageUI.FORM_ERROR))
+        deadline = time.monotonic() + WAIT_TIMEOUT_MS / 1000
+        while True:
+            if WaitFor.on(page).url(lambda url: "/login" not in url, timeout_ms=500, required=False):
+                return True
+            if error.first.is_visible() or time.monotonic() >= deadline:
+                return False
+
+    def _can_sign_in_over_api(self, actor: Actor) -> bool:
+        return API_LOGIN_ENABLED and not self.via_form and actor.has_ability(CallAnAPI)
+
+    def _sign_in_over_api(self, actor: Actor, browser: BrowseTheWeb) -> bool:
+        """
+        Signs in with CallAnAPI and opens the landing page.
+        Returns False (so the form is used instead) when the API login is rejected or fails.
+        """
+        try:
+            landing_url = actor.uses_ability(CallAnAPI).sign_in(self.email, self.password)
+        except Exception as e:
+            print(f"⚠️ API login failed, using the login form: {type(e).__name__}: {e}")
+            return False
+        if landing_url is None:
+            return False
+        browser.go_to(landing_url)
+        if "/login" in browser.page.url:
+            return False
+        browser.remember_sign_in(self.email, landing_url)
+        return True
+
+    @staticmethod
+    def _resume_cached_session(browser: BrowseTheWeb) -> bool:
+        """
+        Opens the landing page of a cached session instead of filling the login form.
+        Returns False, and drops the cached session, when the server no longer accepts it.
+        """
+        browser.go_to(browser.landing_url or f"{BASE_URL}/login")
+        if "/login" in browser.page.url:
+            browser.expire_cached_session()
+            return False
+        return True
 
 
 # --- How to create a new Task ---
@@ -3,9 +3,11 @@ from tasks.login import Login  # your existing Login task
 from config.credentials import LOGIN_CREDENTIALS
 
 class LoginAs:
-    def __init__(self, role: str):
+    def __init__(self, role: str, via_form: bool = False):
         # Role key used to look up credentials in config.
         self.role = role
+        # Force the login form instead of the API fast path (see `Login.through_the_form`).
+        self.via_form = via_form
 
     def perform_as(self, actor):
         # Resolve credentials for the role and delegate to Login task.
@@ -13,7 +15,8 @@ class LoginAs:
         # Keep actor password state in sync for downstream tasks.
         actor.password = creds["password"]
         actor.current_password = creds.get("current_password", creds["password"])
-        return Login.with_credentials(
+        return Login(
             creds["email"],
-            creds["password"]
+            creds["password"],
+            via_form=self.via_form,
         ).perform_as(actor)
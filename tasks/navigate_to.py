@@ -0,0 +1,43 @@
+"""
+This module defines the NavigateTo task: open a page from the route map (`ui/routes.py`) directly.
+"""
+from actors.base_actor import Actor
+from abilities.browse_the_web import BrowseTheWeb
+from abilities.wait_for import WaitFor
+from ui.routes import PageRoute, route_named
+
+
+class NavigateTo:
+    """
+    Opens a page with one `goto` to its URL instead of clicking through menus and tabs.
+    Does nothing when the page is already showing.
+    """
+
+    def __init__(self, route: PageRoute):
+        self.route = route
+
+    @staticmethod
+    def the(route: PageRoute) -> "NavigateTo":
+        """
+        Example: `actor.attempts_to(NavigateTo.the(LicenseeRoutes.ORDER_REDEEMABLE))`.
+        """
+        return NavigateTo(route)
+
+    @staticmethod
+    def page(name: str) -> "NavigateTo":
+        """
+        Looks the route up by logical name. Example: `NavigateTo.page("licensee.order.redeemable")`.
+        """
+        return NavigateTo(route_named(name))
+
+    def perform_as(self, actor: Actor) -> None:
+        browser = actor.uses_ability(BrowseTheWeb)
+        page = browser.page
+        if self.route.matches(page.url):
+            return
+        browser.go_to(self.route.url())
+        # The URL is final once `goto` returns unless the app redirects client-side; a redirect
+        # to /login is handled by the session guard.
+        if not WaitFor.on(page).url(self.route.matches, required=False):
+            raise AssertionError(f"Could not open {self.route.name} ({self.route.url()}); ended on {page.url}")
+
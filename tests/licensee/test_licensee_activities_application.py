@@ -5,7 +5,9 @@ from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
 from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from tasks.navigate_to import NavigateTo
 from ui.login_page_ui import LoginPageUI
+from ui.routes import LicenseeRoutes
 
 
 def _get_uc_activities_credentials() -> tuple[str, str]:
@@ -19,12 +21,6 @@ def _get_uc_activities_credentials() -> tuple[str, str]:
     return email, password
 
 
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
-
-
 @pytest.mark.licensee
 def test_MCD_LCSE_12_view_licensee_activities_form_application(the_licensee):
     """
@@ -41,15 +37,12 @@ def test_MCD_LCSE_12_view_licensee_activities_form_application(the_licensee):
     browser.find_and_fill(LoginPageUI.PASSWORD_FIELD, password)
     browser.find_and_click(LoginPageUI.SIGN_IN_BUTTON)
     page.wait_for_url("**/licensee/dashboard", timeout=15000)
-    _dismiss_maybe_later_if_present(page)
 
     # In dashboard this is the 3rd visible "See more" and routes to application-form page.
-    see_more_buttons = page.locator("button:has-text('See more'), a:has-text('See more')")
-    visible_indexes = [
-        i for i in range(see_more_buttons.count()) if see_more_buttons.nth(i).is_visible()
-    ]
-    assert len(visible_indexes) >= 3, "Could not find Activities section 'See more' shortcut."
-    see_more_buttons.nth(visible_indexes[2]).click()
+    # Filtering in the browser counts the visible ones in one call.
+    see_more_buttons = page.locator("button:has-text('See more'), a:has-text('See more')").filter(visible=True)
+    assert see_more_buttons.count() >= 3, "Could not find Activities section 'See more' shortcut."
+    see_more_buttons.nth(2).click()
 
     page.wait_for_url("**/licensee/application-form/index", timeout=15000)
     expect(page.locator("text=/Licensee activities form application/i").first).to_be_visible()
@@ -84,10 +77,8 @@ def test_MCD_LCSE_13_create_licensee_activities_form_application(the_licensee):
     browser.find_and_fill(LoginPageUI.PASSWORD_FIELD, password)
     browser.find_and_click(LoginPageUI.SIGN_IN_BUTTON)
     page.wait_for_url("**/licensee/dashboard", timeout=15000)
-    _dismiss_maybe_later_if_present(page)
 
-    page.goto(f"{BASE_URL}/licensee/application-form/index")
-    page.wait_for_load_state("domcontentloaded", timeout=10000)
+    the_licensee.attempts_to(NavigateTo.the(LicenseeRoutes.APPLICATION_FORMS))
 
     create_btn = page.locator("button:has-text('Create application')").first
     expect(create_btn).to_be_visible()
@@ -5,8 +5,11 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from abilities.wait_for import WaitFor
+from config.credentials import LOGIN_CREDENTIALS
 from tasks.login import Login
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
 
 
 def _resolve_sales_creds() -> dict:
@@ -17,34 +20,13 @@ def _resolve_sales_creds() -> dict:
     return LOGIN_CREDENTIALS["licensee"]
 
 
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
-
-
 def _ensure_licensee_dashboard(actor, creds) -> None:
     page = actor.uses_ability(BrowseTheWeb).page
     if "/login" in page.url:
         actor.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
         page = actor.uses_ability(BrowseTheWeb).page
-    try:
-        page.wait_for_url("**/licensee/**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        pass
-
-
-def _open_sales_page(page) -> None:
-    sales_menu = page.locator("aside a:has-text('Sales'), aside button:has-text('Sales')").first
-    if sales_menu.count() > 0 and sales_menu.is_visible():
-        sales_menu.click()
-    else:
-        page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
-
-    try:
-        page.wait_for_url("**/licensee/sales**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        assert "/licensee/sales" in page.url, f"Unexpected sales URL: {page.url}"
+    # A session dropped on the way is restored (or reported at once) by the session guard.
+    WaitFor.on(page).url("**/licensee/**", required=False)
 
 
 @pytest.mark.licensee
@@ -58,30 +40,30 @@ def test_MCD_LCSE_19_add_extra_sets_sales_open_form(the_licensee):
     the_licensee.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
     _ensure_licensee_dashboard(the_licensee, creds)
 
-    page = the_licensee.uses_ability(BrowseTheWeb).page
-    _dismiss_maybe_later_if_present(page)
-    _open_sales_page(page)
+    browser = the_licensee.uses_ability(BrowseTheWeb)
+    page = browser.page
+    the_licensee.attempts_to(NavigateTo.the(LicenseeRoutes.SALES))
 
-    extra_sets_tabs = page.locator(
-        "button:has-text('Extra Sets'), [role='tab']:has-text('Extra Sets'), a:has-text('Extra Sets')"
+    visible_extra_tab = browser.first_visible(
+        ["button:has-text('Extra Sets')", "[role='tab']:has-text('Extra Sets')", "a:has-text('Extra Sets')"]
     )
-    visible_extra_tabs = [
-        i for i in range(extra_sets_tabs.count()) if extra_sets_tabs.nth(i).is_visible()
-    ]
-    if not visible_extra_tabs:
+    if visible_extra_tab is None:
         pytest.skip("Extra Sets tab is not available for current outlet/account.")
-    extra_sets_tabs.nth(visible_extra_tabs[0]).click()
-
-    add_extra_btn = page.locator(
-        "button:has-text('Add Extra'), a:has-text('Add Extra'), "
-        "button:has-text('Add extra'), a:has-text('Add extra')"
+    extra_sets_tab = visible_extra_tab.locator
+    # The sales page opens on Daily sales unless the tab is already selected.
+    if extra_sets_tab.get_attribute("aria-selected") != "true":
+        extra_sets_tab.click()
+
+    add_extra_clicked = browser.click_first_visible(
+        [
+            "button:has-text('Add Extra')",
+            "a:has-text('Add Extra')",
+            "button:has-text('Add extra')",
+            "a:has-text('Add extra')",
+        ]
     )
-    visible_add_extra = [
-        i for i in range(add_extra_btn.count()) if add_extra_btn.nth(i).is_visible()
-    ]
-    if not visible_add_extra:
+    if not add_extra_clicked:
         pytest.skip("Add Extra Sets Sale action is not available in current environment.")
-    add_extra_btn.nth(visible_add_extra[0]).click()
 
     try:
         page.wait_for_url("**/licensee/sales/**", timeout=15000, wait_until="domcontentloaded")
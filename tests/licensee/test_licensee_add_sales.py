@@ -3,14 +3,11 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from abilities.wait_for import WaitFor
+from config.credentials import LOGIN_CREDENTIALS
 from tasks.login import Login
-
-
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
 
 
 def _ensure_licensee_dashboard(actor, creds) -> None:
@@ -18,10 +15,8 @@ def _ensure_licensee_dashboard(actor, creds) -> None:
     if "/login" in page.url:
         actor.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
         page = actor.uses_ability(BrowseTheWeb).page
-    try:
-        page.wait_for_url("**/licensee/**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        pass
+    # A session dropped on the way is restored (or reported at once) by the session guard.
+    WaitFor.on(page).url("**/licensee/**", required=False)
 
 
 @pytest.mark.licensee
@@ -35,19 +30,8 @@ def test_MCD_LCSE_15_add_sales_open_form(the_licensee):
     _ensure_licensee_dashboard(the_licensee, creds)
 
     page = the_licensee.uses_ability(BrowseTheWeb).page
-    _dismiss_maybe_later_if_present(page)
-
-    # Navigate to Sales page from sidebar or fallback direct URL.
-    sales_menu = page.locator("aside a:has-text('Sales'), aside button:has-text('Sales')").first
-    if sales_menu.count() > 0 and sales_menu.is_visible():
-        sales_menu.click()
-    else:
-        page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
 
-    try:
-        page.wait_for_url("**/licensee/sales**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        assert "/licensee/sales" in page.url, f"Unexpected sales URL: {page.url}"
+    the_licensee.attempts_to(NavigateTo.the(LicenseeRoutes.SALES))
 
     add_sale_btn = page.locator("button:has-text('Add sale'), a:has-text('Add sale')").first
     expect(add_sale_btn).to_be_visible()
@@ -1,13 +1,15 @@
 import os
 import time
-from datetime import date
 
 import pytest
 from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
+from abilities.control_the_clock import ControlTheClock
 from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from tasks.navigate_to import NavigateTo
 from ui.login_page_ui import LoginPageUI
+from ui.routes import LicenseeRoutes
 
 
 def _get_uc_staff_credentials() -> tuple[str, str]:
@@ -21,13 +23,9 @@ def _get_uc_staff_credentials() -> tuple[str, str]:
     return creds["email"], creds["password"]
 
 
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
-
-
 @pytest.mark.licensee
+# Pinned to 09:00 today: the start date stays today (as the backend expects) at a fixed time of day.
+@pytest.mark.clock(today_at="09:00")
 def test_MCD_LCSE_11_add_staff(the_licensee):
     """
     Use Case: MCD-LCSE-11
@@ -44,10 +42,8 @@ def test_MCD_LCSE_11_add_staff(the_licensee):
     browser.find_and_click(LoginPageUI.SIGN_IN_BUTTON)
     page.wait_for_url("**/licensee/dashboard", timeout=15000)
 
-    _dismiss_maybe_later_if_present(page)
 
-    page.goto(f"{BASE_URL}/licensee/staff/index")
-    page.wait_for_load_state("domcontentloaded", timeout=10000)
+    the_licensee.attempts_to(NavigateTo.the(LicenseeRoutes.STAFF_DIRECTORY))
 
     page.locator("button:has-text('Add Staff')").first.click()
 
@@ -64,7 +60,7 @@ def test_MCD_LCSE_11_add_staff(the_licensee):
 
     start_date = modal.locator("input[type='date']").first
     if start_date.count() > 0:
-        start_date.fill(date.today().isoformat())
+        start_date.fill(the_licensee.uses_ability(ControlTheClock).today().isoformat())
 
     modal.locator("button:has-text('Add New Staff')").first.click()
 
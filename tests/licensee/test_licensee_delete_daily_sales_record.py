@@ -6,33 +6,13 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from abilities.wait_for import WaitFor
+from config.credentials import BASE_URL
+from questions.licensee.sales_listing import SalesListing, is_sales_details_url
 from tasks.login import Login
-
-
-def _resolve_sales_creds() -> dict:
-    switch_email = os.getenv("MCDYNECT_SWITCH_OUTLET_EMAIL", "").strip()
-    switch_password = os.getenv("MCDYNECT_SWITCH_OUTLET_PASSWORD", "").strip()
-    if switch_email and switch_password:
-        return {"email": switch_email, "password": switch_password}
-    return LOGIN_CREDENTIALS["licensee"]
-
-
-def _dismiss_maybe_later_if_present(page) -> None:
-    # Grab credentials modal appears intermittently after login.
-    # Try a few times so it doesn't block subsequent clicks.
-    for _ in range(6):
-        maybe_later = page.locator(
-            "button:has-text('Maybe Later'), button:has-text('Maybe later')"
-        ).first
-        if maybe_later.count() > 0 and maybe_later.is_visible():
-            try:
-                maybe_later.click()
-            except Exception:
-                maybe_later.click(force=True)
-            page.wait_for_timeout(300)
-            return
-        page.wait_for_timeout(500)
+from tasks.licensee.open_sales_record import OpenSalesRecord
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
 
 
 def _ensure_licensee_dashboard(actor, creds) -> None:
@@ -40,80 +20,22 @@ def _ensure_licensee_dashboard(actor, creds) -> None:
     if "/login" in page.url:
         actor.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
         page = actor.uses_ability(BrowseTheWeb).page
-    try:
-        page.wait_for_url("**/licensee/**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        pass
-
-
-def _open_sales_page(page) -> None:
-    sales_menu = page.locator("aside a:has-text('Sales'), aside button:has-text('Sales')").first
-    if sales_menu.count() > 0 and sales_menu.is_visible():
-        sales_menu.click()
-    else:
-        page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
-
-    try:
-        page.wait_for_url("**/licensee/sales**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        assert "/licensee/sales" in page.url, f"Unexpected sales URL: {page.url}"
-
+    # A session dropped on the way is restored (or reported at once) by the session guard.
+    WaitFor.on(page).url("**/licensee/**", required=False)
 
-def _open_sales_details_page_or_fail(page) -> None:
-    def _is_valid_details_url(url: str) -> bool:
-        # Most stable indicator for this app's details page.
-        if "/licensee/sales/show/" in url:
-            return True
-        return (
-            "/licensee/sales/" in url
-            and not url.endswith("/licensee/sales/index")
-            and not re.search(r"/licensee/sales/(add|create|edit)$", url)
-            and "/licensee/sales/extra/" not in url
-        )
 
-    if _is_valid_details_url(page.url):
+def _open_sales_details_page_or_fail(actor, row=None) -> None:
+    page = actor.uses_ability(BrowseTheWeb).page
+    if is_sales_details_url(page.url):
         return
 
-    clicked = False
-    for status_label in ["Not filled", "Not complete", "Completed", "Submitted", "Pending"]:
-        rows = page.locator("table tbody tr", has_text=status_label)
-        for i in range(rows.count()):
-            row = rows.nth(i)
-            if not row.is_visible():
-                continue
-            try:
-                row_action = row.locator(
-                    "a[href*='/licensee/sales/'], button:has-text('View'), a:has-text('View')"
-                ).first
-                if row_action.count() > 0 and row_action.is_visible():
-                    row_action.click()
-                else:
-                    row.locator("td").first.click()
-                clicked = True
-                break
-            except Exception:
-                continue
-        if clicked:
-            break
-
-    if not clicked:
-        generic_rows = page.locator("table tbody tr")
-        for i in range(generic_rows.count()):
-            row = generic_rows.nth(i)
-            if not row.is_visible():
-                continue
-            try:
-                row_action = row.locator(
-                    "a[href*='/licensee/sales/'], button:has-text('View'), a:has-text('View'), a, button"
-                ).first
-                if row_action.count() > 0 and row_action.is_visible():
-                    row_action.click()
-                else:
-                    row.locator("td").first.click()
-                clicked = True
-                break
-            except Exception:
-                continue
+    # Without a catalog record, read the whole listing once and open the preferred row directly.
+    if row is None:
+        actor.attempts_to(NavigateTo.the(LicenseeRoutes.SALES))
+        row = actor.asks_for(SalesListing()).first_to_open()
+    clicked = row is not None
+    if clicked:
+        actor.attempts_to(OpenSalesRecord.from_row(row))
 
     if not clicked:
         # Non-table layout fallback: click visible status labels in list rows.
@@ -127,17 +49,16 @@ def _open_sales_details_page_or_fail(page) -> None:
                     item.click()
                 except Exception:
                     continue
-                page.wait_for_timeout(500)
                 try:
                     page.wait_for_url("**/licensee/sales/**", timeout=4000, wait_until="domcontentloaded")
                 except PlaywrightTimeoutError:
                     pass
-                if _is_valid_details_url(page.url):
+                if is_sales_details_url(page.url):
                     clicked = True
                     break
                 # If we landed on add/create/extra path, return to listing and continue trying.
-                if page.url != f"{BASE_URL}/licensee/sales/index":
-                    page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
+                if not LicenseeRoutes.SALES.matches(page.url):
+                    page.goto(LicenseeRoutes.SALES.url(), wait_until="domcontentloaded")
             if clicked:
                 break
 
@@ -162,7 +83,7 @@ def _open_sales_details_page_or_fail(page) -> None:
             clicked = True
 
     # Final guard: if we're already on a valid details page, continue.
-    if _is_valid_details_url(page.url):
+    if is_sales_details_url(page.url):
         return
 
     if not clicked:
@@ -203,7 +124,7 @@ def _open_sales_details_page_or_fail(page) -> None:
         if details_link:
             page.goto(details_link, wait_until="domcontentloaded")
 
-    if not _is_valid_details_url(page.url):
+    if not is_sales_details_url(page.url):
         raise AssertionError("Sales Details page is not navigable from current listing UI/data.")
 
 
@@ -233,21 +154,22 @@ def _try_open_details_with_delete(page) -> bool:
 
 
 @pytest.mark.licensee
-def test_MCD_LCSE_18_delete_daily_sales_record(the_licensee):
+@pytest.mark.slow
+def test_MCD_LCSE_18_delete_daily_sales_record(the_licensee, licensee_account, sales_catalog):
     """
     Use Case: MCD-LCSE-18
     Verifies Delete Sales Record modal flow from Sales Details page.
     By default this test is safe-mode (cancel delete).
     Set MCDYNECT_RUN_DESTRUCTIVE_UC18=true to execute real deletion.
+    Runs on an exclusively leased pool account.
     """
-    creds = _resolve_sales_creds()
+    creds = licensee_account.credentials
     the_licensee.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
     _ensure_licensee_dashboard(the_licensee, creds)
 
     page = the_licensee.uses_ability(BrowseTheWeb).page
-    _dismiss_maybe_later_if_present(page)
-    _open_sales_page(page)
-    _open_sales_details_page_or_fail(page)
+    row = sales_catalog.records_for(creds["email"], creds["password"]).first_to_open() if sales_catalog else None
+    _open_sales_details_page_or_fail(the_licensee, row)
 
     assert _try_open_details_with_delete(page), (
         "Delete action is not available for current sales record."
@@ -283,6 +205,9 @@ def test_MCD_LCSE_18_delete_daily_sales_record(the_licensee):
     confirm_delete_btn = page.locator("button:has-text('Delete')").last
     expect(confirm_delete_btn).to_be_visible()
     confirm_delete_btn.click()
+    if sales_catalog:
+        # The record is gone; keep later tests from opening it.
+        sales_catalog.forget(creds["email"], details_url_before_delete)
 
     try:
         page.wait_for_url("**/licensee/sales/index", timeout=15000, wait_until="domcontentloaded")
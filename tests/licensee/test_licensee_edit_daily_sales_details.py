@@ -5,14 +5,13 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
+from abilities.wait_for import WaitFor
 from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from questions.licensee.sales_listing import SalesListing
 from tasks.login import Login
-
-
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
+from tasks.licensee.open_sales_record import OpenSalesRecord
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
 
 
 def _ensure_licensee_dashboard(actor, creds) -> None:
@@ -20,27 +19,13 @@ def _ensure_licensee_dashboard(actor, creds) -> None:
     if "/login" in page.url:
         actor.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
         page = actor.uses_ability(BrowseTheWeb).page
-    try:
-        page.wait_for_url("**/licensee/**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        pass
-
-
-def _open_sales_page(page) -> None:
-    sales_menu = page.locator("aside a:has-text('Sales'), aside button:has-text('Sales')").first
-    if sales_menu.count() > 0 and sales_menu.is_visible():
-        sales_menu.click()
-    else:
-        page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
-
-    try:
-        page.wait_for_url("**/licensee/sales**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        assert "/licensee/sales" in page.url, f"Unexpected sales URL: {page.url}"
+    # A session dropped on the way is restored (or reported at once) by the session guard.
+    WaitFor.on(page).url("**/licensee/**", required=False)
 
 
 @pytest.mark.licensee
-def test_MCD_LCSE_17_edit_daily_sales_details_open_form(the_licensee):
+@pytest.mark.slow
+def test_MCD_LCSE_17_edit_daily_sales_details_open_form(the_licensee, sales_catalog):
     """
     Use Case: MCD-LCSE-17
     Verifies Licensee can open Edit Sales form from Sales Details page.
@@ -50,49 +35,15 @@ def test_MCD_LCSE_17_edit_daily_sales_details_open_form(the_licensee):
     _ensure_licensee_dashboard(the_licensee, creds)
 
     page = the_licensee.uses_ability(BrowseTheWeb).page
-    _dismiss_maybe_later_if_present(page)
-    _open_sales_page(page)
-
-    clicked = False
-    for status_label in ["Not filled", "Not complete", "Completed", "Submitted", "Pending"]:
-        rows = page.locator("table tbody tr", has_text=status_label)
-        for i in range(rows.count()):
-            row = rows.nth(i)
-            if not row.is_visible():
-                continue
-            try:
-                row_action = row.locator(
-                    "a[href*='/licensee/sales/'], button:has-text('View'), a:has-text('View')"
-                ).first
-                if row_action.count() > 0 and row_action.is_visible():
-                    row_action.click()
-                else:
-                    row.locator("td").first.click()
-                clicked = True
-                break
-            except Exception:
-                continue
-        if clicked:
-            break
-
-    if not clicked:
-        generic_rows = page.locator("table tbody tr")
-        for i in range(generic_rows.count()):
-            row = generic_rows.nth(i)
-            if not row.is_visible():
-                continue
-            try:
-                row_action = row.locator(
-                    "a[href*='/licensee/sales/'], button:has-text('View'), a:has-text('View'), a, button"
-                ).first
-                if row_action.count() > 0 and row_action.is_visible():
-                    row_action.click()
-                else:
-                    row.locator("td").first.click()
-                clicked = True
-                break
-            except Exception:
-                continue
+    # A record from the session's catalog opens by URL, without loading the listing.
+    row = sales_catalog.records_for(creds["email"], creds["password"]).first_to_open() if sales_catalog else None
+    if row is None:
+        the_licensee.attempts_to(NavigateTo.the(LicenseeRoutes.SALES))
+        # Read the whole listing once and open the preferred row directly.
+        row = the_licensee.asks_for(SalesListing()).first_to_open()
+    clicked = row is not None
+    if clicked:
+        the_licensee.attempts_to(OpenSalesRecord.from_row(row))
 
     if not clicked:
         sales_links = page.eval_on_selector_all(
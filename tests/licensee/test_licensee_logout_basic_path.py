@@ -11,6 +11,7 @@ from ui.login_page_ui import LoginPageUI
 
 
 @pytest.mark.licensee
+@pytest.mark.fresh_login
 def test_MCD_LCSE_03_logout_basic_path_from_user_menu(the_licensee: Licensee):
     creds = LOGIN_CREDENTIALS["licensee"]
     browser = the_licensee.uses_ability(BrowseTheWeb)
@@ -3,18 +3,9 @@ from playwright.sync_api import expect
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL
-from ui.login_page_ui import LoginPageUI
-
-
-TEST_LICENSEE_EMAIL = "ichiroadris@gmail.com"
-TEST_LICENSEE_PASSWORD = "masterpassword1234"
-
-
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
+from tasks.login import Login
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
 
 
 def _open_first_staff_edit_modal(page):
@@ -29,19 +20,18 @@ def _open_first_staff_edit_modal(page):
 
 
 @pytest.mark.licensee
-def test_MCD_LCSE_10_modify_staff_information(the_licensee):
+def test_MCD_LCSE_10_modify_staff_information(the_licensee, licensee_account):
     """
     Use Case: MCD-LCSE-10
     Modifies staff name in Edit Staff form, verifies update, then restores original value.
+    Runs on an exclusively leased pool account.
     """
     browser = the_licensee.uses_ability(BrowseTheWeb)
     page = browser.page
 
-    browser.clear_session()
-    browser.go_to(f"{BASE_URL}/login")
-    browser.find_and_fill(LoginPageUI.EMAIL_FIELD, TEST_LICENSEE_EMAIL)
-    browser.find_and_fill(LoginPageUI.PASSWORD_FIELD, TEST_LICENSEE_PASSWORD)
-    browser.find_and_click(LoginPageUI.SIGN_IN_BUTTON)
+    the_licensee.attempts_to(
+        Login.with_credentials(licensee_account.email, licensee_account.password)
+    )
     try:
         page.wait_for_url(
             "**/licensee/dashboard", timeout=15000, wait_until="domcontentloaded"
@@ -50,9 +40,7 @@ def test_MCD_LCSE_10_modify_staff_information(the_licensee):
         # Some runs navigate but delay full load; accept URL match.
         assert "/licensee/dashboard" in page.url, f"Unexpected post-login URL: {page.url}"
 
-    _dismiss_maybe_later_if_present(page)
-    page.goto(f"{BASE_URL}/licensee/staff/index")
-    page.wait_for_load_state("domcontentloaded", timeout=10000)
+    the_licensee.attempts_to(NavigateTo.the(LicenseeRoutes.STAFF_DIRECTORY))
 
     modal = _open_first_staff_edit_modal(page)
     name_input = modal.locator("input").first
@@ -3,8 +3,9 @@ from playwright.sync_api import expect
 
 from actors.licensee import Licensee
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from config.credentials import LOGIN_CREDENTIALS
 from tasks.login import Login
+from ui.routes import LicenseeRoutes
 
 
 @pytest.mark.licensee
@@ -22,10 +23,10 @@ def test_MCD_LCSE_04_access_redeemable_item_tab_shortcut(the_licensee: Licensee)
     page = the_licensee.uses_ability(BrowseTheWeb).page
     page.locator("button:has-text('Redeem')").first.click()
     page.wait_for_url(
-        "**/licensee/order/index?tab=redeemable",
+        LicenseeRoutes.ORDER_REDEEMABLE.pattern(),
         timeout=15000,
         wait_until="domcontentloaded",
     )
 
-    expect(page).to_have_url(f"{BASE_URL}/licensee/order/index?tab=redeemable")
+    expect(page).to_have_url(LicenseeRoutes.ORDER_REDEEMABLE.url())
     expect(page.locator("h1:has-text('Order Stock')").first).to_be_visible()
@@ -1,16 +1,12 @@
 import pytest
 from playwright.sync_api import expect
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL, LOGIN_CREDENTIALS
+from abilities.wait_for import WaitFor
+from config.credentials import LOGIN_CREDENTIALS
 from tasks.login import Login
-
-
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
 
 
 def _ensure_licensee_dashboard(actor, creds) -> None:
@@ -18,25 +14,8 @@ def _ensure_licensee_dashboard(actor, creds) -> None:
     if "/login" in page.url:
         actor.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
         page = actor.uses_ability(BrowseTheWeb).page
-    try:
-        page.wait_for_url("**/licensee/**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        pass
-
-
-def _open_sales_from_sidebar(page) -> None:
-    sales_menu = page.locator(
-        "aside a:has-text('Sales'), aside button:has-text('Sales')"
-    ).first
-    if sales_menu.count() > 0 and sales_menu.is_visible():
-        sales_menu.click()
-    else:
-        page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
-
-    try:
-        page.wait_for_url("**/licensee/sales**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        assert "/licensee/sales" in page.url, f"Unexpected sales URL: {page.url}"
+    # A session dropped on the way is restored (or reported at once) by the session guard.
+    WaitFor.on(page).url("**/licensee/**", required=False)
 
 
 @pytest.mark.licensee
@@ -50,8 +29,7 @@ def test_MCD_LCSE_14_view_sales_dashboard(the_licensee):
 
     _ensure_licensee_dashboard(the_licensee, creds)
     page = the_licensee.uses_ability(BrowseTheWeb).page
-    _dismiss_maybe_later_if_present(page)
-    _open_sales_from_sidebar(page)
+    the_licensee.attempts_to(NavigateTo.the(LicenseeRoutes.SALES))
 
     # Sales dashboard shell.
     sales_header = page.locator("h1:has-text('Sales')").first
@@ -70,12 +48,8 @@ def test_MCD_LCSE_14_view_sales_dashboard(the_licensee):
     expect(page.locator("text=/Not\\s*filled|Submitted|Pending/i").first).to_be_visible()
 
     # Extra Sets tab exists and is accessible (feature may be disabled for some outlets).
-    extra_sets_tabs = page.locator(
-        "button:has-text('Extra Sets'), [role='tab']:has-text('Extra Sets'), a:has-text('Extra Sets')"
+    extra_sets_clicked = the_licensee.uses_ability(BrowseTheWeb).click_first_visible(
+        ["button:has-text('Extra Sets')", "[role='tab']:has-text('Extra Sets')", "a:has-text('Extra Sets')"]
     )
-    visible_extra_sets = [
-        i for i in range(extra_sets_tabs.count()) if extra_sets_tabs.nth(i).is_visible()
-    ]
-    if visible_extra_sets:
-        extra_sets_tabs.nth(visible_extra_sets[0]).click()
+    if extra_sets_clicked:
         expect(page.locator("text=/Extra\\s*Sets|\\d{4}-\\d{2}-\\d{2}/i").first).to_be_visible()
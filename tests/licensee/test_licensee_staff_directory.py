@@ -1,27 +1,19 @@
 import pytest
 from playwright.sync_api import expect
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from abilities.browse_the_web import BrowseTheWeb
+from abilities.wait_for import WaitFor
 from config.credentials import BASE_URL, LOGIN_CREDENTIALS
 from tasks.login import Login
 
 
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
-
-
 def _ensure_licensee_dashboard(actor, creds) -> None:
     page = actor.uses_ability(BrowseTheWeb).page
     if "/login" in page.url:
         actor.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
         page = actor.uses_ability(BrowseTheWeb).page
-    try:
-        page.wait_for_url("**/licensee/**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        pass
+    # A session dropped on the way is restored (or reported at once) by the session guard.
+    WaitFor.on(page).url("**/licensee/**", required=False)
 
 
 @pytest.mark.licensee
@@ -34,7 +26,6 @@ def test_MCD_LCSE_09_view_all_staff_directory(the_licensee):
     the_licensee.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
     _ensure_licensee_dashboard(the_licensee, creds)
     page = the_licensee.uses_ability(BrowseTheWeb).page
-    _dismiss_maybe_later_if_present(page)
 
     staff_card = page.locator("text=Staff directory").first.locator(
         "xpath=ancestor::div[contains(@class,'rounded')][1]"
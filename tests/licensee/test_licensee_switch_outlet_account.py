@@ -1,25 +1,9 @@
-import time
-import os
-
 import pytest
 from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL
-from ui.login_page_ui import LoginPageUI
-
-
-def _required_env(key: str) -> str:
-    value = os.getenv(key, "").strip()
-    if not value:
-        raise RuntimeError(f"Missing required environment variable for test: {key}")
-    return value
-
-
-def _dismiss_maybe_later_if_present(page) -> None:
-    maybe_later = page.locator("button:has-text('Maybe Later')")
-    if maybe_later.count() > 0 and maybe_later.first.is_visible():
-        maybe_later.first.click()
+from abilities.wait_for import WaitFor
+from tasks.login import Login
 
 
 def _get_current_outlet_name(card) -> str:
@@ -32,24 +16,20 @@ def _get_current_outlet_name(card) -> str:
 
 
 @pytest.mark.licensee
-def test_MCD_LCSE_06_switch_outlet_account(the_licensee):
+def test_MCD_LCSE_06_switch_outlet_account(the_licensee, switch_outlet_account, sales_catalog):
     """
     Use Case: MCD-LCSE-06
     Verifies Licensee can switch outlet from Outlet Account Switcher.
+    Runs on an exclusively leased multi-outlet account (MCDYNECT_SWITCH_OUTLET_EMAIL).
     """
     browser = the_licensee.uses_ability(BrowseTheWeb)
     page = browser.page
-    test_email = _required_env("MCDYNECT_SWITCH_OUTLET_EMAIL")
-    test_password = _required_env("MCDYNECT_SWITCH_OUTLET_PASSWORD")
 
-    browser.clear_session()
-    browser.go_to(f"{BASE_URL}/login")
-    browser.find_and_fill(LoginPageUI.EMAIL_FIELD, test_email)
-    browser.find_and_fill(LoginPageUI.PASSWORD_FIELD, test_password)
-    browser.find_and_click(LoginPageUI.SIGN_IN_BUTTON)
+    the_licensee.attempts_to(
+        Login.with_credentials(switch_outlet_account.email, switch_outlet_account.password)
+    )
     page.wait_for_url("**/licensee/dashboard", timeout=15000)
 
-    _dismiss_maybe_later_if_present(page)
 
     card = page.locator("text=Outlet Account Switcher").first.locator(
         "xpath=ancestor::div[contains(@class,'rounded')][1]"
@@ -68,13 +48,19 @@ def test_MCD_LCSE_06_switch_outlet_account(the_licensee):
     target_outlet = target_row.locator("p.text-grey-800").first.inner_text().strip()
     target_row.locator("button").first.click()
 
-    deadline = time.time() + 20
-    while time.time() < deadline:
-        if _get_current_outlet_name(card) == target_outlet:
-            break
-        page.wait_for_timeout(500)
+    # Returns as soon as the target row carries the Current badge.
+    WaitFor.on(page).element(
+        card.locator("div.flex.justify-between.px-2")
+        .filter(has=page.locator(f"p.text-grey-800:has-text('{target_outlet}')"))
+        .filter(has=page.locator("button p:has-text('Current')")),
+        timeout_ms=20000,
+        required=False,
+    )
 
     current_after = _get_current_outlet_name(card)
+    if sales_catalog:
+        # Sales records crawled for the previous outlet no longer apply.
+        sales_catalog.invalidate(switch_outlet_account.email)
     assert current_after != current_before, "Outlet did not switch."
     assert current_after == target_outlet, (
         f"Expected switched outlet '{target_outlet}', got '{current_after}'."
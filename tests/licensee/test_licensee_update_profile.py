@@ -3,18 +3,21 @@ import pytest
 
 from actors import Licensee
 from abilities.browse_the_web import BrowseTheWeb
+from abilities.wait_for import WaitFor
+from config.selectors import ProfileSelectors
+from tasks.fast_forward import FastForward
 from tasks.login import Login
 from tasks.licensee.navigate_to_settings import NavigateToSettings
 from tasks.licensee.update_profile import UpdateUserProfile
 from questions.licensee.profile_saved import ProfileUpdateSuccess
-from tasks.login_as import LoginAs
 from questions.licensee.get_profile_info import GetProfileInfo
 
 @pytest.mark.licensee
-def test_MCD_LCSE_02_update_profile_success(the_licensee):
-    # 1. Log in and navigate to settings first.
+@pytest.mark.clock
+def test_MCD_LCSE_02_update_profile_success(the_licensee, licensee_account):
+    # 1. Log in on an exclusively leased account and navigate to settings first.
     the_licensee.attempts_to(
-        LoginAs("licensee"),
+        Login.with_credentials(licensee_account.email, licensee_account.password),
         NavigateToSettings()
     )
     
@@ -28,6 +31,11 @@ def test_MCD_LCSE_02_update_profile_success(the_licensee):
         )
         # 4. Assert the update succeeded.
         assert the_licensee.asks_for(ProfileUpdateSuccess())
+        # Expire the "Saved" toast now instead of waiting out its lifetime, so the restore
+        # below is checked against its own toast rather than this one.
+        the_licensee.attempts_to(FastForward.by("00:10"))
+        page = the_licensee.uses_ability(BrowseTheWeb).page
+        WaitFor.on(page).element_to_disappear(ProfileSelectors.SUCCESS_MESSAGE, timeout_ms=2000, required=False)
         
     finally:
         # 5. Restore original profile to keep tests idempotent.
@@ -7,55 +7,26 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import expect
 
 from abilities.browse_the_web import BrowseTheWeb
-from config.credentials import BASE_URL, LOGIN_CREDENTIALS
-from ui.login_page_ui import LoginPageUI
-
-
-def _resolve_sales_creds() -> dict:
-    switch_email = os.getenv("MCDYNECT_SWITCH_OUTLET_EMAIL", "").strip()
-    switch_password = os.getenv("MCDYNECT_SWITCH_OUTLET_PASSWORD", "").strip()
-    if switch_email and switch_password:
-        return {"email": switch_email, "password": switch_password}
-    return LOGIN_CREDENTIALS["licensee"]
-
-
-def _dismiss_maybe_later_if_present(page) -> None:
-    # Grab credentials modal can block sidebar/tab clicks after login.
-    for _ in range(6):
-        maybe_later = page.locator(
-            "button:has-text('Maybe Later'), button:has-text('Maybe later')"
-        ).first
-        if maybe_later.count() > 0 and maybe_later.is_visible():
-            try:
-                maybe_later.click()
-            except Exception:
-                maybe_later.click(force=True)
-            page.wait_for_timeout(300)
-            return
-        page.wait_for_timeout(500)
-
-
-def _ensure_licensee_dashboard(actor, creds) -> None:
-    page = actor.uses_ability(BrowseTheWeb).page
-    if "/login" in page.url:
-        actor.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
-        page = actor.uses_ability(BrowseTheWeb).page
-    try:
-        page.wait_for_url("**/licensee/**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        pass
+from abilities.control_the_clock import ControlTheClock
+from abilities.wait_for import WaitFor
+from config.credentials import BASE_URL
+from questions.licensee.sales_listing import EXTRA_SETS_TAB
+from tasks.login import Login
+from tasks.navigate_to import NavigateTo
+from ui.routes import LicenseeRoutes
 
 
-def _ensure_target_outlet_if_configured(page) -> None:
+def _ensure_target_outlet_if_configured(page) -> bool:
+    # Returns True when the account's outlet was switched.
     target_outlet = os.getenv("MCDYNECT_SWITCH_OUTLET_TARGET", "Cyberjaya").strip()
     if not target_outlet:
-        return
+        return False
 
     card = page.locator("text=Outlet Account Switcher").first.locator(
         "xpath=ancestor::div[contains(@class,'rounded')][1]"
     )
     if card.count() == 0 or not card.first.is_visible():
-        return
+        return False
 
     current_rows = card.locator("div.flex.justify-between.px-2").filter(
         has=page.locator("button p:has-text('Current')")
@@ -63,7 +34,7 @@ def _ensure_target_outlet_if_configured(page) -> None:
     if current_rows.count() > 0:
         current_name = current_rows.first.locator("p.text-grey-800").first.inner_text().strip().lower()
         if target_outlet.lower() in current_name:
-            return
+            return False
 
     target_rows = card.locator("div.flex.justify-between.px-2").filter(
         has=page.locator(f"p.text-grey-800:has-text('{target_outlet}')")
@@ -73,52 +44,27 @@ def _ensure_target_outlet_if_configured(page) -> None:
         switch_btn = row.locator("button p:has-text('Switch')")
         if switch_btn.count() > 0:
             row.locator("button").first.click()
-            page.wait_for_timeout(1500)
-            return
+            # The switched row gains the Current badge once the outlet change lands.
+            WaitFor.on(page).element(
+                row.filter(has=page.locator("button p:has-text('Current')")), required=False
+            )
+            return True
+    return False
 
 
-def _open_sales_page(page) -> None:
-    sales_menu = page.locator("aside a:has-text('Sales'), aside button:has-text('Sales')").first
-    if sales_menu.count() > 0 and sales_menu.is_visible():
-        sales_menu.click()
-    else:
-        page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
-
-    try:
-        page.wait_for_url("**/licensee/sales**", timeout=15000, wait_until="domcontentloaded")
-    except PlaywrightTimeoutError:
-        assert "/licensee/sales" in page.url, f"Unexpected sales URL: {page.url}"
-
-
-def _open_extra_sets_tab(page) -> None:
-    page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
-    page.wait_for_timeout(800)
-    for attempt in range(3):
-        _dismiss_maybe_later_if_present(page)
-        extra_sets_tabs = page.get_by_role("tab", name=re.compile(r"^Extra\s*sets$", re.I))
-        visible_tabs = [i for i in range(extra_sets_tabs.count()) if extra_sets_tabs.nth(i).is_visible()]
-
-        if not visible_tabs:
-            exact_buttons = page.locator("button").filter(has_text=re.compile(r"^Extra\s*sets$", re.I))
-            visible_tabs = [i for i in range(exact_buttons.count()) if exact_buttons.nth(i).is_visible()]
-            if visible_tabs:
-                tab = exact_buttons.nth(visible_tabs[0])
-            else:
-                tab = None
-        else:
-            tab = extra_sets_tabs.nth(visible_tabs[0])
-
-        if tab:
-            tab.click(force=True, timeout=5000)
-            page.wait_for_timeout(1200)
-            if "/licensee/sales/index" in page.url:
-                return
-            return
-        if attempt < 2:
-            page.goto(f"{BASE_URL}/licensee/sales/index", wait_until="domcontentloaded")
-            page.wait_for_timeout(1000)
-    pytest.skip("Extra Sets tab is not available for current outlet/account.")
-
+def _open_extra_sets_tab(actor) -> None:
+    page = actor.uses_ability(BrowseTheWeb).page
+    actor.attempts_to(NavigateTo.the(LicenseeRoutes.SALES))
+    tab = page.locator(EXTRA_SETS_TAB).first
+    if not WaitFor.on(page).element(tab, timeout_ms=5000, required=False):
+        pytest.skip("Extra Sets tab is not available for current outlet/account.")
+    # The sales page opens on Daily sales unless the tab is already selected.
+    if tab.get_attribute("aria-selected") != "true":
+        tab.click(force=True, timeout=5000)
+    # Tab content is ready once its rows (or an empty-state table) render.
+    WaitFor.on(page).element(
+        "table tbody tr, a[href*='/licensee/sales/show/']", timeout_ms=5000, required=False
+    )
 
 
 def _open_extra_sets_details_or_skip(page) -> bool:
@@ -158,13 +104,12 @@ def _open_extra_sets_details_or_skip(page) -> bool:
 
     return _valid_details_url(page.url)
 
-def _seed_extra_sets_sale(page) -> None:
+def _seed_extra_sets_sale(page, today: date) -> None:
     # Seed a minimal extra-sets sale record so UC20 can open details deterministically.
-    page.goto(f"{BASE_URL}/licensee/sales/extra/create", wait_until="domcontentloaded")
-    page.wait_for_timeout(800)
-    _dismiss_maybe_later_if_present(page)
+    page.goto(LicenseeRoutes.ADD_EXTRA_SETS_SALE.url(), wait_until="domcontentloaded")
+    WaitFor.on(page).element("input[type='date']")
 
-    seed_date = (date.today() - timedelta(days=60)).isoformat()
+    seed_date = (today - timedelta(days=60)).isoformat()
     page.fill("input[type='date']", seed_date)
     page.fill("#kg-sold", "12")
     page.fill("#cash", "100")
@@ -181,31 +126,37 @@ def _seed_extra_sets_sale(page) -> None:
 
 
 @pytest.mark.licensee
-def test_MCD_LCSE_20_view_extra_sets_sales_details(the_licensee):
+@pytest.mark.slow
+def test_MCD_LCSE_20_view_extra_sets_sales_details(the_licensee, licensee_account, sales_catalog):
     """
     Use Case: MCD-LCSE-20
     Verifies Licensee can open and view Extra Sets sales details.
+    Runs on an exclusively leased pool account (it may switch outlet and seed a sale).
     """
-    creds = _resolve_sales_creds()
+    creds = licensee_account.credentials
     browser = the_licensee.uses_ability(BrowseTheWeb)
     page = browser.page
-    browser.clear_session()
-    browser.go_to(f"{BASE_URL}/login")
-    browser.find_and_fill(LoginPageUI.EMAIL_FIELD, creds["email"])
-    browser.find_and_fill(LoginPageUI.PASSWORD_FIELD, creds["password"])
-    browser.find_and_click(LoginPageUI.SIGN_IN_BUTTON)
-    page.wait_for_url("**/licensee/dashboard", timeout=20000)
-
-    _dismiss_maybe_later_if_present(page)
-    _ensure_target_outlet_if_configured(page)
-    _dismiss_maybe_later_if_present(page)
-    _open_sales_page(page)
-    _open_extra_sets_tab(page)
-    opened = _open_extra_sets_details_or_skip(page)
+    the_licensee.attempts_to(Login.with_credentials(creds["email"], creds["password"]))
+
+    if _ensure_target_outlet_if_configured(page) and sales_catalog:
+        # Records of the previous outlet no longer apply.
+        sales_catalog.invalidate(creds["email"])
+    opened = False
+    # A record from the session's catalog opens by URL, without loading the Extra sets tab.
+    row = sales_catalog.records_for(creds["email"], creds["password"], "extra").first_to_open() if sales_catalog else None
+    if row is not None:
+        browser.go_to(row.details_href)
+        opened = _open_extra_sets_details_or_skip(page)
+    if not opened:
+        _open_extra_sets_tab(the_licensee)
+        opened = _open_extra_sets_details_or_skip(page)
     if not opened:
-        _seed_extra_sets_sale(page)
-        _open_sales_page(page)
-        _open_extra_sets_tab(page)
+        # Dates follow the browser clock, so `@pytest.mark.clock(...)` makes the seed date fixed.
+        _seed_extra_sets_sale(page, the_licensee.uses_ability(ControlTheClock).today())
+        if sales_catalog:
+            # The account now has a record the catalog has not seen.
+            sales_catalog.invalidate(creds["email"])
+        _open_extra_sets_tab(the_licensee)
         opened = _open_extra_sets_details_or_skip(page)
     assert opened, "Unable to open Extra Sets sales details page after deterministic seed step."
 
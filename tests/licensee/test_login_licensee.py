@@ -1,19 +1,23 @@
+import pytest
+
 from actors.licensee import Licensee
 from playwright.sync_api import Page, expect
 
+from abilities.wait_for import WaitFor
 from config.credentials import LOGIN_CREDENTIALS
 from questions.current_url import CurrentURL
 from tasks.login import Login
 from ui.login_page_ui import LoginPageUI
 
 
+@pytest.mark.fresh_login
 def test_licensee_can_log_in(the_licensee: Licensee):
     from abilities.browse_the_web import BrowseTheWeb
-    from questions.licensee_dashboard import LicenseeDashboard
+    from questions.role_dashboard import RoleDashboard
 
     credentials = LOGIN_CREDENTIALS["licensee"]
     the_licensee.attempts_to(
-        Login.with_credentials(credentials["email"], credentials["password"])
+        Login.through_the_form(credentials["email"], credentials["password"])
     )
 
     browser = the_licensee.uses_ability(BrowseTheWeb)
@@ -23,15 +27,18 @@ def test_licensee_can_log_in(the_licensee: Licensee):
         browser.page.goto(credentials["expected_dashboard_url"])
         browser.page.wait_for_url(credentials["expected_dashboard_url"], timeout=10000)
 
-    browser.page.wait_for_load_state("networkidle", timeout=10000)
-    browser.page.wait_for_timeout(10000)
+    # Dashboard heading rendered = page ready; no fixed sleep needed.
+    WaitFor.on(browser.page).element("h1, h2")
 
     assert CurrentURL.value_for(the_licensee) == credentials["expected_dashboard_url"], (
         f"Expected URL {credentials['expected_dashboard_url']}, got {CurrentURL.value_for(the_licensee)}"
     )
 
-    welcome_text = LicenseeDashboard.welcome_header_text(the_licensee)
-    assert welcome_text, "Welcome message not found on the dashboard!"
+    dashboard = RoleDashboard.for_role("licensee")
+    welcome_text = the_licensee.asks_for(dashboard)
+    assert welcome_text, (
+        f"Welcome message not found on the dashboard! Headings: {dashboard.headings(the_licensee)}"
+    )
     assert "Welcome Back" in welcome_text, (
         f"Welcome message does not contain 'Welcome Back'. Found: '{welcome_text}'"
     )
@@ -40,6 +47,7 @@ def test_licensee_can_log_in(the_licensee: Licensee):
     )
 
 
+@pytest.mark.fresh_login
 def test_licensee_cannot_log_in_with_invalid_credentials(
     the_licensee: Licensee, page: Page
 ):
@@ -0,0 +1,21 @@
+import os
+
+from support.sales_catalog import SALES_KINDS, SalesCatalog
+
+
+def _failing_crawl(email, password):
+    raise RuntimeError("listing did not load")
+
+
+def test_forget_after_failed_crawl_keeps_the_empty_catalog_unsaved(tmp_path):
+    """
+    A crawl that fails leaves an empty, unsaved catalog; forgetting a record from it writes nothing.
+    """
+    catalog = SalesCatalog(browser=None, catalog_dir=str(tmp_path), ttl_seconds=60)
+    catalog._crawl = _failing_crawl
+
+    for kind in SALES_KINDS:
+        assert catalog.records_for("licensee@example.com", "secret", kind).first_to_open() is None
+    catalog.forget("licensee@example.com", "/licensee/sales/details/1")
+
+    assert os.listdir(tmp_path) == []
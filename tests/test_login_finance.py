@@ -1,30 +1,37 @@
+import pytest
+
 from actors.finance import Finance
 
+from abilities.wait_for import WaitFor
 from config.credentials import LOGIN_CREDENTIALS
 from questions.current_url import CurrentURL
 from tasks.login import Login
 
 
+@pytest.mark.fresh_login
 def test_finance_can_log_in(the_finance: Finance):
     from abilities.browse_the_web import BrowseTheWeb
-    from questions.finance_dashboard import FinanceDashboard
+    from questions.role_dashboard import RoleDashboard
 
     credentials = LOGIN_CREDENTIALS["finance"]
     the_finance.attempts_to(
-        Login.with_credentials(credentials["email"], credentials["password"])
+        Login.through_the_form(credentials["email"], credentials["password"])
     )
 
     browser = the_finance.uses_ability(BrowseTheWeb)
     browser.page.wait_for_url(credentials["expected_dashboard_url"], timeout=10000)
-    browser.page.wait_for_load_state("networkidle", timeout=10000)
-    browser.page.wait_for_timeout(10000)
+    # Dashboard heading rendered = page ready; no fixed sleep needed.
+    WaitFor.on(browser.page).element("h1, h2")
 
     assert CurrentURL.value_for(the_finance) == credentials["expected_dashboard_url"], (
         f"Expected URL {credentials['expected_dashboard_url']}, got {CurrentURL.value_for(the_finance)}"
     )
 
-    welcome_text = FinanceDashboard.welcome_header_text(the_finance)
-    assert welcome_text, "Welcome message not found on the dashboard!"
+    dashboard = RoleDashboard.for_role("finance")
+    welcome_text = the_finance.asks_for(dashboard)
+    assert welcome_text, (
+        f"Welcome message not found on the dashboard! Headings: {dashboard.headings(the_finance)}"
+    )
     welcome_lower = welcome_text.lower()
     assert "welcome" in welcome_lower or "dashboard" in welcome_lower, (
         f"Welcome message does not contain 'Welcome' or 'Dashboard'. Found: '{welcome_text}'"
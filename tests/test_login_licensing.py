@@ -1,30 +1,37 @@
+import pytest
+
 from actors.licensing import Licensing
 
+from abilities.wait_for import WaitFor
 from config.credentials import LOGIN_CREDENTIALS
 from questions.current_url import CurrentURL
 from tasks.login import Login
 
 
+@pytest.mark.fresh_login
 def test_licensing_can_log_in(the_licensing: Licensing):
     from abilities.browse_the_web import BrowseTheWeb
-    from questions.licensing_dashboard import LicensingDashboard
+    from questions.role_dashboard import RoleDashboard
 
     credentials = LOGIN_CREDENTIALS["licensing"]
     the_licensing.attempts_to(
-        Login.with_credentials(credentials["email"], credentials["password"])
+        Login.through_the_form(credentials["email"], credentials["password"])
     )
 
     browser = the_licensing.uses_ability(BrowseTheWeb)
     browser.page.wait_for_url(credentials["expected_dashboard_url"], timeout=10000)
-    browser.page.wait_for_load_state("networkidle", timeout=10000)
-    browser.page.wait_for_timeout(10000)
+    # Dashboard heading rendered = page ready; no fixed sleep needed.
+    WaitFor.on(browser.page).element("h1, h2")
 
     assert CurrentURL.value_for(the_licensing) == credentials["expected_dashboard_url"], (
         f"Expected URL {credentials['expected_dashboard_url']}, got {CurrentURL.value_for(the_licensing)}"
     )
 
-    welcome_text = LicensingDashboard.welcome_header_text(the_licensing)
-    assert welcome_text, "Welcome message not found on the dashboard!"
+    dashboard = RoleDashboard.for_role("licensing")
+    welcome_text = the_licensing.asks_for(dashboard)
+    assert welcome_text, (
+        f"Welcome message not found on the dashboard! Headings: {dashboard.headings(the_licensing)}"
+    )
     welcome_lower = welcome_text.lower()
     assert "welcome" in welcome_lower or "dashboard" in welcome_lower, (
         f"Welcome message does not contain 'Welcome' or 'Dashboard'. Found: '{welcome_text}'"
@@ -1,30 +1,37 @@
+import pytest
+
 from actors.procurement import Procurement
 
+from abilities.wait_for import WaitFor
 from config.credentials import LOGIN_CREDENTIALS
 from questions.current_url import CurrentURL
 from tasks.login import Login
 
 
+@pytest.mark.fresh_login
 def test_procurement_can_log_in(the_procurement: Procurement):
     from abilities.browse_the_web import BrowseTheWeb
-    from questions.procurement_dashboard import ProcurementDashboard
+    from questions.role_dashboard import RoleDashboard
 
     credentials = LOGIN_CREDENTIALS["procurement"]
     the_procurement.attempts_to(
-        Login.with_credentials(credentials["email"], credentials["password"])
+        Login.through_the_form(credentials["email"], credentials["password"])
     )
 
     browser = the_procurement.uses_ability(BrowseTheWeb)
     browser.page.wait_for_url(credentials["expected_dashboard_url"], timeout=10000)
-    browser.page.wait_for_load_state("networkidle", timeout=10000)
-    browser.page.wait_for_timeout(10000)
+    # Dashboard heading rendered = page ready; no fixed sleep needed.
+    WaitFor.on(browser.page).element("h1, h2")
 
     assert CurrentURL.value_for(the_procurement) == credentials["expected_dashboard_url"], (
         f"Expected URL {credentials['expected_dashboard_url']}, got {CurrentURL.value_for(the_procurement)}"
     )
 
-    welcome_text = ProcurementDashboard.welcome_header_text(the_procurement)
-    assert welcome_text, "Welcome message not found on the dashboard!"
+    dashboard = RoleDashboard.for_role("procurement")
+    welcome_text = the_procurement.asks_for(dashboard)
+    assert welcome_text, (
+        f"Welcome message not found on the dashboard! Headings: {dashboard.headings(the_procurement)}"
+    )
     welcome_lower = welcome_text.lower()
     assert "welcome" in welcome_lower or "dashboard" in welcome_lower, (
         f"Welcome message does not contain 'Welcome' or 'Dashboard'. Found: '{welcome_text}'"
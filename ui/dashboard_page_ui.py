@@ -18,3 +18,7 @@ class DashboardPageUI:
 
     # Sidebar shortcut path (bottom icon-only logout button)
     SIDEBAR_LOGOUT_ICON = "aside div.border-t button[type='button']"
+
+    # "Grab credentials" modal shown intermittently after login; dismissed automatically
+    # by the `page` fixture (see `support/overlays.py`).
+    MAYBE_LATER_BUTTON = "button:has-text('Maybe Later'), button:has-text('Maybe later')"
@@ -17,6 +17,8 @@ class LoginPageUI:
     SIGN_IN_BUTTON = "button:has-text('Sign in'), button:has-text('Login')"
     # Error message selector (supports multiple variants)
     ERROR_MESSAGE = "text=/These credentials do not match our records"
+    # Any inline form error (wrong credentials, validation), shown when a login is rejected.
+    FORM_ERROR = "p.text-error-500"
 
 
 # --- How to create a new UI Page Locator file ---
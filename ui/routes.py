@@ -0,0 +1,86 @@
+"""
+This module defines the route map: every page tests navigate to, by logical name, with its URL.
+Tabs that the app selects from the query string (e.g. `?tab=redeemable`) are routes of their own,
+so the NavigateTo task (`tasks/navigate_to.py`) can open any of them with a single `goto`.
+"""
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from config.credentials import BASE_URL
+
+
+class PageRoute:
+    """
+    A page's path plus the query parameters that select it (a tab), e.g.
+    `PageRoute("licensee.order.redeemable", "/licensee/order/index", tab="redeemable")`.
+    """
+
+    def __init__(self, name: str, path: str, **query: str):
+        self.name = name
+        self.path = path
+        self.query = query
+
+    def url(self, base_url: Optional[str] = None) -> str:
+        query = f"?{urlencode(self.query)}" if self.query else ""
+        return f"{(BASE_URL if base_url is None else base_url).rstrip('/')}{self.path}{query}"
+
+    def pattern(self) -> str:
+        """
+        Glob for `wait_for_url` / `WaitFor.url`, e.g. "**/licensee/order/index?tab=redeemable".
+        """
+        return f"**{self.url('')}"
+
+    def matches(self, url: str) -> bool:
+        """
+        True when `url` shows this page: same path, and the route's query parameters
+        are present (other parameters, such as filters, are ignored).
+        """
+        parts = urlsplit(url)
+        if parts.path.rstrip("/") != self.path.rstrip("/"):
+            return False
+        params = parse_qs(parts.query)
+        return all(params.get(key) == [value] for key, value in self.query.items())
+
+    def __repr__(self) -> str:
+        return f"PageRoute({self.name!r}, {self.url('')!r})"
+
+
+class LicenseeRoutes:
+    """
+    Licensee pages.
+    """
+
+    DASHBOARD = PageRoute("licensee.dashboard", "/licensee/dashboard")
+    # Sales dashboard. Its Extra sets tab has no URL of its own: open this page and click
+    # `EXTRA_SETS_TAB` (`questions/licensee/sales_listing.py`).
+    SALES = PageRoute("licensee.sales", "/licensee/sales/index")
+    ADD_SALE = PageRoute("licensee.sales.add", "/licensee/sales/create")
+    ADD_EXTRA_SETS_SALE = PageRoute("licensee.sales.add_extra_sets", "/licensee/sales/extra/create")
+    ORDER_STOCK = PageRoute("licensee.order", "/licensee/order/index")
+    # Target of the dashboard's "Redeem" shortcut.
+    ORDER_REDEEMABLE = PageRoute("licensee.order.redeemable", "/licensee/order/index", tab="redeemable")
+    TRADE_IN = PageRoute("licensee.trade_in", "/licensee/trade-in")
+    STAFF_DIRECTORY = PageRoute("licensee.staff", "/licensee/staff/index")
+    ANNOUNCEMENTS = PageRoute("licensee.announcements", "/licensee/announcement/index")
+    APPLICATION_FORMS = PageRoute("licensee.application_forms", "/licensee/application-form/index")
+    EVENT_APPLICATIONS = PageRoute("licensee.application_forms.event", "/licensee/application-form/event/index")
+    PROFILE = PageRoute("licensee.profile", "/licensee/profile")
+
+
+# Logical name -> route, for lookups by name (e.g. `NavigateTo.page("licensee.sales")`).
+ROUTES: Dict[str, PageRoute] = {
+    value.name: value for value in vars(LicenseeRoutes).values() if isinstance(value, PageRoute)
+}
+
+
+def route_named(name: str) -> PageRoute:
+    try:
+        return ROUTES[name]
+    except KeyError:
+        raise KeyError(f"Unknown page {name!r}; known pages: {', '.join(sorted(ROUTES))}.") from None
+
+
+# --- How to add a route ---
+# 1. Add a `PageRoute("<role>.<page>", "/path", tab="...")` constant to the role's class above
+#    (add a new `<Role>Routes` class for another role, and include it in ROUTES).
+# 2. Navigate with `actor.attempts_to(NavigateTo.the(LicenseeRoutes.MY_PAGE))`.